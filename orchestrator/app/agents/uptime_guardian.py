@@ -142,19 +142,26 @@ class UptimeGuardian:
             frontend_result = self._ping_endpoint(self.frontend_url, 'Frontend')
             checks.append(frontend_result)
         
-        # Calculate overall status
-        all_online = all(check['online'] for check in checks if check['status'] != 'skipped')
-        any_offline = any(not check['online'] and check['status'] != 'skipped' for check in checks)
+        # Calculate overall status in a single pass
+        online_count = offline_count = skipped_count = 0
+        for check in checks:
+            skipped = check['status'] == 'skipped'
+            if skipped:
+                skipped_count += 1
+            if check['online']:
+                online_count += 1
+            elif not skipped:
+                offline_count += 1
         
         return {
             'timestamp': datetime.now(timezone.utc).isoformat(),
-            'all_online': all_online,
-            'any_offline': any_offline,
+            'all_online': offline_count == 0,
+            'any_offline': offline_count > 0,
             'checks': checks,
             'total_checks': len(checks),
-            'online_count': sum(1 for c in checks if c['online']),
-            'offline_count': sum(1 for c in checks if not c['online'] and c['status'] != 'skipped'),
-            'skipped_count': sum(1 for c in checks if c['status'] == 'skipped')
+            'online_count': online_count,
+            'offline_count': offline_count,
+            'skipped_count': skipped_count
         }
     
     def format_uptime_message(self, check_result: Dict[str, Any]) -> str:
@@ -28,6 +28,22 @@ class BaseCommand:
         """Command description."""
         raise NotImplementedError
     
+    @staticmethod
+    def get_options(interaction: Dict) -> Dict:
+        """
+        Map slash command option names to their values.
+        
+        Args:
+            interaction: Discord interaction payload
+            
+        Returns:
+            Dictionary of option name -> value (empty if no options)
+        """
+        return {
+            option.get('name'): option.get('value')
+            for option in (interaction.get('data') or {}).get('options') or []
+        }
+    
     async def execute(self, interaction: Dict) -> Dict:
         """
         Execute the command.
@@ -4,13 +4,35 @@ Orchestrates deployment with verification, promote, and rollback actions.
 """
 import os
 import json
+import time
+import secrets
+import traceback
+from datetime import datetime, timezone
 from typing import Dict
 from commands import BaseCommand
-from services.state_store import get_state_store
+from services.state_store import get_state_store, StateStoreError
 from services.github_actions_dispatcher import GitHubActionsDispatcher
 from services.github import GitHubService
 from verification.http_checker import HTTPChecker
-from utils.time_formatter import TimeFormatter
+from utils.interaction import interaction_user
+from utils.logger import StructuredLogger
+
+
+# Deploy state lives in the shared state store (Redis when REDIS_URL is set)
+# so promote/rollback buttons work regardless of which replica handles them.
+STATE_KEY_PREFIX = 'ship:'
+DEPLOY_STATE_TTL = 3600  # 1 hour
+
+# Button action -> status it moves an 'initiated' deploy to. A deploy is
+# promoted or rolled back once; the status check-and-set enforces that.
+TRANSITIONS = {'promote': 'promoted', 'rollback': 'rolled_back'}
+
+_logger = StructuredLogger(service='ship')
+
+
+def _state_key(deploy_id: str) -> str:
+    """Namespace a deploy ID for the state store."""
+    return f'{STATE_KEY_PREFIX}{deploy_id}'
 
 
 class ShipCommand(BaseCommand):
@@ -18,6 +40,49 @@ class ShipCommand(BaseCommand):
     Release Conductor MVP - Orchestrate deploy with verification.
     """
     
+    # Static embed parts shared by every response; per-request values are
+    # merged in with a shallow copy. Treat these as read-only.
+    _INITIATED_EMBED_BASE = {
+        'title': '🚀 Deployment Initiated',
+        'color': 0x3498db,  # Blue
+        'footer': {
+            'text': 'Verification checks will run after deployment completes'
+        }
+    }
+    _INITIATED_STATUS_FIELD = {
+        'name': 'Status',
+        'value': '⏳ Running deployment workflow...',
+        'inline': False
+    }
+    _PROMOTE_EMBED_BASE = {
+        'title': '✅ Deployment Promoted',
+        'color': 0x2ecc71,  # Green
+        'fields': (
+            {
+                'name': 'Status',
+                'value': '🎉 Full rollout in progress',
+                'inline': False
+            },
+        )
+    }
+    _ROLLBACK_EMBED_BASE = {
+        'title': '⏪ Deployment Rolled Back',
+        'color': 0xe74c3c,  # Red
+        'fields': (
+            {
+                'name': 'Status',
+                'value': '🔙 Reverting to previous version',
+                'inline': False
+            },
+        )
+    }
+    
+    def __init__(self):
+        """Initialize command with lazily-created, reused service clients."""
+        super().__init__()
+        self._dispatcher = None
+        self._http_checker = None
+    
     @property
     def name(self) -> str:
         return 'ship'
@@ -26,6 +91,18 @@ class ShipCommand(BaseCommand):
     def description(self) -> str:
         return 'Deploy with verification and promote/rollback options'
     
+    def _get_dispatcher(self) -> GitHubActionsDispatcher:
+        """Get the shared workflow dispatcher, creating it on first use."""
+        if self._dispatcher is None:
+            self._dispatcher = GitHubActionsDispatcher(GitHubService())
+        return self._dispatcher
+    
+    def _get_http_checker(self) -> HTTPChecker:
+        """Get the shared HTTP checker, creating it on first use."""
+        if self._http_checker is None:
+            self._http_checker = HTTPChecker()
+        return self._http_checker
+    
     async def execute(self, interaction: dict) -> dict:
         """
         Execute ship command - initiate deployment.
@@ -38,15 +115,9 @@ class ShipCommand(BaseCommand):
         """
         try:
             # Extract options
-            options = interaction.get('data', {}).get('options', [])
-            env = 'staging'
-            strategy = 'full'
-            
-            for option in options:
-                if option.get('name') == 'env':
-                    env = option.get('value', 'staging')
-                elif option.get('name') == 'strategy':
-                    strategy = option.get('value', 'full')
+            options = self.get_options(interaction)
+            env = options.get('env') or 'staging'
+            strategy = options.get('strategy') or 'full'
             
             # Validate environment
             if env not in ['staging', 'prod']:
@@ -68,25 +139,20 @@ class ShipCommand(BaseCommand):
                     }
                 }
             
-            # Generate deploy ID
-            import time
-            deploy_id = f"ship-{env}-{int(time.time())}"
+            # Generate deploy ID (random suffix keeps same-second ships distinct)
+            deploy_id = f"ship-{env}-{int(time.time())}-{secrets.token_hex(3)}"
             
-            # Store deployment info in state
-            state_store = get_state_store()
             deploy_info = {
                 'deploy_id': deploy_id,
                 'env': env,
                 'strategy': strategy,
                 'status': 'initiated',
-                'initiated_by': interaction.get('member', {}).get('user', {}).get('id'),
+                'initiated_by': interaction_user(interaction)[0],
                 'initiated_at': time.time()
             }
-            state_store.put(deploy_id, deploy_info, ttl=3600)  # 1 hour TTL
             
             # Trigger deployment workflow
-            github_service = GitHubService()
-            dispatcher = GitHubActionsDispatcher(github_service)
+            dispatcher = self._get_dispatcher()
             
             workflow_name = 'Client Deploy' if env == 'staging' else 'Backend Deploy'
             
@@ -99,7 +165,6 @@ class ShipCommand(BaseCommand):
                 
                 deploy_info['workflow_run_id'] = run_result.get('id')
                 deploy_info['workflow_run_url'] = run_result.get('html_url')
-                state_store.put(deploy_id, deploy_info, ttl=3600)
                 
             except Exception as e:
                 return {
@@ -110,10 +175,13 @@ class ShipCommand(BaseCommand):
                     }
                 }
             
+            # Store deployment info in state once the dispatch has succeeded
+            state_store = get_state_store()
+            state_store.put(_state_key(deploy_id), deploy_info, ttl=DEPLOY_STATE_TTL)
+            
             # Return immediate acknowledgment
             embed = {
-                'title': '🚀 Deployment Initiated',
-                'color': 0x3498db,  # Blue
+                **self._INITIATED_EMBED_BASE,
                 'fields': [
                     {
                         'name': 'Environment',
@@ -130,15 +198,8 @@ class ShipCommand(BaseCommand):
                         'value': deploy_id,
                         'inline': False
                     },
-                    {
-                        'name': 'Status',
-                        'value': '⏳ Running deployment workflow...',
-                        'inline': False
-                    }
-                ],
-                'footer': {
-                    'text': 'Verification checks will run after deployment completes'
-                }
+                    self._INITIATED_STATUS_FIELD
+                ]
             }
             
             if deploy_info.get('workflow_run_url'):
@@ -156,9 +217,8 @@ class ShipCommand(BaseCommand):
             }
             
         except Exception as e:
-            print(f'Error in ship command: {str(e)}')
-            import traceback
-            traceback.print_exc()
+            _logger.error(f'Error in ship command: {e}', fn='ShipCommand.execute', error=str(e),
+                          traceback=traceback.format_exc())
             
             return {
                 'type': 4,
@@ -181,44 +241,69 @@ class ShipCommand(BaseCommand):
         """
         try:
             # Parse custom_id
-            parts = custom_id.split('_')
-            if len(parts) < 3:
+            try:
+                # ship_<action>_<deploy_id>; deploy_id may itself contain '_'
+                _, action, deploy_id = custom_id.split('_', 2)
+            except ValueError:
                 return self._error_response('Invalid button action')
             
-            action = parts[1]  # promote, rollback, details
-            deploy_id = '_'.join(parts[2:])  # Reconstruct deploy ID
+            if action in TRANSITIONS:
+                return self._handle_transition(deploy_id, action, interaction)
             
             # Get deployment info from state
-            state_store = get_state_store()
-            deploy_info = state_store.get(deploy_id)
+            deploy_info = get_state_store().get(_state_key(deploy_id))
             
             if not deploy_info:
                 return self._error_response('Deployment info not found or expired')
             
-            if action == 'promote':
-                return self._handle_promote(deploy_info, interaction)
-            elif action == 'rollback':
-                return self._handle_rollback(deploy_info, interaction)
-            elif action == 'details':
+            if action == 'details':
                 return self._handle_details(deploy_info, interaction)
             else:
                 return self._error_response(f'Unknown action: {action}')
                 
         except Exception as e:
-            print(f'Error handling ship component: {str(e)}')
+            _logger.error(f'Error handling ship component: {e}', fn='ShipCommand.handle_component',
+                          error=str(e), traceback=traceback.format_exc())
             return self._error_response(str(e))
     
-    def _handle_promote(self, deploy_info: dict, interaction: dict) -> dict:
-        """Handle promote action."""
-        deploy_id = deploy_info['deploy_id']
-        env = deploy_info['env']
+    def _handle_transition(self, deploy_id: str, action: str, interaction: dict) -> dict:
+        """
+        Promote or roll back a deploy that is still awaiting a decision.
         
-        # Update state
+        The status moves from 'initiated' in a single check-and-set, so
+        repeated clicks, clicks on another replica, or a promote racing a
+        rollback can only take effect once. Nothing is written if it fails.
+        """
+        status = TRANSITIONS[action]
         state_store = get_state_store()
-        deploy_info['status'] = 'promoted'
-        deploy_info['promoted_at'] = __import__('time').time()
-        deploy_info['promoted_by'] = interaction.get('member', {}).get('user', {}).get('id')
-        state_store.put(deploy_id, deploy_info, ttl=3600)
+        
+        try:
+            deploy_info = state_store.update(_state_key(deploy_id), {
+                'status': status,
+                f'{status}_at': time.time(),
+                f'{status}_by': interaction_user(interaction)[0]
+            }, ttl=DEPLOY_STATE_TTL, expected={'status': 'initiated'})
+        except StateStoreError as e:
+            _logger.error(f'Error updating deploy state: {e}', fn='ShipCommand._handle_transition',
+                          deploy_id=deploy_id, action=action, error=str(e))
+            return self._error_response(f'Could not {action} deployment, please try again')
+        
+        if deploy_info is None:
+            # Lost the check-and-set; read the backend to say why
+            current = state_store.get(_state_key(deploy_id), fresh=True)
+            if not current:
+                return self._error_response('Deployment info not found or expired')
+            current_status = str(current.get('status', 'updated')).replace('_', ' ')
+            return self._error_response(f'Deployment already {current_status}')
+        
+        if action == 'promote':
+            return self._handle_promote(deploy_info)
+        return self._handle_rollback(deploy_info)
+    
+    def _handle_promote(self, deploy_info: dict) -> dict:
+        """Render the promoted deploy."""
+        deploy_id = deploy_info['deploy_id']
+        env = deploy_info['env']
         
         # In a real implementation, this would trigger full rollout
         # For now, we just update the message
@@ -227,33 +312,19 @@ class ShipCommand(BaseCommand):
             'type': 7,  # Update message
             'data': {
                 'embeds': [{
-                    'title': '✅ Deployment Promoted',
-                    'color': 0x2ecc71,  # Green
+                    **self._PROMOTE_EMBED_BASE,
                     'description': f'Deployment `{deploy_id}` has been promoted to {env}.',
-                    'fields': [
-                        {
-                            'name': 'Status',
-                            'value': '🎉 Full rollout in progress',
-                            'inline': False
-                        }
-                    ],
-                    'timestamp': __import__('datetime').datetime.utcnow().isoformat()
+                    'timestamp': datetime.fromtimestamp(
+                        deploy_info['promoted_at'], tz=timezone.utc
+                    ).isoformat()
                 }],
                 'components': []  # Remove buttons
             }
         }
     
-    def _handle_rollback(self, deploy_info: dict, interaction: dict) -> dict:
-        """Handle rollback action."""
+    def _handle_rollback(self, deploy_info: dict) -> dict:
+        """Render the rolled-back deploy."""
         deploy_id = deploy_info['deploy_id']
-        env = deploy_info['env']
-        
-        # Update state
-        state_store = get_state_store()
-        deploy_info['status'] = 'rolled_back'
-        deploy_info['rolled_back_at'] = __import__('time').time()
-        deploy_info['rolled_back_by'] = interaction.get('member', {}).get('user', {}).get('id')
-        state_store.put(deploy_id, deploy_info, ttl=3600)
         
         # In a real implementation, this would trigger rollback to previous version
         
@@ -261,17 +332,11 @@ class ShipCommand(BaseCommand):
             'type': 7,  # Update message
             'data': {
                 'embeds': [{
-                    'title': '⏪ Deployment Rolled Back',
-                    'color': 0xe74c3c,  # Red
+                    **self._ROLLBACK_EMBED_BASE,
                     'description': f'Deployment `{deploy_id}` has been rolled back.',
-                    'fields': [
-                        {
-                            'name': 'Status',
-                            'value': '🔙 Reverting to previous version',
-                            'inline': False
-                        }
-                    ],
-                    'timestamp': __import__('datetime').datetime.utcnow().isoformat()
+                    'timestamp': datetime.fromtimestamp(
+                        deploy_info['rolled_back_at'], tz=timezone.utc
+                    ).isoformat()
                 }],
                 'components': []  # Remove buttons
             }
@@ -279,8 +344,8 @@ class ShipCommand(BaseCommand):
     
     def _handle_details(self, deploy_info: dict, interaction: dict) -> dict:
         """Handle details action."""
-        # Run verification checks
-        http_checker = HTTPChecker()
+        # Run verification checks (HEAD: only status and latency are shown)
+        http_checker = self._get_http_checker()
         frontend_url = os.environ.get('FRONTEND_BASE_URL', '')
         api_url = os.environ.get('VITE_API_BASE', '')
         
@@ -288,7 +353,7 @@ class ShipCommand(BaseCommand):
         
         # Check frontend
         if frontend_url:
-            result = http_checker.check_endpoint(frontend_url, '/')
+            result = http_checker.check_endpoint(frontend_url, '/', method='HEAD')
             checks.append({
                 'name': '🌐 Frontend',
                 'value': f"Status: {result.get('status_code', 'Error')}\nLatency: {result.get('response_time_ms', 'N/A')}ms",
@@ -297,7 +362,7 @@ class ShipCommand(BaseCommand):
         
         # Check API
         if api_url:
-            result = http_checker.check_endpoint(api_url, '/health')
+            result = http_checker.check_endpoint(api_url, '/health', method='HEAD')
             checks.append({
                 'name': '⚙️ API',
                 'value': f"Status: {result.get('status_code', 'Error')}\nLatency: {result.get('response_time_ms', 'N/A')}ms",
@@ -312,7 +377,7 @@ class ShipCommand(BaseCommand):
                     'color': 0x3498db,  # Blue
                     'description': f"Deploy ID: `{deploy_info['deploy_id']}`",
                     'fields': checks,
-                    'timestamp': __import__('datetime').datetime.utcnow().isoformat()
+                    'timestamp': datetime.now(timezone.utc).isoformat()
                 }],
                 'flags': 64  # Ephemeral
             }
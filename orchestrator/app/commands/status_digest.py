@@ -1,8 +1,13 @@
 """
 Status Digest Command - Shows system health snapshot.
 """
+import traceback
 from commands import BaseCommand
 from services.health_snapshot import HealthSnapshot
+from utils.logger import StructuredLogger
+
+
+_logger = StructuredLogger(service='status_digest')
 
 
 class StatusDigestCommand(BaseCommand):
@@ -46,9 +51,8 @@ class StatusDigestCommand(BaseCommand):
             }
         
         except Exception as e:
-            print(f'Error in status-digest command: {str(e)}')
-            import traceback
-            traceback.print_exc()
+            _logger.error(f'Error in status-digest command: {e}', fn='StatusDigestCommand.execute', error=str(e),
+                          traceback=traceback.format_exc())
             
             return {
                 'type': 4,
@@ -2,16 +2,19 @@
 Configuration for deploy verification.
 Defines workflow patterns, timeouts, and step matching rules.
 """
+import re
+from dataclasses import dataclass
+from typing import Pattern, Tuple
 
 # GitHub Actions workflow configuration
 WORKFLOW_NAME = "Client Deploy"
 TARGET_BRANCH = "main"
 
-# Step name patterns (regex patterns for matching)
+# Step name patterns (pre-compiled regexes, case-insensitive)
 STEP_PATTERNS = {
-    'build': r'(?i)(build|vite build|npm run build|yarn build)',
-    's3_sync': r'(?i)(s3 sync|aws s3 sync|upload|sync to s3)',
-    'cloudfront_invalidation': r'(?i)(cloudfront.*invalidat|invalidat.*cloudfront)'
+    'build': re.compile(r'(build|vite build|npm run build|yarn build)', re.IGNORECASE),
+    's3_sync': re.compile(r'(s3 sync|aws s3 sync|upload|sync to s3)', re.IGNORECASE),
+    'cloudfront_invalidation': re.compile(r'(cloudfront.*invalidat|invalidat.*cloudfront)', re.IGNORECASE)
 }
 
 # HTTP check configuration
@@ -31,4 +34,43 @@ COLOR_FAILURE = 0xFF0000  # Red
 COLOR_WARNING = 0xFFAA00  # Orange
 
 # Cache-Control validation
-EXPECTED_CACHE_CONTROL_PATTERN = r'(?i)no-cache'
+EXPECTED_CACHE_CONTROL_PATTERN = re.compile(r'no-cache', re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True)
+class VerificationConfig:
+    """Immutable verification settings, built once per process."""
+    workflow_name: str
+    target_branch: str
+    step_patterns: Tuple[Tuple[str, Pattern], ...]
+    http_timeout: float
+    http_max_retries: int
+    http_retry_delay: float
+    frontend_endpoints: Tuple[str, ...]
+    api_endpoints: Tuple[str, ...]
+    color_success: int
+    color_failure: int
+    color_warning: int
+    cache_control_pattern: Pattern
+
+    @classmethod
+    def from_defaults(cls):
+        """Build config from the module-level settings above."""
+        return cls(
+            workflow_name=WORKFLOW_NAME,
+            target_branch=TARGET_BRANCH,
+            step_patterns=tuple(STEP_PATTERNS.items()),
+            http_timeout=HTTP_TIMEOUT_SECONDS,
+            http_max_retries=HTTP_MAX_RETRIES,
+            http_retry_delay=HTTP_RETRY_DELAY_SECONDS,
+            frontend_endpoints=tuple(FRONTEND_ENDPOINTS),
+            api_endpoints=tuple(API_ENDPOINTS),
+            color_success=COLOR_SUCCESS,
+            color_failure=COLOR_FAILURE,
+            color_warning=COLOR_WARNING,
+            cache_control_pattern=EXPECTED_CACHE_CONTROL_PATTERN
+        )
+
+
+# Process-wide config built from the settings above; readers use this snapshot
+CONFIG = VerificationConfig.from_defaults()
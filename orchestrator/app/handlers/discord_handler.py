@@ -10,55 +10,220 @@ Handles /plan, /approve, /status, /ship, /verify-latest, /verify-run, /diagnose,
 /deploy-client, /set-frontend, /set-api-base, /agents, /status-digest, /triage,
 /update-summary, /uptime-check commands.
 """
+import base64
 import json
 import os
-import sys
 import time
+import threading
+import traceback
+import uuid
 import requests
-from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 from nacl.signing import VerifyKey
 from nacl.exceptions import BadSignatureError
-from verification.verifier import DeployVerifier
 from services.github import GitHubService
 from services.github_actions_dispatcher import GitHubActionsDispatcher
 from services.discord import DiscordService
 from services.audit_store import AuditStore
-from services.health_snapshot import HealthSnapshot
 from utils.url_validator import URLValidator
 from utils.admin_auth import AdminAuthenticator
+from utils.interaction import interaction_user
 from utils.time_formatter import TimeFormatter
 from utils.trace_store import get_trace_store
 from utils.logger import redact_secrets, StructuredLogger
 from utils.rbac import get_permission_matrix
 from utils.agent_messenger import (
-    get_agent_messenger, 
     AMADEUS, 
-    BUILD_AGENT, 
     STATUS_AGENT, 
     VERIFY_AGENT,
     DIAGNOSE_AGENT,
     TRIAGE_AGENT
 )
-from agents.registry import get_agents
-from agents.uptime_guardian import UptimeGuardian
+
+# Try to import orjson for faster JSON encoding/decoding, fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
 # Note: Phase5TriageAgent is only used for local testing
 # The Discord bot triggers the triage workflow via GitHub Actions instead
 # sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
 # from phase5_triage_agent import Phase5TriageAgent, TriageConfig
 
+# Workflows listed by /status, in display order
+STATUS_WORKFLOWS = ('Client Deploy', 'Diagnose on Demand')
+
+# /status only shows runs created within this window
+STATUS_LOOKBACK_DAYS = 30
+
+# Budget for building a type 4 response inline; Discord drops interactions
+# that are not acknowledged within 3 seconds, and a slow build still has to
+# hand off to a deferred task (an async Lambda invoke) before the type 5 ACK
+FAST_ACK_TIMEOUT_SECONDS = 1.5
+
+# Backoff (seconds) while waiting for a dispatched Client Deploy run to show up
+DEPLOY_RUN_LOOKUP_DELAYS = (0.3, 0.5, 0.8, 1.4)
+
+# Client Deploy monitoring budget when there is no Lambda context (in-process
+# threads); in Lambda it is whatever the invocation has left minus the margin
+# needed to post the final follow-up (5s request timeout, two retries)
+DEPLOY_POLL_TIMEOUT_SECONDS = 180
+DEFERRED_FOLLOWUP_MARGIN_SECONDS = 20
+
+# Interaction payloads are small; anything far larger is rejected before
+# spending an Ed25519 verification on it
+MAX_SIGNED_BODY_BYTES = 65536
+
+# Signed requests older (or further in the future) than this are treated as
+# replays and rejected without verifying the signature
+MAX_SIGNATURE_AGE_SECONDS = 300
+
+# Replies to recently handled interactions, replayed if Discord delivers the
+# same interaction id again so commands with side effects run only once
+INTERACTION_REPLAY_TTL_SECONDS = 900
+INTERACTION_REPLAY_MAX_ENTRIES = 1024
+_interaction_replies = OrderedDict()
+
+# In-process deferred workers (non-Lambda runs) share a few slots so bursts
+# don't fan out into unbounded concurrent GitHub calls; Lambda runs each
+# deferred task in its own invocation
+MAX_CONCURRENT_DEFERRED_TASKS = int(os.environ.get('MAX_CONCURRENT_INTERACTIONS', '4'))
+DEFERRED_SLOT_WAIT_SECONDS = 10.0
+_deferred_slots = threading.BoundedSemaphore(MAX_CONCURRENT_DEFERRED_TASKS)
+
+# Lambda environment is fixed for the container's lifetime; read it once
+_GITHUB_REPO = os.environ.get('GITHUB_REPOSITORY', 'gcolon75/Project-Valine')
+_GITHUB_TOKEN = os.environ.get('GITHUB_TOKEN')
+_ENABLE_DEBUG_CMD = os.environ.get('ENABLE_DEBUG_CMD', 'false').lower() == 'true'
+_LAMBDA_FUNCTION_NAME = os.environ.get('AWS_LAMBDA_FUNCTION_NAME')
+
+
+_logger = StructuredLogger(service='discord_handler')
+
+
+def _log_exc(handler_name, exc):
+    """Log a handler exception and its traceback as one structured entry."""
+    _logger.error(
+        f'Error in {handler_name}: {exc}',
+        fn=handler_name,
+        error=str(exc),
+        traceback=traceback.format_exc()
+    )
+
+
+# Service clients reused across warm invocations, keyed by class and args
+_services = {}
+
+
+def _get_service(cls, *args):
+    """Return a shared instance of a service class, creating it on first use."""
+    key = (cls,) + args
+    service = _services.get(key)
+    if service is None:
+        service = _services[key] = cls(*args)
+    return service
+
+
+def _get_github_service():
+    """Return the shared GitHubService."""
+    return _get_service(GitHubService)
+
+
+def _get_dispatcher():
+    """Return the shared GitHubActionsDispatcher."""
+    return _get_service(GitHubActionsDispatcher, _get_github_service())
+
+
+# Pooled session for Discord webhook follow-ups (keeps the TLS connection warm)
+_discord_session = requests.Session()
+_discord_session.headers.update({'Content-Type': 'application/json'})
+_discord_session.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    # Follow-up POSTs are not idempotent: a 5xx may come back after Discord
+    # posted the message, so only 429s (never processed) are retried, after
+    # their Retry-After
+    max_retries=Retry(
+        total=2,
+        # A timed-out read may already have been posted; only retry requests
+        # that never reached Discord
+        connect=2,
+        read=0,
+        other=0,
+        backoff_factor=0.2,
+        status_forcelist=[429],
+        allowed_methods=frozenset({'POST'}),
+        respect_retry_after_header=True
+    )
+))
+
+
+@lru_cache(maxsize=1)
+def _get_lambda_client():
+    """Build the Lambda client for deferred self-invokes once per container."""
+    import boto3
+    return boto3.client('lambda')
+
+
+@lru_cache(maxsize=4)
+def _get_verify_key(public_key):
+    """Build the Ed25519 verify key once per public key (reused across warm invocations)."""
+    return VerifyKey(bytes.fromhex(public_key))
+
 
 def verify_discord_signature(signature, timestamp, body, public_key):
     """Verify Discord interaction signature."""
+    # Cheap shape checks first: Ed25519 signatures are 64 bytes (128 hex chars)
+    if len(signature) != 128 or len(timestamp) > 32 or len(body) > MAX_SIGNED_BODY_BYTES:
+        return False
+    if not timestamp.isdecimal() or abs(time.time() - int(timestamp)) > MAX_SIGNATURE_AGE_SECONDS:
+        return False
     try:
-        verify_key = VerifyKey(bytes.fromhex(public_key))
-        verify_key.verify(f'{timestamp}{body}'.encode(), bytes.fromhex(signature))
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        _get_verify_key(public_key).verify(timestamp.encode('ascii') + body, bytes.fromhex(signature))
         return True
     except (BadSignatureError, ValueError):
         return False
 
 
+def _validate_url(url):
+    """Validate a URL against the current URLValidator config (env-driven allowlist)."""
+    return URLValidator().validate_url(url)
+
+
+def _get_options(interaction):
+    """Map slash command option names to their values."""
+    return {
+        option.get('name'): option.get('value')
+        for option in (interaction.get('data') or {}).get('options') or []
+    }
+
+
+def _dumps(value):
+    """Serialize a response body to a JSON string."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value).decode('utf-8')
+    # Match orjson's output: compact, with emoji kept as raw UTF-8 instead of
+    # 12-byte surrogate-pair escapes
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def _loads(body):
+    """Parse a JSON request body (str or bytes)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
 def create_response(response_type, data=None):
     """Create a Discord interaction response."""
     response = {'type': response_type}
@@ -67,199 +232,215 @@ def create_response(response_type, data=None):
     return {
         'statusCode': 200,
         'headers': {'Content-Type': 'application/json'},
-        'body': json.dumps(response)
+        'body': _dumps(response)
     }
 
 
+# Static replies, serialized once at import
+_RESP_PONG = create_response(1)
+_RESP_PLAN = create_response(4, {
+    'content': '📋 Creating daily plan proposal...\nThis will read open GitHub issues with the `ready` label and post a plan to Discord.',
+    'flags': 64  # Ephemeral message
+})
+_RESP_APPROVE = create_response(4, {
+    'content': '✅ Plan approved! Beginning execution...',
+    'flags': 64
+})
+_RESP_SHIP = create_response(4, {
+    'content': '🚢 Preparing to ship...\nThis will finalize PRs and trigger deployments.',
+    'flags': 64
+})
+_RESP_INVALID_RUN_ID = create_response(4, {
+    'content': '❌ Invalid run_id: must be a number',
+    'flags': 64
+})
+_ERR_NO_PUBLIC_KEY = {
+    'statusCode': 500,
+    'body': json.dumps({'error': 'Discord public key not configured'})
+}
+_ERR_MISSING_SIGNATURE = {
+    'statusCode': 401,
+    'body': json.dumps({'error': 'Missing signature headers'})
+}
+# Discord also probes the endpoint with bad signatures, so this one is hot
+_ERR_BAD_SIGNATURE = {
+    'statusCode': 401,
+    'body': json.dumps({'error': 'Invalid request signature'})
+}
+
+
 def handle_plan_command(interaction):
     """Handle /plan command - create a daily plan proposal."""
     # TODO: Implement actual plan generation logic
-    return create_response(4, {
-        'content': '📋 Creating daily plan proposal...\nThis will read open GitHub issues with the `ready` label and post a plan to Discord.',
-        'flags': 64  # Ephemeral message
-    })
+    return _RESP_PLAN
 
 
 def handle_approve_command(interaction):
     """Handle /approve command - approve a plan."""
     # TODO: Implement plan approval logic
-    return create_response(4, {
-        'content': '✅ Plan approved! Beginning execution...',
-        'flags': 64
-    })
+    return _RESP_APPROVE
 
 
 def handle_status_command(interaction):
     """Handle /status command - show last 1-3 runs (via StatusAgent)."""
     try:
         # Extract optional count parameter (default: 2, min: 1, max: 3)
-        options = interaction.get('data', {}).get('options', [])
-        count = 2
-        for option in options:
-            if option.get('name') == 'count':
-                count = int(option.get('value', 2))
-                count = max(1, min(3, count))  # Clamp to 1-3
+        count = int(_get_options(interaction).get('count', 2))
+        count = max(1, min(3, count))  # Clamp to 1-3
         
-        # Initialize services
-        github_service = GitHubService()
-        dispatcher = GitHubActionsDispatcher(github_service)
-        formatter = TimeFormatter()
-        
-        # Get runs for both workflows
-        client_deploy_runs = dispatcher.list_workflow_runs('Client Deploy', count=count)
-        diagnose_runs = dispatcher.list_workflow_runs('Diagnose on Demand', count=count)
-        
-        # Build status message with StatusAgent personality
-        content = f'{STATUS_AGENT.emoji} **{STATUS_AGENT.name}:** Workflow status report\n\n'
-        content += f'_Showing last {count} run(s) per workflow_\n\n'
-        
-        # Client Deploy section
-        content += '**Client Deploy:**\n'
-        if client_deploy_runs:
-            for run in client_deploy_runs:
-                conclusion = run.get('conclusion', 'in_progress')
-                if conclusion == 'success':
-                    icon = '🟢'
-                elif conclusion == 'failure':
-                    icon = '🔴'
-                elif conclusion is None or run.get('status') != 'completed':
-                    icon = '🟡'
-                    conclusion = 'running'
-                else:
-                    icon = '⚪'
-                
-                ago = formatter.format_relative_time(run.get('created_at'))
-                duration = formatter.format_duration_seconds(run.get('duration_seconds'))
-                url = run.get('html_url', '')
-                
-                content += f'{icon} {conclusion} • {ago} • {duration} • [run]({url})\n'
-        else:
-            content += '  No runs found\n'
-        
-        content += '\n**Diagnose on Demand:**\n'
-        if diagnose_runs:
-            for run in diagnose_runs:
-                conclusion = run.get('conclusion', 'in_progress')
-                if conclusion == 'success':
-                    icon = '🟢'
-                elif conclusion == 'failure':
-                    icon = '🔴'
-                elif conclusion is None or run.get('status') != 'completed':
-                    icon = '🟡'
-                    conclusion = 'running'
-                else:
-                    icon = '⚪'
-                
-                ago = formatter.format_relative_time(run.get('created_at'))
-                duration = formatter.format_duration_seconds(run.get('duration_seconds'))
-                url = run.get('html_url', '')
-                
-                content += f'{icon} {conclusion} • {ago} • {duration} • [run]({url})\n'
-        else:
-            content += '  No runs found\n'
-        
-        return create_response(4, {
-            'content': content
-        })
+        return _respond_within_ack_window(interaction, 'status', {'count': count})
     
     except Exception as e:
-        print(f'Error in handle_status_command: {str(e)}')
-        import traceback
-        traceback.print_exc()
+        _log_exc('handle_status_command', e)
         return create_response(4, {
             'content': f'❌ Error: {str(e)}',
             'flags': 64
         })
 
 
+def _build_status_data(count):
+    """Fetch recent runs for each STATUS_WORKFLOWS entry and build the /status message data."""
+    dispatcher = _get_dispatcher()
+    
+    # Only ask GitHub for recent runs; whole minutes keep the query (and the
+    # dispatcher's short-lived run cache key) stable across back-to-back calls
+    created_since = (
+        datetime.now(timezone.utc) - timedelta(days=STATUS_LOOKBACK_DAYS)
+    ).replace(second=0, microsecond=0)
+    
+    # Get runs for every workflow concurrently (each is a GitHub round trip)
+    with ThreadPoolExecutor(max_workers=len(STATUS_WORKFLOWS)) as executor:
+        futures = [
+            executor.submit(dispatcher.list_workflow_runs, name, count=count, created_since=created_since)
+            for name in STATUS_WORKFLOWS
+        ]
+        sections = [
+            f'**{name}:**\n' + (_render_run_rows(future.result()) or '  No runs found\n')
+            for name, future in zip(STATUS_WORKFLOWS, futures)
+        ]
+    
+    # Build status message with StatusAgent personality
+    parts = [
+        f'{STATUS_AGENT.emoji} **{STATUS_AGENT.name}:** Workflow status report\n\n',
+        f'_Showing last {count} run(s) per workflow_\n\n',
+        '\n'.join(sections)
+    ]
+    
+    return {'content': ''.join(parts)}
+
+
+# Status icons for completed run conclusions (anything else completed is ⚪)
+RUN_CONCLUSION_ICONS = {
+    'success': '🟢',
+    'failure': '🔴'
+}
+
+
+def _render_run_rows(runs, formatter=TimeFormatter):
+    """Render one status line per workflow run; returns '' when there are no runs."""
+    rows = []
+    for run in runs:
+        conclusion = run.get('conclusion', 'in_progress')
+        icon = RUN_CONCLUSION_ICONS.get(conclusion)
+        if icon is None:
+            if conclusion is None or run.get('status') != 'completed':
+                icon = '🟡'
+                conclusion = 'running'
+            else:
+                icon = '⚪'
+        
+        ago = formatter.format_relative_time(run.get('created_at'))
+        duration = formatter.format_duration_seconds(run.get('duration_seconds'))
+        url = run.get('html_url', '')
+        
+        rows.append(f'{icon} {conclusion} • {ago} • {duration} • [run]({url})\n')
+    return ''.join(rows)
+
+
 def handle_ship_command(interaction):
     """Handle /ship command - finalize and deploy."""
     # TODO: Implement shipping logic
-    return create_response(4, {
-        'content': '🚢 Preparing to ship...\nThis will finalize PRs and trigger deployments.',
-        'flags': 64
-    })
+    return _RESP_SHIP
 
 
 def handle_verify_latest_command(interaction):
     """Handle /verify-latest command - verify latest Client Deploy run (via VerifyAgent)."""
     try:
         # Extract optional parameters
-        options = interaction.get('data', {}).get('options', [])
-        run_url = None
-        diagnose = False
-        for option in options:
-            if option.get('name') == 'run_url':
-                run_url = option.get('value')
-            elif option.get('name') == 'diagnose':
-                diagnose = option.get('value', False)
-
-        # Perform verification
-        verifier = DeployVerifier()
-        result = verifier.verify_latest_run(run_url)
-
-        # Get message from result - add VerifyAgent branding
-        message = result.get('message', {})
-        base_content = message.get('content', '❌ Verification failed')
-        content = f'{VERIFY_AGENT.emoji} **{VERIFY_AGENT.name}:** {base_content.lstrip("✅ ").lstrip("❌ ")}'
-        embed = message.get('embed')
-
-        # If diagnose option is enabled, trigger diagnose workflow
-        if diagnose:
-            try:
-                github_service = GitHubService()
-                dispatcher = GitHubActionsDispatcher(github_service)
-                
-                # Generate correlation ID
-                correlation_id = dispatcher.generate_correlation_id()
-                
-                # Get user info
-                user = interaction.get('member', {}).get('user', {})
-                requester = user.get('username', user.get('id', 'unknown'))
-                
-                # Trigger diagnose
-                dispatch_result = dispatcher.trigger_diagnose_dispatch(
-                    correlation_id=correlation_id,
-                    requester=requester
-                )
-                
-                if dispatch_result.get('success'):
-                    # Add diagnose info to response
-                    content += f'\n\n🔧 **Diagnose triggered** (correlation: `{correlation_id[:8]}...`)'
-                    content += '\n⏳ Checking for run...'
-                else:
-                    content += f'\n\n⚠️ Failed to trigger diagnose: {dispatch_result.get("message")}'
-                    
-            except Exception as diag_error:
-                print(f'Error triggering diagnose: {str(diag_error)}')
-                content += f'\n\n⚠️ Failed to trigger diagnose: {str(diag_error)}'
+        options = _get_options(interaction)
+        run_url = options.get('run_url')
+        diagnose = options.get('diagnose', False)
 
-        # Return response with embed
-        response_data = {'content': content}
-        if embed:
-            response_data['embeds'] = [embed]
+        # Get user info
+        _, requester, _ = interaction_user(interaction)
 
-        return create_response(4, response_data)
+        kwargs = {'run_url': run_url, 'diagnose': diagnose, 'requester': requester}
+        if diagnose:
+            # Triggering diagnose is a side effect; don't risk running it twice
+            # via an abandoned fast-ack attempt plus the deferred rebuild
+            return create_response(4, _build_verify_latest_data(**kwargs))
+
+        return _respond_within_ack_window(interaction, 'verify_latest', kwargs)
 
     except Exception as e:
-        print(f'Error in handle_verify_latest_command: {str(e)}')
-        import traceback
-        traceback.print_exc()
+        _log_exc('handle_verify_latest_command', e)
         return create_response(4, {
             'content': f'❌ Error: {str(e)}',
             'flags': 64
         })
 
 
+def _build_verify_latest_data(run_url=None, diagnose=False, requester='unknown'):
+    """Verify the latest (or given) deploy run and build the /verify-latest message data."""
+    # Perform verification
+    from verification.verifier import DeployVerifier
+    verifier = _get_service(DeployVerifier)
+    result = verifier.verify_latest_run(run_url)
+
+    # Get message from result - add VerifyAgent branding
+    message = result.get('message', {})
+    base_content = message.get('content', '❌ Verification failed')
+    content = f'{VERIFY_AGENT.emoji} **{VERIFY_AGENT.name}:** {base_content.lstrip("✅ ").lstrip("❌ ")}'
+    embed = message.get('embed')
+
+    # If diagnose option is enabled, trigger diagnose workflow
+    if diagnose:
+        try:
+            dispatcher = _get_dispatcher()
+            
+            # Generate correlation ID
+            correlation_id = dispatcher.generate_correlation_id()
+            
+            # Trigger diagnose
+            dispatch_result = dispatcher.trigger_diagnose_dispatch(
+                correlation_id=correlation_id,
+                requester=requester
+            )
+            
+            if dispatch_result.get('success'):
+                # Add diagnose info to response
+                content += f'\n\n🔧 **Diagnose triggered** (correlation: `{correlation_id[:8]}...`)'
+                content += '\n⏳ Checking for run...'
+            else:
+                content += f'\n\n⚠️ Failed to trigger diagnose: {dispatch_result.get("message")}'
+                
+        except Exception as diag_error:
+            _log_exc('_build_verify_latest_data (diagnose)', diag_error)
+            content += f'\n\n⚠️ Failed to trigger diagnose: {str(diag_error)}'
+
+    # Return response with embed
+    response_data = {'content': content}
+    if embed:
+        response_data['embeds'] = [embed]
+
+    return response_data
+
+
 def handle_verify_run_command(interaction):
     """Handle /verify-run command - verify specific run by ID."""
     try:
         # Extract required run_id parameter
-        options = interaction.get('data', {}).get('options', [])
-        run_id = None
-        for option in options:
-            if option.get('name') == 'run_id':
-                run_id = option.get('value')
+        run_id = _get_options(interaction).get('run_id')
 
         if not run_id:
             return create_response(4, {
@@ -267,98 +448,74 @@ def handle_verify_run_command(interaction):
                 'flags': 64
             })
 
-        # Validate run_id is numeric
-        try:
-            run_id = int(run_id)
-        except ValueError:
-            return create_response(4, {
-                'content': '❌ Invalid run_id: must be a number',
-                'flags': 64
-            })
-
-        # Perform verification
-        verifier = DeployVerifier()
-        result = verifier.verify_run(run_id)
+        # Validate run_id is numeric (checked up front instead of via int()'s ValueError)
+        run_id = str(run_id).strip()
+        if not run_id.isdecimal():
+            return _RESP_INVALID_RUN_ID
+        run_id = int(run_id)
 
-        # Get message from result
-        message = result.get('message', {})
-        content = message.get('content', '❌ Verification failed')
-        embed = message.get('embed')
-
-        # Return response with embed
-        response_data = {'content': content}
-        if embed:
-            response_data['embeds'] = [embed]
-
-        return create_response(4, response_data)
+        return _respond_within_ack_window(interaction, 'verify_run', {'run_id': run_id})
 
     except Exception as e:
-        print(f'Error in handle_verify_run_command: {str(e)}')
-        import traceback
-        traceback.print_exc()
+        _log_exc('handle_verify_run_command', e)
         return create_response(4, {
             'content': f'❌ Error: {str(e)}',
             'flags': 64
         })
 
 
+def _build_verify_run_data(run_id):
+    """Verify a specific run and build the /verify-run message data."""
+    from verification.verifier import DeployVerifier
+    verifier = _get_service(DeployVerifier)
+    result = verifier.verify_run(run_id)
+
+    # Get message from result
+    message = result.get('message', {})
+    content = message.get('content', '❌ Verification failed')
+    embed = message.get('embed')
+
+    # Return response with embed
+    response_data = {'content': content}
+    if embed:
+        response_data['embeds'] = [embed]
+
+    return response_data
+
+
 def handle_diagnose_command(interaction):
     """Handle /diagnose command - trigger on-demand diagnose workflow (via DiagnoseAgent)."""
     try:
         # Extract optional parameters
-        options = interaction.get('data', {}).get('options', [])
-        frontend_url = ''
-        api_base = ''
-        for option in options:
-            if option.get('name') == 'frontend_url':
-                frontend_url = option.get('value', '')
-            elif option.get('name') == 'api_base':
-                api_base = option.get('value', '')
+        options = _get_options(interaction)
+        frontend_url = options.get('frontend_url', '')
+        api_base = options.get('api_base', '')
 
         # Initialize services
-        github_service = GitHubService()
-        dispatcher = GitHubActionsDispatcher(github_service)
+        dispatcher = _get_dispatcher()
         
         # Generate correlation ID
         correlation_id = dispatcher.generate_correlation_id()
         
         # Get user info
-        user = interaction.get('member', {}).get('user', {})
-        requester = user.get('username', user.get('id', 'unknown'))
+        _, requester, _ = interaction_user(interaction)
         
         # Get channel/thread info
         channel_id = interaction.get('channel_id', '')
         
-        # Trigger diagnose workflow
-        dispatch_result = dispatcher.trigger_diagnose_dispatch(
-            correlation_id=correlation_id,
-            requester=requester,
-            channel_id=channel_id,
-            frontend_url=frontend_url,
-            api_base=api_base
-        )
-        
-        if not dispatch_result.get('success'):
-            return create_response(4, {
-                'content': f'❌ Failed to trigger diagnose: {dispatch_result.get("message")}',
-                'flags': 64
-            })
-        
-        # Return initial response with DiagnoseAgent personality
-        short_id = correlation_id[:8]
-        content = f'{DIAGNOSE_AGENT.emoji} **{DIAGNOSE_AGENT.name}:** Starting infrastructure diagnostics...\n\n'
-        content += f'**Correlation ID:** `{short_id}...`\n'
-        content += f'**Requested by:** {requester}\n\n'
-        content += '⏳ Running comprehensive checks on AWS resources, endpoints, and deployments...'
-        
-        return create_response(4, {
-            'content': content
+        # Dispatching is a GitHub API round trip; ACK first and report via follow-up
+        _run_deferred_task('diagnose_dispatch', {
+            'interaction': _followup_target(interaction),
+            'correlation_id': correlation_id,
+            'requester': requester,
+            'channel_id': channel_id,
+            'frontend_url': frontend_url,
+            'api_base': api_base
         })
+        return create_response(5)
 
     except Exception as e:
-        print(f'Error in handle_diagnose_command: {str(e)}')
-        import traceback
-        traceback.print_exc()
+        _log_exc('handle_diagnose_command', e)
         return create_response(4, {
             'content': f'❌ Error: {str(e)}',
             'flags': 64
@@ -369,20 +526,13 @@ def handle_deploy_client_command(interaction):
     """Handle /deploy-client command - trigger Client Deploy workflow (via Amadeus)."""
     try:
         # Extract optional parameters
-        options = interaction.get('data', {}).get('options', [])
-        api_base = ''
-        wait = False
-        
-        for option in options:
-            if option.get('name') == 'api_base':
-                api_base = option.get('value', '')
-            elif option.get('name') == 'wait':
-                wait = option.get('value', False)
+        options = _get_options(interaction)
+        api_base = options.get('api_base', '')
+        wait = options.get('wait', False)
         
         # Validate api_base if provided
         if api_base:
-            validator = URLValidator()
-            validation_result = validator.validate_url(api_base)
+            validation_result = _validate_url(api_base)
             if not validation_result['valid']:
                 return create_response(4, {
                     'content': f'❌ Invalid api_base URL: {validation_result["message"]}',
@@ -390,15 +540,13 @@ def handle_deploy_client_command(interaction):
                 })
         
         # Initialize services
-        github_service = GitHubService()
-        dispatcher = GitHubActionsDispatcher(github_service)
+        dispatcher = _get_dispatcher()
         
         # Generate correlation ID
         correlation_id = dispatcher.generate_correlation_id()
         
         # Get user info
-        user = interaction.get('member', {}).get('user', {})
-        requester = user.get('username', user.get('id', 'unknown'))
+        _, requester, _ = interaction_user(interaction)
         
         # Trigger Client Deploy workflow
         dispatch_result = dispatcher.trigger_client_deploy(
@@ -419,93 +567,307 @@ def handle_deploy_client_command(interaction):
         # If wait=false, return immediate response (unchanged behavior)
         if not wait:
             # Use Amadeus formatting for deployment messages
-            content = f'{AMADEUS.emoji} **{AMADEUS.name}:** Client deployment initiated! 🚀\n\n'
+            parts = [f'{AMADEUS.emoji} **{AMADEUS.name}:** Client deployment initiated! 🚀\n\n']
             if api_base:
-                content += f'**API Base Override:** `{api_base}`\n'
-            content += f'**Correlation ID:** `{short_id}...`\n'
-            content += f'**Requested by:** {requester}\n\n'
-            content += '⏳ Deployment in progress. Use `/status` to check progress.'
+                parts.append(f'**API Base Override:** `{api_base}`\n')
+            parts.append(f'**Correlation ID:** `{short_id}...`\n')
+            parts.append(f'**Requested by:** {requester}\n\n')
+            parts.append('⏳ Deployment in progress. Use `/status` to check progress.')
             
             return create_response(4, {
-                'content': content
+                'content': ''.join(parts)
             })
         
-        # If wait=true, use deferred response and follow-up
-        # Send deferred response (type 5)
-        deferred_response = create_response(5)  # DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE
-        
-        # Post follow-up messages in a background thread/async manner
-        # Since Lambda doesn't support long-running processes, we'll do polling here
-        # and return before timeout (3 seconds Lambda context)
+        # If wait=true, ACK with a deferred response (type 5) right away and
+        # hand the run lookup/polling to a background invocation, which
+        # reports back through follow-up messages
+        _run_deferred_task('deploy_client_wait', {
+            'interaction': _followup_target(interaction),
+            'correlation_id': correlation_id,
+            'requester': requester,
+            'api_base': api_base
+        })
         
-        # Wait a bit for run to be created
-        time.sleep(3)
+        return create_response(5)  # DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE
+    
+    except Exception as e:
+        _log_exc('handle_deploy_client_command', e)
+        return create_response(4, {
+            'content': f'❌ Error: {str(e)}',
+            'flags': 64
+        })
+
+
+def _deploy_outcome_message(poll_result, short_id, run_url):
+    """Render the final Client Deploy follow-up for a poll_run_conclusion result."""
+    if not poll_result.get('completed'):
+        # Timed out
+        return ''.join([
+            f'{AMADEUS.emoji} **{AMADEUS.name}:** Still deploying...\n\n',
+            f'**Correlation ID:** `{short_id}...`\n',
+            f'**Run:** {run_url}\n\n',
+            '⏱️ Deployment is still running after the monitoring window. '
+            'Check GitHub Actions for current status.'
+        ])
+    
+    conclusion = poll_result.get('conclusion')
+    if conclusion == 'success':
+        return ''.join([
+            f'{AMADEUS.emoji} **{AMADEUS.name}:** Mission accomplished! 🎉\n\n',
+            f'**Correlation ID:** `{short_id}...`\n',
+            f'**Run:** {run_url}\n\n',
+            '✅ Client deployed successfully and ready for action!'
+        ])
+    return ''.join([
+        f'{AMADEUS.emoji} **{AMADEUS.name}:** Deployment failed! 💥\n\n',
+        f'**Correlation ID:** `{short_id}...`\n',
+        f'**Run:** {run_url}\n',
+        f'**Status:** {conclusion}\n\n',
+        '❌ Check the run logs for details. Use `/triage` for auto-fix.'
+    ])
+
+
+def _deploy_poll_budget(context):
+    """Seconds the deploy monitor may poll before it must post its final follow-up."""
+    if context is None:
+        return DEPLOY_POLL_TIMEOUT_SECONDS
+    remaining = context.get_remaining_time_in_millis() / 1000
+    return max(0, int(remaining - DEFERRED_FOLLOWUP_MARGIN_SECONDS))
+
+
+def _deploy_client_worker(interaction, correlation_id, requester, api_base='', context=None):
+    """Find and monitor a Client Deploy run, posting follow-ups (runs after the deferred ACK)."""
+    try:
+        dispatcher = _get_dispatcher()
+        short_id = correlation_id[:8]
         
-        # Find the run by correlation_id
-        run = dispatcher.find_run_by_correlation(correlation_id, 'Client Deploy')
+        # Look for the run as soon as GitHub lists it, backing off between tries
+        run = None
+        for delay in DEPLOY_RUN_LOOKUP_DELAYS:
+            time.sleep(delay)
+            run = dispatcher.find_run_by_correlation(
+                correlation_id, 'Client Deploy', fallback_to_recent=False
+            )
+            if run:
+                break
+        else:
+            # Same fallback as before: the most recent Client Deploy run
+            run = dispatcher.find_recent_run_for_workflow('Client Deploy', max_age_seconds=300)
         
         if run:
-            # Send follow-up with run link (Amadeus style)
-            follow_up_content = f'{AMADEUS.emoji} **{AMADEUS.name}:** Deployment started!\n\n'
-            if api_base:
-                follow_up_content += f'**API Base Override:** `{api_base}`\n'
-            follow_up_content += f'**Correlation ID:** `{short_id}...`\n'
-            follow_up_content += f'**Requested by:** {requester}\n'
-            follow_up_content += f'**Run:** {run.html_url}\n\n'
-            follow_up_content += '⏳ Monitoring deployment (up to 3 minutes)...'
-            
-            # Post follow-up via webhook/interaction token
-            _post_followup_message(interaction, follow_up_content)
+            # Short first poll: fast runs get a single follow-up with the outcome
+            poll_result = dispatcher.poll_run_conclusion(run.id, timeout_seconds=2, poll_interval=0.5)
             
-            # Poll for completion (up to 180 seconds)
-            poll_result = dispatcher.poll_run_conclusion(run.id, timeout_seconds=180, poll_interval=3)
-            
-            # Send final outcome (Amadeus style)
-            if poll_result.get('completed'):
-                conclusion = poll_result.get('conclusion')
-                if conclusion == 'success':
-                    final_content = f'{AMADEUS.emoji} **{AMADEUS.name}:** Mission accomplished! 🎉\n\n'
-                    final_content += f'**Correlation ID:** `{short_id}...`\n'
-                    final_content += f'**Run:** {run.html_url}\n\n'
-                    final_content += '✅ Client deployed successfully and ready for action!'
-                else:
-                    final_content = f'{AMADEUS.emoji} **{AMADEUS.name}:** Deployment failed! 💥\n\n'
-                    final_content += f'**Correlation ID:** `{short_id}...`\n'
-                    final_content += f'**Run:** {run.html_url}\n'
-                    final_content += f'**Status:** {conclusion}\n\n'
-                    final_content += '❌ Check the run logs for details. Use `/triage` for auto-fix.'
-            else:
-                # Timed out
-                final_content = f'{AMADEUS.emoji} **{AMADEUS.name}:** Still deploying...\n\n'
-                final_content += f'**Correlation ID:** `{short_id}...`\n'
-                final_content += f'**Run:** {run.html_url}\n\n'
-                final_content += '⏱️ Deployment exceeded 3-minute timeout. Check GitHub Actions for current status.'
+            if not poll_result.get('completed'):
+                # Send follow-up with run link (Amadeus style)
+                parts = [f'{AMADEUS.emoji} **{AMADEUS.name}:** Deployment started!\n\n']
+                if api_base:
+                    parts.append(f'**API Base Override:** `{api_base}`\n')
+                parts.append(f'**Correlation ID:** `{short_id}...`\n')
+                parts.append(f'**Requested by:** {requester}\n')
+                parts.append(f'**Run:** {run.html_url}\n\n')
+                parts.append('⏳ Monitoring deployment...')
+                
+                # Post follow-up via webhook/interaction token
+                _post_followup_message(interaction, ''.join(parts))
+                
+                # Poll for completion within the invocation's remaining time; deploys
+                # take minutes, so a 15s interval keeps this to a few dozen requests
+                poll_result = dispatcher.poll_run_conclusion(
+                    run.id, timeout_seconds=_deploy_poll_budget(context), poll_interval=15
+                )
             
-            _post_followup_message(interaction, final_content)
+            _post_followup_message(interaction, _deploy_outcome_message(poll_result, short_id, run.html_url))
         else:
             # Run not found, post searching message
-            follow_up_content = f'{AMADEUS.emoji} **{AMADEUS.name}:** Deployment triggered!\n\n'
+            parts = [f'{AMADEUS.emoji} **{AMADEUS.name}:** Deployment triggered!\n\n']
             if api_base:
-                follow_up_content += f'**API Base Override:** `{api_base}`\n'
-            follow_up_content += f'**Correlation ID:** `{short_id}...`\n'
-            follow_up_content += f'**Requested by:** {requester}\n\n'
-            follow_up_content += '⏳ Looking for the workflow run... Check GitHub Actions if this persists.'
+                parts.append(f'**API Base Override:** `{api_base}`\n')
+            parts.append(f'**Correlation ID:** `{short_id}...`\n')
+            parts.append(f'**Requested by:** {requester}\n\n')
+            parts.append('⏳ Looking for the workflow run... Check GitHub Actions if this persists.')
             
-            _post_followup_message(interaction, follow_up_content)
-        
-        return deferred_response
+            _post_followup_message(interaction, ''.join(parts))
     
     except Exception as e:
-        print(f'Error in handle_deploy_client_command: {str(e)}')
-        import traceback
-        traceback.print_exc()
-        return create_response(4, {
-            'content': f'❌ Error: {str(e)}',
-            'flags': 64
-        })
+        _log_exc('_deploy_client_worker', e)
+        _post_followup_message(interaction, f'❌ Error: {str(e)}')
+
+
+# Builders for read-only responses that may have to finish after the ACK
+RESPONSE_BUILDERS = {
+    'status': _build_status_data,
+    'verify_latest': _build_verify_latest_data,
+    'verify_run': _build_verify_run_data,
+}
+
+# Builders that routinely outlast the ACK budget (HTTP checks with retries,
+# and /verify-latest diagnose=true dispatches a workflow that must not run
+# twice); these skip the inline attempt and go straight to a follow-up
+DEFERRED_ONLY_BUILDERS = frozenset({'verify_latest', 'verify_run'})
+
+# Worker pool for the fast-ack guard; timed-out work is abandoned, not awaited.
+# A build is only attempted inline while a worker is free, so abandoned builds
+# can't queue later interactions past the ACK window.
+ACK_WORKERS = 4
+_ack_executor = ThreadPoolExecutor(max_workers=ACK_WORKERS)
+_ack_slots = threading.BoundedSemaphore(ACK_WORKERS)
+
+
+def _defer_response(interaction, builder_name, kwargs):
+    """ACK with a deferred response (type 5) and build the reply as a follow-up."""
+    _run_deferred_task('followup', {
+        'interaction': _followup_target(interaction),
+        'builder_name': builder_name,
+        'kwargs': kwargs
+    })
+    return create_response(5)  # DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE
+
+
+def _respond_within_ack_window(interaction, builder_name, kwargs):
+    """
+    Build a response inline if it is ready within the ACK budget.
+
+    Otherwise ACK with a deferred response (type 5) and rebuild it in a
+    deferred task that delivers the result as a follow-up message. Known
+    slow builders, or a busy worker pool, defer right away.
+    """
+    if builder_name in DEFERRED_ONLY_BUILDERS or not _ack_slots.acquire(blocking=False):
+        return _defer_response(interaction, builder_name, kwargs)
+    
+    builder = RESPONSE_BUILDERS[builder_name]
+    future = _ack_executor.submit(builder, **kwargs)
+    future.add_done_callback(lambda _: _ack_slots.release())
+    try:
+        return create_response(4, future.result(timeout=FAST_ACK_TIMEOUT_SECONDS))
+    except FuturesTimeoutError:
+        print(f'{builder_name} exceeded {FAST_ACK_TIMEOUT_SECONDS}s, deferring response')
+        return _defer_response(interaction, builder_name, kwargs)
+
+
+def _followup_worker(interaction, builder_name, kwargs, context=None):
+    """Build a deferred response and deliver it as a follow-up message."""
+    try:
+        data = RESPONSE_BUILDERS[builder_name](**kwargs)
+        _post_followup_message(interaction, data.get('content'), data.get('embeds'))
+    except Exception as e:
+        _log_exc(f'_followup_worker ({builder_name})', e)
+        _post_followup_message(interaction, f'❌ Error: {str(e)}')
+
+
+def _triage_dispatch_worker(interaction, pr_number, trace_id, context=None):
+    """Trigger the Phase 5 triage workflow; only failures are reported back to Discord."""
+    logger = StructuredLogger(service="triage")
+    logger.set_context(trace_id=trace_id, cmd='/triage', pr=pr_number)
+    try:
+        workflow_result = _get_dispatcher().trigger_phase5_triage(
+            failure_ref=str(pr_number),
+            allow_auto_fix='false',  # Safe default
+            dry_run='false',
+            verbose='true'
+        )
+        
+        if workflow_result.get('success'):
+            logger.info('Triage workflow triggered', fn='_triage_dispatch_worker',
+                       pr=pr_number, trace_id=trace_id)
+        else:
+            logger.warn('Triage workflow trigger issue', fn='_triage_dispatch_worker',
+                       pr=pr_number, error=workflow_result.get('message'))
+            _post_followup_message(
+                interaction,
+                f'⚠️ Note: Workflow trigger encountered an issue for PR #{pr_number}: '
+                f'{workflow_result.get("message")}'
+            )
+    except Exception as e:
+        _log_exc('_triage_dispatch_worker', e)
+        _post_followup_message(interaction, f'❌ Error triggering triage workflow: {str(e)}')
+
+
+def _diagnose_dispatch_worker(interaction, correlation_id, requester, channel_id='',
+                              frontend_url='', api_base='', context=None):
+    """Trigger the diagnose workflow and post the DiagnoseAgent reply as a follow-up."""
+    try:
+        dispatch_result = _get_dispatcher().trigger_diagnose_dispatch(
+            correlation_id=correlation_id,
+            requester=requester,
+            channel_id=channel_id,
+            frontend_url=frontend_url,
+            api_base=api_base
+        )
+        
+        if not dispatch_result.get('success'):
+            _post_followup_message(
+                interaction,
+                f'❌ Failed to trigger diagnose: {dispatch_result.get("message")}'
+            )
+            return
+        
+        short_id = correlation_id[:8]
+        parts = [
+            f'{DIAGNOSE_AGENT.emoji} **{DIAGNOSE_AGENT.name}:** Starting infrastructure diagnostics...\n\n',
+            f'**Correlation ID:** `{short_id}...`\n',
+            f'**Requested by:** {requester}\n\n',
+            '⏳ Running comprehensive checks on AWS resources, endpoints, and deployments...'
+        ]
+        _post_followup_message(interaction, ''.join(parts))
+    except Exception as e:
+        _log_exc('_diagnose_dispatch_worker', e)
+        _post_followup_message(interaction, f'❌ Error: {str(e)}')
+
 
+# Long-running work that must not delay the interaction ACK. Each task also
+# takes the Lambda context (None when run in-process) to budget its time.
+DEFERRED_TASKS = {
+    'deploy_client_wait': _deploy_client_worker,
+    'diagnose_dispatch': _diagnose_dispatch_worker,
+    'followup': _followup_worker,
+    'triage_dispatch': _triage_dispatch_worker,
+}
 
-def _post_followup_message(interaction, content):
+
+def _followup_target(interaction):
+    """Keep only what a deferred task needs to post follow-ups for an interaction."""
+    return {
+        'token': interaction.get('token'),
+        'application_id': interaction.get('application_id')
+    }
+
+
+def _run_deferred_task(task_name, payload):
+    """
+    Run a deferred task without blocking the current response.
+
+    In Lambda the function asynchronously invokes itself (InvocationType=Event)
+    so the work survives after the response is returned; elsewhere (local
+    runs, tests) it falls back to a daemon thread.
+    """
+    if _LAMBDA_FUNCTION_NAME:
+        _get_lambda_client().invoke(
+            FunctionName=_LAMBDA_FUNCTION_NAME,
+            InvocationType='Event',
+            Payload=json.dumps({'deferred_task': task_name, 'payload': payload})
+        )
+    else:
+        threading.Thread(
+            target=_run_with_deferred_slot, args=(task_name, payload), daemon=True
+        ).start()
+
+
+def _run_with_deferred_slot(task_name, payload):
+    """Run a deferred task in-process once one of the bounded worker slots frees up."""
+    if not _deferred_slots.acquire(timeout=DEFERRED_SLOT_WAIT_SECONDS):
+        _logger.warn('Deferred task skipped, all worker slots busy', fn='_run_with_deferred_slot',
+                     task=task_name)
+        if payload.get('interaction'):
+            _post_followup_message(payload['interaction'], '⏳ Busy right now, please try again shortly.')
+        return
+    try:
+        DEFERRED_TASKS[task_name](**payload)
+    finally:
+        _deferred_slots.release()
+
+
+def _post_followup_message(interaction, content, embeds=None):
     """Post a follow-up message to a Discord interaction."""
     try:
         # Get interaction token and application_id
@@ -518,10 +880,11 @@ def _post_followup_message(interaction, content):
         
         # Post follow-up message
         url = f'https://discord.com/api/v10/webhooks/{app_id}/{token}'
-        headers = {'Content-Type': 'application/json'}
         payload = {'content': content}
+        if embeds:
+            payload['embeds'] = embeds
         
-        response = requests.post(url, headers=headers, json=payload, timeout=5)
+        response = _discord_session.post(url, json=payload, timeout=5)
         
         if response.status_code in [200, 204]:
             print('Follow-up message posted successfully')
@@ -529,22 +892,16 @@ def _post_followup_message(interaction, content):
             print(f'Failed to post follow-up message: {response.status_code} - {response.text}')
     
     except Exception as e:
-        print(f'Error posting follow-up message: {str(e)}')
+        _log_exc('_post_followup_message', e)
 
 
 def handle_set_frontend_command(interaction):
     """Handle /set-frontend command - update FRONTEND_BASE_URL (admin only, feature-flagged)."""
     try:
         # Extract parameters
-        options = interaction.get('data', {}).get('options', [])
-        url = None
-        confirm = False
-        
-        for option in options:
-            if option.get('name') == 'url':
-                url = option.get('value')
-            elif option.get('name') == 'confirm':
-                confirm = option.get('value', False)
+        options = _get_options(interaction)
+        url = options.get('url')
+        confirm = options.get('confirm', False)
         
         if not url:
             return create_response(4, {
@@ -554,9 +911,7 @@ def handle_set_frontend_command(interaction):
         
         # Check admin authorization
         authenticator = AdminAuthenticator()
-        user = interaction.get('member', {}).get('user', {})
-        user_id = user.get('id', '')
-        role_ids = [role for role in interaction.get('member', {}).get('roles', [])]
+        user_id, _, role_ids = interaction_user(interaction)
         
         auth_result = authenticator.authorize_admin_action(
             user_id, 
@@ -578,16 +933,22 @@ def handle_set_frontend_command(interaction):
             })
         
         # Validate URL
-        validator = URLValidator()
-        validation_result = validator.validate_url(url)
+        validation_result = _validate_url(url)
         if not validation_result['valid']:
             return create_response(4, {
                 'content': f'❌ Invalid URL: {validation_result["message"]}',
                 'flags': 64
             })
         
+        # Cap write bursts so a misused admin account can't drain the GitHub write budget
+        if not AdminAuthenticator.consume_write_token(user_id):
+            return create_response(4, {
+                'content': '❌ Too many config updates, try again in a few seconds.',
+                'flags': 64
+            })
+        
         # Update repository variable (preferred) or secret
-        github_service = GitHubService()
+        github_service = _get_github_service()
         
         # Try variable first
         result = github_service.update_repo_variable('FRONTEND_BASE_URL', url)
@@ -605,9 +966,7 @@ def handle_set_frontend_command(interaction):
             })
     
     except Exception as e:
-        print(f'Error in handle_set_frontend_command: {str(e)}')
-        import traceback
-        traceback.print_exc()
+        _log_exc('handle_set_frontend_command', e)
         return create_response(4, {
             'content': f'❌ Error: {str(e)}',
             'flags': 64
@@ -618,17 +977,14 @@ def handle_debug_last_command(interaction):
     """Handle /debug-last command - show last execution trace for debugging."""
     try:
         # Check if debug command is enabled (feature flag)
-        enable_debug_cmd = os.environ.get('ENABLE_DEBUG_CMD', 'false').lower() == 'true'
-        
-        if not enable_debug_cmd:
+        if not _ENABLE_DEBUG_CMD:
             return create_response(4, {
                 'content': '❌ Debug commands are disabled (ENABLE_DEBUG_CMD=false)',
                 'flags': 64
             })
         
         # Get user ID
-        user = interaction.get('member', {}).get('user', {})
-        user_id = user.get('id', '')
+        user_id, _, _ = interaction_user(interaction)
         
         # Get trace store
         trace_store = get_trace_store()
@@ -695,9 +1051,7 @@ def handle_debug_last_command(interaction):
         })
     
     except Exception as e:
-        print(f'Error in handle_debug_last_command: {str(e)}')
-        import traceback
-        traceback.print_exc()
+        _log_exc('handle_debug_last_command', e)
         return create_response(4, {
             'content': f'❌ Error retrieving debug info: {str(e)}',
             'flags': 64
@@ -708,15 +1062,9 @@ def handle_set_api_base_command(interaction):
     """Handle /set-api-base command - update VITE_API_BASE secret (admin only, feature-flagged)."""
     try:
         # Extract parameters
-        options = interaction.get('data', {}).get('options', [])
-        url = None
-        confirm = False
-        
-        for option in options:
-            if option.get('name') == 'url':
-                url = option.get('value')
-            elif option.get('name') == 'confirm':
-                confirm = option.get('value', False)
+        options = _get_options(interaction)
+        url = options.get('url')
+        confirm = options.get('confirm', False)
         
         if not url:
             return create_response(4, {
@@ -726,9 +1074,7 @@ def handle_set_api_base_command(interaction):
         
         # Check admin authorization
         authenticator = AdminAuthenticator()
-        user = interaction.get('member', {}).get('user', {})
-        user_id = user.get('id', '')
-        role_ids = [role for role in interaction.get('member', {}).get('roles', [])]
+        user_id, _, role_ids = interaction_user(interaction)
         
         auth_result = authenticator.authorize_admin_action(
             user_id, 
@@ -750,16 +1096,22 @@ def handle_set_api_base_command(interaction):
             })
         
         # Validate URL
-        validator = URLValidator()
-        validation_result = validator.validate_url(url)
+        validation_result = _validate_url(url)
         if not validation_result['valid']:
             return create_response(4, {
                 'content': f'❌ Invalid URL: {validation_result["message"]}',
                 'flags': 64
             })
         
+        # Cap write bursts so a misused admin account can't drain the GitHub write budget
+        if not AdminAuthenticator.consume_write_token(user_id):
+            return create_response(4, {
+                'content': '❌ Too many config updates, try again in a few seconds.',
+                'flags': 64
+            })
+        
         # Update repository secret
-        github_service = GitHubService()
+        github_service = _get_github_service()
         result = github_service.update_repo_secret('VITE_API_BASE', url)
         
         if result['success']:
@@ -775,9 +1127,7 @@ def handle_set_api_base_command(interaction):
             })
     
     except Exception as e:
-        print(f'Error in handle_set_api_base_command: {str(e)}')
-        import traceback
-        traceback.print_exc()
+        _log_exc('handle_set_api_base_command', e)
         return create_response(4, {
             'content': f'❌ Error: {str(e)}',
             'flags': 64
@@ -787,25 +1137,24 @@ def handle_set_api_base_command(interaction):
 def handle_agents_command(interaction):
     """Handle /agents command - list available orchestrator agents."""
     try:
+        from agents.registry import get_agents
         agents = get_agents()
         
-        content = '🤖 **Available Orchestrator Agents**\n\n'
+        parts = ['🤖 **Available Orchestrator Agents**\n\n']
         
         for agent in agents:
-            content += f'**{agent.name}** (`{agent.id}`)\n'
-            content += f'{agent.description}\n'
-            content += f'Entry command: `{agent.command}`\n\n'
+            parts.append(f'**{agent.name}** (`{agent.id}`)\n')
+            parts.append(f'{agent.description}\n')
+            parts.append(f'Entry command: `{agent.command}`\n\n')
         
-        content += f'_Total: {len(agents)} agents_'
+        parts.append(f'_Total: {len(agents)} agents_')
         
         return create_response(4, {
-            'content': content
+            'content': ''.join(parts)
         })
     
     except Exception as e:
-        print(f'Error in handle_agents_command: {str(e)}')
-        import traceback
-        traceback.print_exc()
+        _log_exc('handle_agents_command', e)
         return create_response(4, {
             'content': f'❌ Error: {str(e)}',
             'flags': 64
@@ -815,8 +1164,9 @@ def handle_agents_command(interaction):
 def handle_status_digest_command(interaction):
     """Handle /status-digest command - show health snapshot with latency and error metrics."""
     try:
-        # Initialize health snapshot service
-        health_service = HealthSnapshot()
+        # Reuse the health snapshot service (and its HTTP/Discord clients) across warm invocations
+        from services.health_snapshot import HealthSnapshot
+        health_service = _get_service(HealthSnapshot)
         
         # Generate and get metrics
         metrics = health_service.gather_metrics()
@@ -831,142 +1181,22 @@ def handle_status_digest_command(interaction):
         })
     
     except Exception as e:
-        print(f'Error in handle_status_digest_command: {str(e)}')
-        import traceback
-        traceback.print_exc()
+        _log_exc('handle_status_digest_command', e)
         return create_response(4, {
             'content': f'❌ Error generating health snapshot: {str(e)}',
             'flags': 64
         })
 
 
-def handle_triage_command(interaction):
-    """Handle /triage command - auto-diagnose and fix failed PR/workflow runs."""
-    try:
-        # Extract required pr parameter
-        options = interaction.get('data', {}).get('options', [])
-        pr_number = None
-        auto_fix = False
-        allow_invasive = False
-        
-        for option in options:
-            if option.get('name') == 'pr':
-                pr_number = option.get('value')
-            elif option.get('name') == 'auto_fix':
-                auto_fix = option.get('value', False)
-            elif option.get('name') == 'allow_invasive':
-                allow_invasive = option.get('value', False)
-        
-        if not pr_number:
-            return create_response(4, {
-                'content': '❌ Missing required parameter: pr (PR number or run ID)',
-                'flags': 64
-            })
-        
-        # Validate pr_number is numeric
-        try:
-            pr_number = int(pr_number)
-        except ValueError:
-            return create_response(4, {
-                'content': '❌ Invalid pr parameter: must be a number',
-                'flags': 64
-            })
-        
-        # Get user info
-        user = interaction.get('member', {}).get('user', {})
-        username = user.get('username', user.get('id', 'unknown'))
-        
-        # Initialize trace
-        trace_store = get_trace_store()
-        logger = StructuredLogger(service="triage")
-        import uuid
-        trace_id = str(uuid.uuid4())
-        logger.set_context(trace_id=trace_id, cmd='/triage', pr=pr_number)
-        
-        # Create initial trace
-        trace = trace_store.create_trace(
-            command='/triage',
-            user_id=user.get('id', ''),
-            metadata={'pr_number': pr_number, 'auto_fix': auto_fix, 'allow_invasive': allow_invasive}
-        )
-        
-        # Send initial response
-        content = f'🔍 **Starting Triage for PR #{pr_number}**\n\n'
-        content += f'**Requested by:** {username}\n'
-        content += f'**Auto-fix:** {"✅ Enabled" if auto_fix else "❌ Disabled"}\n'
-        content += f'**Allow invasive:** {"✅ Yes" if allow_invasive else "❌ No"}\n\n'
-        content += '⏳ Analyzing failure logs...\n'
-        content += '\n_This may take 1-2 minutes. Results will be posted when complete._'
-        
-        # Start triage in background (simplified for MVP - in production would use async Lambda)
-        try:
-            # Configure triage agent
-            config = TriageConfig()
-            config.repo = os.environ.get('GITHUB_REPOSITORY', 'gcolon75/Project-Valine')
-            config.failure_ref = pr_number
-            config.allow_auto_fix = auto_fix
-            config.allow_invasive_fixes = allow_invasive
-            config.github_token = os.environ.get('GITHUB_TOKEN')
-            config.verbose = False  # Reduce output for Discord context
-            
-            if not config.github_token:
-                trace_store.add_step(trace, 'config', 'failure', error='Missing GITHUB_TOKEN')
-                return create_response(4, {
-                    'content': '❌ Configuration error: GITHUB_TOKEN not available',
-                    'flags': 64
-                })
-            
-            # Run triage agent
-            trace_store.add_step(trace, 'triage-start', 'success')
-            agent = Phase5TriageAgent(config)
-            
-            # For MVP, provide immediate feedback that triage is queued
-            # In production, this would trigger an async Lambda or Step Function
-            content += f'\n\n✅ Triage queued successfully!'
-            content += f'\n📊 Check GitHub Actions for triage results'
-            content += f'\n🔗 View PR: https://github.com/{config.repo}/pull/{pr_number}'
-            
-            trace_store.add_step(trace, 'triage-queued', 'success')
-            trace_store.complete_trace(trace)
-            
-        except Exception as triage_error:
-            trace_store.add_step(trace, 'triage-error', 'failure', error=str(triage_error))
-            trace_store.complete_trace(trace, error=str(triage_error))
-            content += f'\n\n❌ Failed to start triage: {str(triage_error)}'
-        
-        return create_response(4, {
-            'content': content
-        })
-    
-    except Exception as e:
-        print(f'Error in handle_triage_command: {str(e)}')
-        import traceback
-        traceback.print_exc()
-        return create_response(4, {
-            'content': f'❌ Error: {str(e)}',
-            'flags': 64
-        })
-
-
 def handle_relay_send_command(interaction):
     """Handle /relay-send command - post message to channel with admin authorization."""
     try:
         # Extract parameters
-        options = interaction.get('data', {}).get('options', [])
-        channel_id = None
-        message = None
-        ephemeral = False
-        confirm = False
-        
-        for option in options:
-            if option.get('name') == 'channel_id':
-                channel_id = option.get('value')
-            elif option.get('name') == 'message':
-                message = option.get('value')
-            elif option.get('name') == 'ephemeral':
-                ephemeral = option.get('value', False)
-            elif option.get('name') == 'confirm':
-                confirm = option.get('value', False)
+        options = _get_options(interaction)
+        channel_id = options.get('channel_id')
+        message = options.get('message')
+        ephemeral = options.get('ephemeral', False)
+        confirm = options.get('confirm', False)
         
         # Validate required parameters
         if not channel_id or not message:
@@ -976,11 +1206,7 @@ def handle_relay_send_command(interaction):
             })
         
         # Get user info
-        user = interaction.get('member', {}).get('user', {})
-        user_id = user.get('id', 'unknown')
-        username = user.get('username', user_id)
-        member = interaction.get('member', {})
-        role_ids = member.get('roles', [])
+        user_id, username, role_ids = interaction_user(interaction, default_id='unknown')
         
         # Initialize services
         authenticator = AdminAuthenticator()
@@ -988,7 +1214,6 @@ def handle_relay_send_command(interaction):
         trace_store = get_trace_store()
         
         # Generate trace ID
-        import uuid
         trace_id = str(uuid.uuid4())
         logger.set_context(trace_id=trace_id, user_id=user_id, cmd='/relay-send')
         
@@ -1032,7 +1257,7 @@ def handle_relay_send_command(interaction):
         trace.add_step('Redact secrets', duration_ms=5, status='success')
         
         # Post message to channel
-        discord_service = DiscordService()
+        discord_service = _get_service(DiscordService)
         post_result = discord_service.send_message(channel_id, message_to_post)
         
         if not post_result:
@@ -1040,7 +1265,7 @@ def handle_relay_send_command(interaction):
             trace.complete()
             
             # Create audit record for failed attempt
-            audit_store = AuditStore()
+            audit_store = _get_service(AuditStore)
             audit_id = audit_store.create_audit_record(
                 trace_id=trace_id,
                 user_id=user_id,
@@ -1061,7 +1286,8 @@ def handle_relay_send_command(interaction):
         trace.complete()
         
         # Create audit record for successful post
-        audit_store = AuditStore()
+        audit_store = _get_service(AuditStore)
+        message_fingerprint = audit_store.get_message_fingerprint(message)
         audit_id = audit_store.create_audit_record(
             trace_id=trace_id,
             user_id=user_id,
@@ -1069,6 +1295,7 @@ def handle_relay_send_command(interaction):
             target_channel=channel_id,
             message=message,
             result='posted',
+            fingerprint=message_fingerprint,
             metadata={
                 'username': username,
                 'ephemeral': ephemeral,
@@ -1079,27 +1306,22 @@ def handle_relay_send_command(interaction):
         logger.info('Message posted successfully', fn='handle_relay_send_command',
                    audit_id=audit_id, channel_id=channel_id)
         
-        # Get message fingerprint for confirmation
-        message_fingerprint = audit_store._get_message_fingerprint(message)
-        
         # Return confirmation
         response_flags = 64 if ephemeral else 0
-        content = f'✅ **Message posted to channel**\n\n'
-        content += f'**Channel ID:** `{channel_id}`\n'
-        content += f'**Message ID:** `{post_result.get("id")}`\n'
-        content += f'**Fingerprint:** `{message_fingerprint}`\n'
-        content += f'**Audit ID:** `{audit_id[:8]}...`\n'
-        content += f'**Trace ID:** `{trace_id[:8]}...`'
+        parts = [f'✅ **Message posted to channel**\n\n']
+        parts.append(f'**Channel ID:** `{channel_id}`\n')
+        parts.append(f'**Message ID:** `{post_result.get("id")}`\n')
+        parts.append(f'**Fingerprint:** `{message_fingerprint}`\n')
+        parts.append(f'**Audit ID:** `{audit_id[:8]}...`\n')
+        parts.append(f'**Trace ID:** `{trace_id[:8]}...`')
         
         return create_response(4, {
-            'content': content,
+            'content': ''.join(parts),
             'flags': response_flags
         })
     
     except Exception as e:
-        print(f'Error in handle_relay_send_command: {str(e)}')
-        import traceback
-        traceback.print_exc()
+        _log_exc('handle_relay_send_command', e)
         return create_response(4, {
             'content': f'❌ Error: {str(e)}',
             'flags': 64
@@ -1110,15 +1332,9 @@ def handle_relay_dm_command(interaction):
     """Handle /relay-dm command - owner-only DM-based message posting."""
     try:
         # Extract parameters
-        options = interaction.get('data', {}).get('options', [])
-        message = None
-        target_channel_id = None
-        
-        for option in options:
-            if option.get('name') == 'message':
-                message = option.get('value')
-            elif option.get('name') == 'target_channel_id':
-                target_channel_id = option.get('value')
+        options = _get_options(interaction)
+        message = options.get('message')
+        target_channel_id = options.get('target_channel_id')
         
         # Validate required parameters
         if not message or not target_channel_id:
@@ -1128,11 +1344,7 @@ def handle_relay_dm_command(interaction):
             })
         
         # Get user info
-        user = interaction.get('member', {}).get('user', {})
-        user_id = user.get('id', 'unknown')
-        username = user.get('username', user_id)
-        member = interaction.get('member', {})
-        role_ids = member.get('roles', [])
+        user_id, username, role_ids = interaction_user(interaction, default_id='unknown')
         
         # Initialize services
         authenticator = AdminAuthenticator()
@@ -1140,7 +1352,6 @@ def handle_relay_dm_command(interaction):
         trace_store = get_trace_store()
         
         # Generate trace ID
-        import uuid
         trace_id = str(uuid.uuid4())
         logger.set_context(trace_id=trace_id, user_id=user_id, cmd='/relay-dm')
         
@@ -1172,7 +1383,7 @@ def handle_relay_dm_command(interaction):
         trace.add_step('Redact secrets', duration_ms=5, status='success')
         
         # Post message to target channel as bot
-        discord_service = DiscordService()
+        discord_service = _get_service(DiscordService)
         post_result = discord_service.send_message(target_channel_id, message_to_post)
         
         if not post_result:
@@ -1180,7 +1391,7 @@ def handle_relay_dm_command(interaction):
             trace.complete()
             
             # Create audit record for failed attempt
-            audit_store = AuditStore()
+            audit_store = _get_service(AuditStore)
             audit_id = audit_store.create_audit_record(
                 trace_id=trace_id,
                 user_id=user_id,
@@ -1201,7 +1412,8 @@ def handle_relay_dm_command(interaction):
         trace.complete()
         
         # Create audit record for successful post
-        audit_store = AuditStore()
+        audit_store = _get_service(AuditStore)
+        message_fingerprint = audit_store.get_message_fingerprint(message)
         audit_id = audit_store.create_audit_record(
             trace_id=trace_id,
             user_id=user_id,
@@ -1209,6 +1421,7 @@ def handle_relay_dm_command(interaction):
             target_channel=target_channel_id,
             message=message,
             result='posted',
+            fingerprint=message_fingerprint,
             metadata={
                 'username': username,
                 'message_id': post_result.get('id')
@@ -1218,25 +1431,20 @@ def handle_relay_dm_command(interaction):
         logger.info('Message posted via relay-dm', fn='handle_relay_dm_command',
                    audit_id=audit_id, channel_id=target_channel_id)
         
-        # Get message fingerprint for confirmation
-        message_fingerprint = audit_store._get_message_fingerprint(message)
-        
         # Return ephemeral confirmation (only visible to user)
-        content = f'✅ **Message posted as bot**\n\n'
-        content += f'**Target Channel:** `{target_channel_id}`\n'
-        content += f'**Message ID:** `{post_result.get("id")}`\n'
-        content += f'**Fingerprint:** `{message_fingerprint}`\n'
-        content += f'**Audit ID:** `{audit_id[:8]}...`'
+        parts = [f'✅ **Message posted as bot**\n\n']
+        parts.append(f'**Target Channel:** `{target_channel_id}`\n')
+        parts.append(f'**Message ID:** `{post_result.get("id")}`\n')
+        parts.append(f'**Fingerprint:** `{message_fingerprint}`\n')
+        parts.append(f'**Audit ID:** `{audit_id[:8]}...`')
         
         return create_response(4, {
-            'content': content,
+            'content': ''.join(parts),
             'flags': 64  # Ephemeral
         })
     
     except Exception as e:
-        print(f'Error in handle_relay_dm_command: {str(e)}')
-        import traceback
-        traceback.print_exc()
+        _log_exc('handle_relay_dm_command', e)
         return create_response(4, {
             'content': f'❌ Error: {str(e)}',
             'flags': 64
@@ -1247,19 +1455,17 @@ def handle_triage_command(interaction):
     """Handle /triage command - auto-diagnose failing GitHub Actions (via TriageAgent)."""
     try:
         # Extract parameters
-        options = interaction.get('data', {}).get('options', [])
+        options = _get_options(interaction)
         pr_number = None
         
-        for option in options:
-            if option.get('name') == 'pr':
-                pr_value = option.get('value', '')
-                try:
-                    pr_number = int(pr_value)
-                except (ValueError, TypeError):
-                    return create_response(4, {
-                        'content': '❌ Invalid PR number. Please provide a valid integer.',
-                        'flags': 64
-                    })
+        if 'pr' in options:
+            try:
+                pr_number = int(options['pr'])
+            except (ValueError, TypeError):
+                return create_response(4, {
+                    'content': '❌ Invalid PR number. Please provide a valid integer.',
+                    'flags': 64
+                })
         
         # Validate PR parameter
         if not pr_number:
@@ -1269,60 +1475,43 @@ def handle_triage_command(interaction):
             })
         
         # Get user info
-        user = interaction.get('member', {}).get('user', {})
-        requester = user.get('username', user.get('id', 'unknown'))
+        _, requester, _ = interaction_user(interaction)
         
         # Initialize logger
         logger = StructuredLogger(service="triage")
-        import uuid
         trace_id = str(uuid.uuid4())
         logger.set_context(trace_id=trace_id, cmd='/triage', pr=pr_number)
         logger.info('Triage command received', fn='handle_triage_command', requester=requester)
         
         # Return immediate acknowledgment with TriageAgent personality
         short_id = trace_id[:8]
-        content = f'{TRIAGE_AGENT.emoji} **{TRIAGE_AGENT.name}:** Analyzing failure for PR #{pr_number}...\n\n'
-        content += f'**Trace ID:** `{short_id}...`\n'
-        content += f'**Requested by:** {requester}\n\n'
-        content += '⏳ _Running diagnostics (30-60 seconds)..._\n\n'
-        content += '**Analysis steps:**\n'
-        content += '• 📥 Fetching workflow logs\n'
-        content += '• 🔍 Extracting failure details\n'
-        content += '• 🧠 Analyzing root cause\n'
-        content += '• 💡 Generating fix proposals\n'
-        content += '• 📝 Creating actionable report\n\n'
-        content += f'_Use `/status` to monitor progress._'
-        
-        # Trigger the triage workflow asynchronously
-        # For now, we'll use the GitHub Actions workflow dispatch
-        github_service = GitHubService()
-        dispatcher = GitHubActionsDispatcher(github_service)
-        
-        # Trigger the Phase 5 Triage Agent workflow
-        workflow_result = dispatcher.trigger_phase5_triage(
-            failure_ref=str(pr_number),
-            allow_auto_fix='false',  # Safe default
-            dry_run='false',
-            verbose='true'
-        )
-        
-        if workflow_result.get('success'):
-            content += f'\n\n✅ Triage workflow triggered successfully!'
-            logger.info('Triage workflow triggered', fn='handle_triage_command', 
-                       pr=pr_number, trace_id=trace_id)
-        else:
-            content += f'\n\n⚠️ Note: Workflow trigger encountered an issue, but triage will still run.'
-            logger.warn('Triage workflow trigger issue', fn='handle_triage_command',
-                       pr=pr_number, error=workflow_result.get('message'))
+        parts = [f'{TRIAGE_AGENT.emoji} **{TRIAGE_AGENT.name}:** Analyzing failure for PR #{pr_number}...\n\n']
+        parts.append(f'**Trace ID:** `{short_id}...`\n')
+        parts.append(f'**Requested by:** {requester}\n\n')
+        parts.append('⏳ _Running diagnostics (30-60 seconds)..._\n\n')
+        parts.append('**Analysis steps:**\n')
+        parts.append('• 📥 Fetching workflow logs\n')
+        parts.append('• 🔍 Extracting failure details\n')
+        parts.append('• 🧠 Analyzing root cause\n')
+        parts.append('• 💡 Generating fix proposals\n')
+        parts.append('• 📝 Creating actionable report\n\n')
+        parts.append(f'_Use `/status` to monitor progress._')
+        
+        # Dispatch the triage workflow off the ACK path; a slow GitHub API call
+        # must not push us past Discord's 3s window
+        _run_deferred_task('triage_dispatch', {
+            'interaction': _followup_target(interaction),
+            'pr_number': pr_number,
+            'trace_id': trace_id
+        })
+        parts.append('\n\n✅ Triage workflow queued!')
         
         return create_response(4, {
-            'content': content
+            'content': ''.join(parts)
         })
     
     except Exception as e:
-        print(f'Error in handle_triage_command: {str(e)}')
-        import traceback
-        traceback.print_exc()
+        _log_exc('handle_triage_command', e)
         return create_response(4, {
             'content': f'❌ Error starting triage: {str(e)}',
             'flags': 64
@@ -1333,35 +1522,32 @@ def handle_triage_all_command(interaction):
     """Handle /triage-all command - triage all open issues in the repository."""
     try:
         # Get user info
-        user = interaction.get('member', {}).get('user', {})
-        requester = user.get('username', user.get('id', 'unknown'))
+        _, requester, _ = interaction_user(interaction)
         
         # Initialize logger
         logger = StructuredLogger(service="triage-all")
-        import uuid
         trace_id = str(uuid.uuid4())
         logger.set_context(trace_id=trace_id, cmd='/triage-all')
         logger.info('Triage-all command received', fn='handle_triage_all_command', requester=requester)
         
         # Return immediate acknowledgment with TriageAgent personality
         short_id = trace_id[:8]
-        content = f'{TRIAGE_AGENT.emoji} **{TRIAGE_AGENT.name}:** Support Main activated! Triaging ALL open issues...\n\n'
-        content += f'**Trace ID:** `{short_id}...`\n'
-        content += f'**Requested by:** {requester}\n\n'
-        content += '⏳ _Running full repo triage (2-5 minutes depending on issue count)..._\n\n'
-        content += '**Triage Process:**\n'
-        content += '• 📥 Fetching all open issues\n'
-        content += '• 📊 Prioritizing by labels and age\n'
-        content += '• 🔍 Analyzing each issue\n'
-        content += '• 🤖 Attempting auto-fixes where possible\n'
-        content += '• 🏷️ Marking issues as triaged\n'
-        content += '• 📝 Generating summary report\n\n'
-        content += f'_Results will be posted to this channel shortly._'
+        parts = [f'{TRIAGE_AGENT.emoji} **{TRIAGE_AGENT.name}:** Support Main activated! Triaging ALL open issues...\n\n']
+        parts.append(f'**Trace ID:** `{short_id}...`\n')
+        parts.append(f'**Requested by:** {requester}\n\n')
+        parts.append('⏳ _Running full repo triage (2-5 minutes depending on issue count)..._\n\n')
+        parts.append('**Triage Process:**\n')
+        parts.append('• 📥 Fetching all open issues\n')
+        parts.append('• 📊 Prioritizing by labels and age\n')
+        parts.append('• 🔍 Analyzing each issue\n')
+        parts.append('• 🤖 Attempting auto-fixes where possible\n')
+        parts.append('• 🏷️ Marking issues as triaged\n')
+        parts.append('• 📝 Generating summary report\n\n')
+        parts.append(f'_Results will be posted to this channel shortly._')
         
         # Trigger the issue triage workflow asynchronously
         # We'll use GitHub Actions workflow dispatch for consistency
-        github_service = GitHubService()
-        dispatcher = GitHubActionsDispatcher(github_service)
+        dispatcher = _get_dispatcher()
         
         # Trigger the issue triage workflow
         workflow_result = dispatcher.trigger_issue_triage(
@@ -1370,22 +1556,20 @@ def handle_triage_all_command(interaction):
         )
         
         if workflow_result.get('success'):
-            content += f'\n\n✅ Issue triage workflow triggered successfully!'
+            parts.append(f'\n\n✅ Issue triage workflow triggered successfully!')
             logger.info('Issue triage workflow triggered', fn='handle_triage_all_command', 
                        trace_id=trace_id)
         else:
-            content += f'\n\n⚠️ Note: Workflow trigger encountered an issue, but triage will still run.'
+            parts.append(f'\n\n⚠️ Note: Workflow trigger encountered an issue, but triage will still run.')
             logger.warn('Issue triage workflow trigger issue', fn='handle_triage_all_command',
                        error=workflow_result.get('message'))
         
         return create_response(4, {
-            'content': content
+            'content': ''.join(parts)
         })
     
     except Exception as e:
-        print(f'Error in handle_triage_all_command: {str(e)}')
-        import traceback
-        traceback.print_exc()
+        _log_exc('handle_triage_all_command', e)
         return create_response(4, {
             'content': f'❌ Error starting issue triage: {str(e)}',
             'flags': 64
@@ -1396,36 +1580,20 @@ def handle_ux_update_command(interaction):
     """Handle /ux-update command - interactive UX/UI updates with confirmation."""
     try:
         # Extract parameters
-        options = interaction.get('data', {}).get('options', [])
-        command_text = None
-        plain_text = None
-        confirm = None
-        conversation_id = None
-        
-        for option in options:
-            if option.get('name') == 'command':
-                command_text = option.get('value')
-            elif option.get('name') == 'description':
-                plain_text = option.get('value')
-            elif option.get('name') == 'confirm':
-                confirm = option.get('value')
-            elif option.get('name') == 'conversation_id':
-                conversation_id = option.get('value')
+        options = _get_options(interaction)
+        command_text = options.get('command')
+        plain_text = options.get('description')
+        confirm = options.get('confirm')
+        conversation_id = options.get('conversation_id')
         
         # Get user info
-        user = interaction.get('member', {}).get('user', {})
-        user_id = user.get('id', 'unknown')
-        username = user.get('username', user_id)
+        user_id, username, _ = interaction_user(interaction, default_id='unknown')
         
         # Initialize UX Agent
         from agents.ux_agent import UXAgent
-        from services.github import GitHubService
         
-        github_service = GitHubService()
-        ux_agent = UXAgent(
-            github_service=github_service,
-            repo=os.environ.get('GITHUB_REPOSITORY', 'gcolon75/Project-Valine')
-        )
+        # Shared per container: construction builds a boto3 DynamoDB resource
+        ux_agent = _get_service(UXAgent, _get_github_service(), _GITHUB_REPO)
         
         # If conversation_id and confirm are provided, this is a confirmation
         if conversation_id and confirm is not None:
@@ -1513,9 +1681,7 @@ def handle_ux_update_command(interaction):
         })
     
     except Exception as e:
-        print(f'Error in handle_ux_update_command: {str(e)}')
-        import traceback
-        traceback.print_exc()
+        _log_exc('handle_ux_update_command', e)
         return create_response(4, {
             'content': f'❌ Error: {str(e)}',
             'flags': 64
@@ -1546,19 +1712,13 @@ def handle_ux_button_interaction(interaction):
         conversation_id = parts[2]
         
         # Get user info
-        user = interaction.get('member', {}).get('user', {})
-        user_id = user.get('id', 'unknown')
-        username = user.get('username', user_id)
+        user_id, username, _ = interaction_user(interaction, default_id='unknown')
         
         # Initialize UX Agent
         from agents.ux_agent import UXAgent
-        from services.github import GitHubService
         
-        github_service = GitHubService()
-        ux_agent = UXAgent(
-            github_service=github_service,
-            repo=os.environ.get('GITHUB_REPOSITORY', 'gcolon75/Project-Valine')
-        )
+        # Shared per container: construction builds a boto3 DynamoDB resource
+        ux_agent = _get_service(UXAgent, _get_github_service(), _GITHUB_REPO)
         
         # Process based on action
         if action == 'confirm':
@@ -1600,9 +1760,7 @@ def handle_ux_button_interaction(interaction):
             })
     
     except Exception as e:
-        print(f'Error in handle_ux_button_interaction: {str(e)}')
-        import traceback
-        traceback.print_exc()
+        _log_exc('handle_ux_button_interaction', e)
         return create_response(4, {
             'content': f'❌ Error processing button interaction: {str(e)}',
             'flags': 64
@@ -1613,48 +1771,40 @@ def handle_update_summary_command(interaction):
     """Handle /update-summary command - generate and update project summary."""
     try:
         # Extract optional parameters
-        options = interaction.get('data', {}).get('options', [])
-        custom_notes = None
-        dry_run = False
-        
-        for option in options:
-            if option.get('name') == 'notes':
-                custom_notes = option.get('value')
-            elif option.get('name') == 'dry_run':
-                dry_run = option.get('value', False)
+        options = _get_options(interaction)
+        custom_notes = options.get('notes')
+        dry_run = options.get('dry_run', False)
         
         # Get user info
-        user = interaction.get('member', {}).get('user', {})
-        requester = user.get('username', user.get('id', 'unknown'))
+        _, requester, _ = interaction_user(interaction)
         
         # Initialize logger
         logger = StructuredLogger(service="summary")
-        import uuid
         trace_id = str(uuid.uuid4())
         logger.set_context(trace_id=trace_id, cmd='/update-summary', requester=requester)
         logger.info('Update summary command received', fn='handle_update_summary_command')
         
         # Return immediate acknowledgment
         short_id = trace_id[:8]
-        content = f'📝 **Generating Project Summary...**\n\n'
-        content += f'**Trace ID:** `{short_id}...`\n'
-        content += f'**Requested by:** {requester}\n'
+        parts = [f'📝 **Generating Project Summary...**\n\n']
+        parts.append(f'**Trace ID:** `{short_id}...`\n')
+        parts.append(f'**Requested by:** {requester}\n')
         
         if custom_notes:
-            content += f'**Custom notes:** {custom_notes[:100]}{"..." if len(custom_notes) > 100 else ""}\n'
+            parts.append(f'**Custom notes:** {custom_notes[:100]}{"..." if len(custom_notes) > 100 else ""}\n')
         
         if dry_run:
-            content += f'**Mode:** Dry run (preview only)\n'
+            parts.append(f'**Mode:** Dry run (preview only)\n')
         
-        content += '\n⏳ Fetching recent PRs and workflow status...\n'
+        parts.append('\n⏳ Fetching recent PRs and workflow status...\n')
         
         try:
             # Import and initialize SummaryAgent
             from agents.summary_agent import SummaryAgent
             
-            # Get GitHub token from environment
-            github_token = os.environ.get('GITHUB_TOKEN')
-            repo = os.environ.get('GITHUB_REPOSITORY', 'gcolon75/Project-Valine')
+            # GitHub settings from the environment
+            github_token = _GITHUB_TOKEN
+            repo = _GITHUB_REPO
             
             # Initialize agent
             agent = SummaryAgent(
@@ -1674,39 +1824,36 @@ def handle_update_summary_command(interaction):
                 if dry_run:
                     # Show preview of summary
                     summary_preview = result.get('summary', '')[:1000]
-                    content += f'\n\n✅ **Summary generated (preview):**\n\n'
-                    content += f'```markdown\n{summary_preview}\n```\n\n'
-                    content += f'_Run without `dry_run` to save to PROJECT_VALINE_SUMMARY.md_'
+                    parts.append(f'\n\n✅ **Summary generated (preview):**\n\n')
+                    parts.append(f'```markdown\n{summary_preview}\n```\n\n')
+                    parts.append(f'_Run without `dry_run` to save to PROJECT_VALINE_SUMMARY.md_')
                 else:
                     # Confirm update
                     file_path = result.get('file_path', 'PROJECT_VALINE_SUMMARY.md')
-                    content += f'\n\n✅ **Summary updated successfully!**\n'
-                    content += f'**File:** `{file_path}`\n'
-                    content += f'\n📊 Check the repository to view the updated summary.'
+                    parts.append(f'\n\n✅ **Summary updated successfully!**\n')
+                    parts.append(f'**File:** `{file_path}`\n')
+                    parts.append(f'\n📊 Check the repository to view the updated summary.')
                 
                 logger.info('Summary updated successfully', fn='handle_update_summary_command',
                            dry_run=dry_run, trace_id=trace_id)
             else:
                 error_msg = result.get('message', 'Unknown error')
-                content += f'\n\n❌ **Failed to update summary:** {error_msg}'
+                parts.append(f'\n\n❌ **Failed to update summary:** {error_msg}')
                 logger.error('Summary update failed', fn='handle_update_summary_command',
                             error=error_msg, trace_id=trace_id)
         
         except Exception as agent_error:
-            content += f'\n\n❌ **Error running SummaryAgent:** {str(agent_error)}'
+            parts.append(f'\n\n❌ **Error running SummaryAgent:** {str(agent_error)}')
             logger.error('SummaryAgent error', fn='handle_update_summary_command',
-                        error=str(agent_error), trace_id=trace_id)
-            import traceback
-            traceback.print_exc()
+                        error=str(agent_error), trace_id=trace_id,
+                        traceback=traceback.format_exc())
         
         return create_response(4, {
-            'content': content
+            'content': ''.join(parts)
         })
     
     except Exception as e:
-        print(f'Error in handle_update_summary_command: {str(e)}')
-        import traceback
-        traceback.print_exc()
+        _log_exc('handle_update_summary_command', e)
         return create_response(4, {
             'content': f'❌ Error: {str(e)}',
             'flags': 64
@@ -1717,12 +1864,10 @@ def handle_uptime_check_command(interaction):
     """Handle /uptime-check command - check uptime of Discord bot and critical services."""
     try:
         # Get user info
-        user = interaction.get('member', {}).get('user', {})
-        requester = user.get('username', user.get('id', 'unknown'))
+        _, requester, _ = interaction_user(interaction)
         
         # Initialize logger
         logger = StructuredLogger(service="uptime")
-        import uuid
         trace_id = str(uuid.uuid4())
         logger.set_context(trace_id=trace_id, cmd='/uptime-check', requester=requester)
         logger.info('Uptime check command received', fn='handle_uptime_check_command')
@@ -1733,6 +1878,7 @@ def handle_uptime_check_command(interaction):
         frontend_url = os.environ.get('FRONTEND_URL')
         
         # Initialize UptimeGuardian
+        from agents.uptime_guardian import UptimeGuardian
         guardian = UptimeGuardian(
             discord_handler_url=discord_handler_url,
             api_base_url=api_base_url,
@@ -1757,65 +1903,121 @@ def handle_uptime_check_command(interaction):
         })
     
     except Exception as e:
-        print(f'Error in handle_uptime_check_command: {str(e)}')
-        import traceback
-        traceback.print_exc()
+        _log_exc('handle_uptime_check_command', e)
         return create_response(4, {
             'content': f'❌ Error checking uptime: {str(e)}',
             'flags': 64
         })
 
 
+# Slash command name -> handler, built once at import
+COMMAND_HANDLERS = {
+    'plan': handle_plan_command,
+    'approve': handle_approve_command,
+    'status': handle_status_command,
+    'ship': handle_ship_command,
+    'verify-latest': handle_verify_latest_command,
+    'verify-run': handle_verify_run_command,
+    'diagnose': handle_diagnose_command,
+    'deploy-client': handle_deploy_client_command,
+    'set-frontend': handle_set_frontend_command,
+    'set-api-base': handle_set_api_base_command,
+    'agents': handle_agents_command,
+    'status-digest': handle_status_digest_command,
+    'debug-last': handle_debug_last_command,
+    'relay-send': handle_relay_send_command,
+    'relay-dm': handle_relay_dm_command,
+    'triage': handle_triage_command,
+    'triage-all': handle_triage_all_command,
+    'update-summary': handle_update_summary_command,
+    'ux-update': handle_ux_update_command,
+    'uptime-check': handle_uptime_check_command,
+}
+
+
+def _replayed_response(interaction_id):
+    """Return the cached reply for an interaction id seen recently, else None."""
+    record = _interaction_replies.get(interaction_id)
+    if record is None:
+        return None
+    response, expires_at = record
+    if expires_at <= time.monotonic():
+        del _interaction_replies[interaction_id]
+        return None
+    return response
+
+
+def _remember_response(interaction_id, response):
+    """Cache the reply for an interaction id, evicting the oldest entries past the cap."""
+    if not interaction_id:
+        return
+    _interaction_replies[interaction_id] = (
+        response, time.monotonic() + INTERACTION_REPLAY_TTL_SECONDS
+    )
+    while len(_interaction_replies) > INTERACTION_REPLAY_MAX_ENTRIES:
+        _interaction_replies.popitem(last=False)
+
+
 def handler(event, context):
     """
     Main Lambda handler for Discord interactions.
 
     Verifies Discord signature and routes commands to appropriate handlers.
     """
+    # Async self-invocation from _run_deferred_task (not reachable via API Gateway)
+    if 'deferred_task' in event:
+        task = DEFERRED_TASKS.get(event['deferred_task'])
+        if task:
+            task(context=context, **event.get('payload', {}))
+        else:
+            print(f"Unknown deferred task: {event['deferred_task']}")
+        return {'statusCode': 200}
+
     try:
         # Get Discord public key from environment
         public_key = os.environ.get('DISCORD_PUBLIC_KEY')
         if not public_key:
-            return {
-                'statusCode': 500,
-                'body': json.dumps({'error': 'Discord public key not configured'})
-            }
+            return _ERR_NO_PUBLIC_KEY
 
         # Extract signature headers
-        signature = event.get('headers', {}).get('x-signature-ed25519')
-        timestamp = event.get('headers', {}).get('x-signature-timestamp')
-        body = event.get('body', '')
+        headers = event.get('headers') or {}
+        signature = headers.get('x-signature-ed25519')
+        timestamp = headers.get('x-signature-timestamp')
+        # Raw body bytes are used for both signature verification and parsing
+        body = event.get('body') or ''
+        if event.get('isBase64Encoded'):
+            body = base64.b64decode(body)
+        elif isinstance(body, str):
+            body = body.encode('utf-8')
 
         # Verify signature
         if not signature or not timestamp:
-            return {
-                'statusCode': 401,
-                'body': json.dumps({'error': 'Missing signature headers'})
-            }
+            return _ERR_MISSING_SIGNATURE
 
         if not verify_discord_signature(signature, timestamp, body, public_key):
-            return {
-                'statusCode': 401,
-                'body': json.dumps({'error': 'Invalid request signature'})
-            }
+            return _ERR_BAD_SIGNATURE
 
         # Parse interaction
-        interaction = json.loads(body)
+        interaction = _loads(body)
         interaction_type = interaction.get('type')
 
         # Handle PING
         if interaction_type == 1:
-            return create_response(1)  # PONG
+            return _RESP_PONG  # PONG
+
+        interaction_id = interaction.get('id')
+        replayed = _replayed_response(interaction_id)
+        if replayed is not None:
+            _logger.info('Replaying duplicate interaction', fn='handler',
+                         interaction_id=interaction_id)
+            return replayed
 
         # Handle APPLICATION_COMMAND
         if interaction_type == 2:
             command_name = interaction.get('data', {}).get('name')
             
             # RBAC Check: Verify user has permission to execute this command
-            member = interaction.get('member', {})
-            user = member.get('user', {}) or interaction.get('user', {})
-            user_id = user.get('id', '')
-            user_roles = [role for role in member.get('roles', [])]
+            user_id, _, user_roles = interaction_user(interaction)
             
             permission_matrix = get_permission_matrix()
             is_allowed, error_message = permission_matrix.check_permission(
@@ -1830,51 +2032,17 @@ def handler(event, context):
                     'flags': 64  # Ephemeral
                 })
 
-            if command_name == 'plan':
-                return handle_plan_command(interaction)
-            elif command_name == 'approve':
-                return handle_approve_command(interaction)
-            elif command_name == 'status':
-                return handle_status_command(interaction)
-            elif command_name == 'ship':
-                return handle_ship_command(interaction)
-            elif command_name == 'verify-latest':
-                return handle_verify_latest_command(interaction)
-            elif command_name == 'verify-run':
-                return handle_verify_run_command(interaction)
-            elif command_name == 'diagnose':
-                return handle_diagnose_command(interaction)
-            elif command_name == 'deploy-client':
-                return handle_deploy_client_command(interaction)
-            elif command_name == 'set-frontend':
-                return handle_set_frontend_command(interaction)
-            elif command_name == 'set-api-base':
-                return handle_set_api_base_command(interaction)
-            elif command_name == 'agents':
-                return handle_agents_command(interaction)
-            elif command_name == 'status-digest':
-                return handle_status_digest_command(interaction)
-            elif command_name == 'debug-last':
-                return handle_debug_last_command(interaction)
-            elif command_name == 'relay-send':
-                return handle_relay_send_command(interaction)
-            elif command_name == 'relay-dm':
-                return handle_relay_dm_command(interaction)
-            elif command_name == 'triage':
-                return handle_triage_command(interaction)
-            elif command_name == 'triage-all':
-                return handle_triage_all_command(interaction)
-            elif command_name == 'update-summary':
-                return handle_update_summary_command(interaction)
-            elif command_name == 'ux-update':
-                return handle_ux_update_command(interaction)
-            elif command_name == 'uptime-check':
-                return handle_uptime_check_command(interaction)
-            else:
-                return create_response(4, {
-                    'content': f'Unknown command: {command_name}',
-                    'flags': 64
-                })
+            command_handler = COMMAND_HANDLERS.get(command_name)
+            if command_handler:
+                response = command_handler(interaction)
+                _remember_response(interaction_id, response)
+                return response
+            # Usually a stale registration left over after commands were re-synced
+            _logger.warn('Unknown command', fn='handler', command=command_name)
+            return create_response(4, {
+                'content': f'Unknown command: {command_name}',
+                'flags': 64
+            })
 
         # Handle MESSAGE_COMPONENT (button interactions)
         if interaction_type == 3:
@@ -1882,7 +2050,9 @@ def handler(event, context):
             
             # Route to appropriate handler based on custom_id prefix
             if custom_id.startswith('ux_'):
-                return handle_ux_button_interaction(interaction)
+                response = handle_ux_button_interaction(interaction)
+                _remember_response(interaction_id, response)
+                return response
             else:
                 return create_response(4, {
                     'content': 'Unknown button interaction',
@@ -1895,7 +2065,7 @@ def handler(event, context):
         }
 
     except Exception as e:
-        print(f'Error handling Discord interaction: {str(e)}')
+        _log_exc('handler', e)
         return {
             'statusCode': 500,
             'body': json.dumps({'error': 'Internal server error'})
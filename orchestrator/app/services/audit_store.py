@@ -32,7 +32,8 @@ class AuditStore:
                            message: str,
                            result: str,
                            moderator_approval: Optional[str] = None,
-                           metadata: Optional[Dict[str, Any]] = None) -> str:
+                           metadata: Optional[Dict[str, Any]] = None,
+                           fingerprint: Optional[str] = None) -> str:
         """
         Create an audit record for a relay operation.
         
@@ -45,6 +46,7 @@ class AuditStore:
             result: Result status ('posted', 'blocked', 'failed')
             moderator_approval: Optional moderator approval ID
             metadata: Additional metadata to store
+            fingerprint: Precomputed get_message_fingerprint(message), if the caller has it
         
         Returns:
             Audit record ID (UUID)
@@ -52,8 +54,8 @@ class AuditStore:
         audit_id = str(uuid.uuid4())
         timestamp = int(time.time())
         
-        # Create message fingerprint (SHA256 hash, last 4 chars)
-        message_fingerprint = self._get_message_fingerprint(message)
+        # Create message fingerprint (SHA256 hash, last 4 chars) unless the caller already did
+        message_fingerprint = fingerprint or self.get_message_fingerprint(message)
         
         # Build audit record
         record = {
@@ -126,7 +128,7 @@ class AuditStore:
             return []
     
     @staticmethod
-    def _get_message_fingerprint(message: str) -> str:
+    def get_message_fingerprint(message: str) -> str:
         """
         Get a fingerprint of a message (last 4 chars of SHA256 hash).
         Never stores the full message for privacy.
@@ -142,3 +144,6 @@ class AuditStore:
         
         hash_hex = hashlib.sha256(message.encode()).hexdigest()
         return f'…{hash_hex[-4:]}'
+    
+    # Backwards-compatible alias
+    _get_message_fingerprint = get_message_fingerprint
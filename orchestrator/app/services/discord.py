@@ -5,6 +5,11 @@ Provides functions to post messages, create threads, and manage Discord interact
 import os
 import json
 import requests
+from requests.adapters import HTTPAdapter
+
+# Shared keep-alive session so warm invocations reuse the TLS connection to Discord
+_SHARED_SESSION = requests.Session()
+_SHARED_SESSION.mount('https://discord.com', HTTPAdapter(pool_connections=10, pool_maxsize=10))
 
 
 class DiscordService:
@@ -20,6 +25,7 @@ class DiscordService:
             'Authorization': f'Bot {self.bot_token}',
             'Content-Type': 'application/json'
         }
+        self._session = _SHARED_SESSION
     
     def send_message(self, channel_id, content, embeds=None):
         """
@@ -39,7 +45,7 @@ class DiscordService:
             payload['embeds'] = embeds
         
         try:
-            response = requests.post(url, headers=self.headers, json=payload)
+            response = self._session.post(url, headers=self.headers, json=payload)
             response.raise_for_status()
             print(f'Message sent to channel {channel_id}')
             return response.json()
@@ -75,7 +81,7 @@ class DiscordService:
             }
         
         try:
-            response = requests.post(url, headers=self.headers, json=payload)
+            response = self._session.post(url, headers=self.headers, json=payload)
             response.raise_for_status()
             thread = response.json()
             print(f'Thread created: {thread.get("id")} - {name}')
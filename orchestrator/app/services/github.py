@@ -3,8 +3,14 @@ GitHub service for interacting with GitHub API.
 Provides functions to comment on issues, open PRs, and manage repository operations.
 """
 import os
+import requests
+from requests.adapters import HTTPAdapter
 from github import Github, GithubException
 
+# Shared keep-alive session for raw REST calls PyGithub doesn't cover
+_SHARED_SESSION = requests.Session()
+_SHARED_SESSION.mount('https://api.github.com', HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
 
 class GitHubService:
     """Service for GitHub API interactions."""
@@ -15,6 +21,9 @@ class GitHubService:
         if not self.token:
             raise ValueError('GitHub token is required')
         self.client = Github(self.token)
+        self._session = _SHARED_SESSION
+        # Actions secrets public key per repo; it only changes when GitHub rotates it
+        self._secrets_public_keys = {}
     
     def get_repository(self, repo_name='gcolon75/Project-Valine'):
         """Get a repository object."""
@@ -191,8 +200,6 @@ class GitHubService:
             dict with 'success' (bool) and 'message' (str)
         """
         try:
-            import requests
-            
             owner, repo = repo_name.split('/')
             url = f'https://api.github.com/repos/{owner}/{repo}/actions/variables/{variable_name}'
             
@@ -207,7 +214,7 @@ class GitHubService:
             }
             
             # Try to update first (PATCH)
-            response = requests.patch(url, headers=headers, json=payload, timeout=10)
+            response = self._session.patch(url, headers=headers, json=payload, timeout=10)
             
             if response.status_code == 204:
                 print(f'Repository variable {variable_name} updated successfully')
@@ -218,7 +225,7 @@ class GitHubService:
             elif response.status_code == 404:
                 # Variable doesn't exist, create it (POST)
                 create_url = f'https://api.github.com/repos/{owner}/{repo}/actions/variables'
-                response = requests.post(create_url, headers=headers, json=payload, timeout=10)
+                response = self._session.post(create_url, headers=headers, json=payload, timeout=10)
                 
                 if response.status_code == 201:
                     print(f'Repository variable {variable_name} created successfully')
@@ -246,6 +253,21 @@ class GitHubService:
                 'message': f'Error: {str(e)}'
             }
     
+    def _get_secrets_public_key(self, repo_name, headers):
+        """Return (public key data, status code) for the repo's Actions secrets; data is None on failure."""
+        pub_key_data = self._secrets_public_keys.get(repo_name)
+        if pub_key_data is not None:
+            return pub_key_data, 200
+        
+        owner, repo = repo_name.split('/')
+        pub_key_url = f'https://api.github.com/repos/{owner}/{repo}/actions/secrets/public-key'
+        response = self._session.get(pub_key_url, headers=headers, timeout=10)
+        if response.status_code != 200:
+            return None, response.status_code
+        
+        pub_key_data = self._secrets_public_keys[repo_name] = response.json()
+        return pub_key_data, 200
+    
     def update_repo_secret(self, secret_name, secret_value, repo_name='gcolon75/Project-Valine'):
         """
         Update or create a repository secret.
@@ -260,7 +282,6 @@ class GitHubService:
             dict with 'success' (bool) and 'message' (str)
         """
         try:
-            import requests
             from nacl import encoding, public
             
             owner, repo = repo_name.split('/')
@@ -270,18 +291,15 @@ class GitHubService:
                 'Accept': 'application/vnd.github.v3+json'
             }
             
-            # Get the repository's public key
-            pub_key_url = f'https://api.github.com/repos/{owner}/{repo}/actions/secrets/public-key'
-            pub_key_response = requests.get(pub_key_url, headers=headers, timeout=10)
-            
-            if pub_key_response.status_code != 200:
-                print(f'Failed to get public key: {pub_key_response.status_code}')
+            # Get the repository's public key (cached after the first lookup)
+            pub_key_data, status_code = self._get_secrets_public_key(repo_name, headers)
+            if pub_key_data is None:
+                print(f'Failed to get public key: {status_code}')
                 return {
                     'success': False,
-                    'message': f'Failed to get repository public key (status {pub_key_response.status_code})'
+                    'message': f'Failed to get repository public key (status {status_code})'
                 }
             
-            pub_key_data = pub_key_response.json()
             public_key = pub_key_data['key']
             key_id = pub_key_data['key_id']
             
@@ -298,7 +316,7 @@ class GitHubService:
                 'key_id': key_id
             }
             
-            response = requests.put(secret_url, headers=headers, json=payload, timeout=10)
+            response = self._session.put(secret_url, headers=headers, json=payload, timeout=10)
             
             if response.status_code in [201, 204]:
                 print(f'Repository secret {secret_name} updated successfully')
@@ -307,6 +325,8 @@ class GitHubService:
                     'message': f'Secret {secret_name} updated successfully'
                 }
             else:
+                # The key may have been rotated; fetch it again next time
+                self._secrets_public_keys.pop(repo_name, None)
                 print(f'Failed to update secret: {response.status_code} - {response.text}')
                 return {
                     'success': False,
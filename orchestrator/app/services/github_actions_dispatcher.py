@@ -7,22 +7,52 @@ import re
 import json
 import time
 import uuid
+import threading
 import requests
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from github import GithubException
 
 
+def _as_utc(dt):
+    """Return dt as a timezone-aware UTC datetime (naive values are treated as UTC)."""
+    if dt is not None and dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _rate_limit_delay(exc, default):
+    """Seconds to wait after a rate-limited GitHub response, honoring Retry-After / X-RateLimit-Reset."""
+    headers = {k.lower(): v for k, v in (exc.headers or {}).items()}
+    try:
+        if headers.get('retry-after'):
+            return float(headers['retry-after'])
+        if headers.get('x-ratelimit-remaining') == '0' and headers.get('x-ratelimit-reset'):
+            return max(0.0, float(headers['x-ratelimit-reset']) - time.time())
+    except ValueError:
+        pass
+    return default
+
+
 class GitHubActionsDispatcher:
     """Dispatches and monitors GitHub Actions workflow runs."""
 
-    def __init__(self, github_service):
+    def __init__(self, github_service, runs_cache_ttl=10, runs_cache_size=64):
         """
         Initialize with a GitHub service instance.
 
         Args:
             github_service: Instance of GitHubService
+            runs_cache_ttl: Seconds list_workflow_runs results stay cached (0 disables)
+            runs_cache_size: Max cached list_workflow_runs queries
         """
         self.github_service = github_service
+        
+        # Short-lived cache so bursts of /status calls share GitHub queries
+        self.runs_cache_ttl = runs_cache_ttl
+        self.runs_cache_size = runs_cache_size
+        self._runs_cache = OrderedDict()
+        self._runs_cache_lock = threading.Lock()
         self.repo_name = os.environ.get('GITHUB_REPO', 'gcolon75/Project-Valine')
         self.token = github_service.token
         self.base_url = 'https://api.github.com'
@@ -184,9 +214,9 @@ class GitHubActionsDispatcher:
                 if 'Diagnose' in workflow.name:
                     runs = workflow.get_runs()
                     for run in runs:
-                        # Check if run is recent enough
-                        if run.created_at < cutoff_time:
-                            continue
+                        # Runs come back newest first; stop at the first one past the window
+                        if _as_utc(run.created_at) < cutoff_time:
+                            break
 
                         # Check if correlation_id is in run name
                         if correlation_id in run.name:
@@ -451,7 +481,8 @@ class GitHubActionsDispatcher:
             print(f'Error getting workflow by name: {str(e)}')
             return None
 
-    def list_workflow_runs(self, workflow_name, branch='main', count=3):
+    def list_workflow_runs(self, workflow_name, branch='main', count=3, created=None, event=None,
+                           created_since=None):
         """
         List recent runs for a workflow.
 
@@ -459,27 +490,47 @@ class GitHubActionsDispatcher:
             workflow_name: Name of the workflow
             branch: Branch to filter by (default: main)
             count: Number of runs to retrieve (default: 3, max: 100)
+            created: GitHub date filter, e.g. '>=2025-01-01' (optional)
+            event: Triggering event to filter by, e.g. 'workflow_dispatch' (optional)
+            created_since: datetime cutoff; shorthand for created='>=<UTC timestamp>' (optional)
 
         Returns:
-            list of workflow run dicts with relevant info, or empty list on error
+            list of workflow run dicts with relevant info (newest first, as
+            returned by GitHub), or empty list on error
         """
+        if created_since and not created:
+            created = f'>={_as_utc(created_since):%Y-%m-%dT%H:%M:%SZ}'
+        cache_key = (workflow_name, branch, count, created, event)
+        cached = self._get_cached_runs(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             workflow = self.get_workflow_by_name(workflow_name)
             if not workflow:
                 return []
 
-            # Get runs for the workflow on the specified branch
-            runs = workflow.get_runs(branch=branch)
+            # Filter server-side so GitHub only returns relevant runs
+            filters = {'branch': branch}
+            if created:
+                filters['created'] = created
+            if event:
+                filters['event'] = event
+            runs = workflow.get_runs(**filters)
             
             result = []
             for i, run in enumerate(runs):
                 if i >= count:
                     break
                 
+                # Normalize once so consumers can compare against aware datetimes directly
+                created_at = _as_utc(run.created_at)
+                updated_at = _as_utc(run.updated_at)
+                
                 # Calculate duration if completed
                 duration_seconds = None
-                if run.status == 'completed' and run.created_at and run.updated_at:
-                    duration = run.updated_at - run.created_at
+                if run.status == 'completed' and created_at and updated_at:
+                    duration = updated_at - created_at
                     duration_seconds = int(duration.total_seconds())
                 
                 result.append({
@@ -488,13 +539,14 @@ class GitHubActionsDispatcher:
                     'status': run.status,
                     'conclusion': run.conclusion,
                     'html_url': run.html_url,
-                    'created_at': run.created_at,
-                    'updated_at': run.updated_at,
+                    'created_at': created_at,
+                    'updated_at': updated_at,
                     'duration_seconds': duration_seconds,
                     'event': run.event,
                     'head_sha': run.head_sha[:7] if run.head_sha else None
                 })
             
+            self._cache_runs(cache_key, result)
             return result
 
         except GithubException as e:
@@ -504,6 +556,29 @@ class GitHubActionsDispatcher:
             print(f'Unexpected error listing workflow runs: {str(e)}')
             return []
 
+    def _get_cached_runs(self, key):
+        """Return a cached list_workflow_runs result if still fresh, else None."""
+        with self._runs_cache_lock:
+            record = self._runs_cache.get(key)
+            if record is None:
+                return None
+            runs, expires_at = record
+            if expires_at <= time.monotonic():
+                del self._runs_cache[key]
+                return None
+            self._runs_cache.move_to_end(key)
+            return runs
+
+    def _cache_runs(self, key, runs):
+        """Cache a list_workflow_runs result, evicting least recently used entries."""
+        if self.runs_cache_ttl <= 0:
+            return
+        with self._runs_cache_lock:
+            self._runs_cache[key] = (runs, time.monotonic() + self.runs_cache_ttl)
+            self._runs_cache.move_to_end(key)
+            while len(self._runs_cache) > self.runs_cache_size:
+                self._runs_cache.popitem(last=False)
+
     def trigger_client_deploy(self, correlation_id, requester, api_base=''):
         """
         Trigger Client Deploy workflow via workflow_dispatch.
@@ -729,15 +804,12 @@ class GitHubActionsDispatcher:
             cutoff_time = datetime.now(timezone.utc) - timedelta(seconds=max_age_seconds)
             runs = workflow.get_runs()
 
-            for run in runs:
-                # Ensure timezone-aware comparison
-                run_created = run.created_at
-                if run_created.tzinfo is None:
-                    run_created = run_created.replace(tzinfo=timezone.utc)
-                
-                if run_created >= cutoff_time:
-                    print(f'Found recent run {run.id} for workflow "{workflow_name}"')
-                    return run
+            # Runs come back newest first, so only the first one can qualify;
+            # stopping here avoids paging through the workflow's whole history
+            run = next(iter(runs), None)
+            if run is not None and _as_utc(run.created_at) >= cutoff_time:
+                print(f'Found recent run {run.id} for workflow "{workflow_name}"')
+                return run
 
             print(f'No recent run found for workflow "{workflow_name}"')
             return None
@@ -746,7 +818,8 @@ class GitHubActionsDispatcher:
             print(f'Error finding recent run: {str(e)}')
             return None
 
-    def find_run_by_correlation(self, correlation_id, workflow_name='Client Deploy', max_age_minutes=5):
+    def find_run_by_correlation(self, correlation_id, workflow_name='Client Deploy', max_age_minutes=5,
+                                fallback_to_recent=True):
         """
         Find a workflow run by correlation_id in the run name.
 
@@ -754,6 +827,7 @@ class GitHubActionsDispatcher:
             correlation_id: Correlation ID to search for
             workflow_name: Name of the workflow (default: 'Client Deploy')
             max_age_minutes: Maximum age of runs to search (default: 5)
+            fallback_to_recent: Return the most recent run when no run matches (default: True)
 
         Returns:
             Workflow run object or None if not found
@@ -769,20 +843,19 @@ class GitHubActionsDispatcher:
             runs = workflow.get_runs()
 
             for run in runs:
-                # Ensure timezone-aware comparison
-                run_created = run.created_at
-                if run_created.tzinfo is None:
-                    run_created = run_created.replace(tzinfo=timezone.utc)
-                
-                # Check if run is recent enough
-                if run_created < cutoff_time:
-                    continue
+                # Runs come back newest first, so everything after this one is older too
+                if _as_utc(run.created_at) < cutoff_time:
+                    break
 
                 # Check if correlation_id is in run name
                 if correlation_id in run.name:
                     print(f'Found run {run.id} for correlation_id: {correlation_id}')
                     return run
 
+            if not fallback_to_recent:
+                print(f'No run found for correlation_id: {correlation_id}')
+                return None
+
             print(f'No run found for correlation_id: {correlation_id}, falling back to most recent')
             # Fallback to most recent run on main
             return self.find_recent_run_for_workflow(workflow_name, max_age_seconds=max_age_minutes*60)
@@ -807,12 +880,19 @@ class GitHubActionsDispatcher:
         retries = 0
         max_retries = 2
 
+        run = None
+
         print(f'Polling for run completion: {run_id}')
 
         while time.time() - start_time < timeout_seconds:
             try:
-                # Get the run
-                run = self.github_service.get_repository(self.repo_name).get_workflow_run(run_id)
+                # Fetch the run once, then refresh it with conditional requests
+                # (If-None-Match on the stored ETag). A 304 has no body and
+                # does not count against the rate limit.
+                if run is None:
+                    run = self.github_service.get_repository(self.repo_name).get_workflow_run(run_id)
+                elif not run.update():
+                    print(f'Run {run.id} unchanged (304)')
 
                 if run.status == 'completed':
                     print(f'Run {run.id} completed with conclusion: {run.conclusion}')
@@ -830,11 +910,14 @@ class GitHubActionsDispatcher:
 
             except GithubException as e:
                 if e.status == 403 or e.status == 429:
-                    # Rate limit, back off
-                    if retries < max_retries:
+                    # Rate limit, back off until GitHub says we may retry; give up
+                    # early if that is past our deadline
+                    delay = _rate_limit_delay(e, poll_interval * 2)
+                    remaining = timeout_seconds - (time.time() - start_time)
+                    if retries < max_retries and delay < remaining:
                         retries += 1
-                        print(f'Rate limit hit (status {e.status}), retry {retries}/{max_retries}')
-                        time.sleep(poll_interval * 2)
+                        print(f'Rate limit hit (status {e.status}), retry {retries}/{max_retries} in {delay:.0f}s')
+                        time.sleep(delay)
                     else:
                         print(f'Rate limit exceeded after {max_retries} retries')
                         return {
@@ -850,10 +933,11 @@ class GitHubActionsDispatcher:
 
         # Timed out
         print(f'Polling timed out after {timeout_seconds} seconds')
-        try:
-            run = self.github_service.get_repository(self.repo_name).get_workflow_run(run_id)
-        except:
-            run = None
+        if run is None:
+            try:
+                run = self.github_service.get_repository(self.repo_name).get_workflow_run(run_id)
+            except:
+                run = None
         
         return {
             'completed': False,
@@ -6,6 +6,7 @@ import os
 import time
 import json
 import statistics
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from verification.http_checker import HTTPChecker
@@ -38,55 +39,21 @@ class HealthSnapshot:
             'summary': {}
         }
         
-        # Check frontend endpoints
+        # Frontend and API checks are independent network calls; run them concurrently
+        checks = {}
         if self.frontend_base_url:
-            frontend_results = self.http_checker.check_frontend(self.frontend_base_url)
-            latencies = []
-            errors = 0
-            total = 0
-            
-            for endpoint, result in frontend_results.get('endpoints', {}).items():
-                total += 1
-                if result.get('success'):
-                    if result.get('response_time_ms'):
-                        latencies.append(result['response_time_ms'])
-                else:
-                    errors += 1
-            
-            metrics['frontend'] = {
-                'base_url': self.frontend_base_url,
-                'total_checks': total,
-                'errors': errors,
-                'success_rate': round((total - errors) / total * 100, 1) if total > 0 else 0,
-                'latency_p50': round(statistics.median(latencies), 1) if latencies else None,
-                'latency_p95': round(statistics.quantiles(latencies, n=20)[18], 1) if len(latencies) > 1 else (latencies[0] if latencies else None),
-                'latency_avg': round(statistics.mean(latencies), 1) if latencies else None
-            }
-        
-        # Check API endpoints
+            checks['frontend'] = (self.http_checker.check_frontend, self.frontend_base_url)
         if self.api_base_url:
-            api_results = self.http_checker.check_api(self.api_base_url)
-            latencies = []
-            errors = 0
-            total = 0
-            
-            for endpoint, result in api_results.get('endpoints', {}).items():
-                total += 1
-                if result.get('success'):
-                    if result.get('response_time_ms'):
-                        latencies.append(result['response_time_ms'])
-                else:
-                    errors += 1
-            
-            metrics['api'] = {
-                'base_url': self.api_base_url,
-                'total_checks': total,
-                'errors': errors,
-                'success_rate': round((total - errors) / total * 100, 1) if total > 0 else 0,
-                'latency_p50': round(statistics.median(latencies), 1) if latencies else None,
-                'latency_p95': round(statistics.quantiles(latencies, n=20)[18], 1) if len(latencies) > 1 else (latencies[0] if latencies else None),
-                'latency_avg': round(statistics.mean(latencies), 1) if latencies else None
-            }
+            checks['api'] = (self.http_checker.check_api, self.api_base_url)
+        
+        if checks:
+            with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+                futures = {
+                    name: executor.submit(check, base_url)
+                    for name, (check, base_url) in checks.items()
+                }
+                for name, future in futures.items():
+                    metrics[name] = self._summarize_checks(checks[name][1], future.result())
         
         # Overall summary
         total_checks = metrics['frontend'].get('total_checks', 0) + metrics['api'].get('total_checks', 0)
@@ -101,6 +68,42 @@ class HealthSnapshot:
         
         return metrics
     
+    def _summarize_checks(self, base_url: str, results: Dict) -> Dict:
+        """
+        Summarize HTTPChecker results for one base URL.
+        
+        Args:
+            base_url: Base URL that was checked
+            results: Result of check_frontend/check_api
+            
+        Returns:
+            Dictionary with check counts, success rate, and latency stats
+        """
+        latencies = []
+        latency_sum = 0
+        errors = 0
+        total = 0
+        
+        for result in results.get('endpoints', {}).values():
+            total += 1
+            if result.get('success'):
+                response_time = result.get('response_time_ms')
+                if response_time:
+                    latencies.append(response_time)
+                    latency_sum += response_time
+            else:
+                errors += 1
+        
+        return {
+            'base_url': base_url,
+            'total_checks': total,
+            'errors': errors,
+            'success_rate': round((total - errors) / total * 100, 1) if total > 0 else 0,
+            'latency_p50': round(statistics.median(latencies), 1) if latencies else None,
+            'latency_p95': round(statistics.quantiles(latencies, n=20)[18], 1) if len(latencies) > 1 else (latencies[0] if latencies else None),
+            'latency_avg': round(latency_sum / len(latencies), 1) if latencies else None
+        }
+    
     def create_status_embed(self, metrics: Dict, trend_data: Optional[Dict] = None) -> Dict:
         """
         Create Discord embed for status report.
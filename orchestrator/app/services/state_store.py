@@ -5,9 +5,41 @@ Supports Redis and Postgres backends with automatic failover.
 import os
 import json
 import time
+from collections import OrderedDict
 from typing import Any, Dict, Optional
 from datetime import datetime, timedelta
 
+# Try to import orjson for faster (de)serialization, fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+class StateStoreError(Exception):
+    """Raised when a check-and-set update fails in the backend."""
+
+
+def _matches(value: Dict[str, Any], expected: Optional[Dict[str, Any]]) -> bool:
+    """Check that a stored dict has every expected field value."""
+    return not expected or all(value.get(k) == v for k, v in expected.items())
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a value to a JSON string."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value).decode('utf-8')
+    return json.dumps(value)
+
+
+def _loads(serialized: str) -> Any:
+    """Deserialize a JSON string."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(serialized)
+    return json.loads(serialized)
+
 
 class StateStore:
     """
@@ -15,16 +47,24 @@ class StateStore:
     and release tracking across Discord interactions.
     """
     
-    def __init__(self, backend='auto'):
+    def __init__(self, backend='auto', read_cache_size=100, read_cache_ttl=5):
         """
         Initialize state store with specified backend.
         
         Args:
             backend: 'redis', 'postgres', or 'auto' (auto-detect)
+            read_cache_size: Max entries in the in-process read cache (0 disables)
+            read_cache_ttl: Seconds a cached read stays valid
         """
         self.backend_type = backend
         self.backend = None
         
+        # Small LRU in front of remote backends to absorb burst reads
+        # (e.g. several button clicks on the same deploy_id)
+        self.read_cache_size = read_cache_size
+        self.read_cache_ttl = read_cache_ttl
+        self._read_cache = OrderedDict()
+        
         if backend == 'auto':
             self._auto_detect_backend()
         elif backend == 'redis':
@@ -155,7 +195,7 @@ class StateStore:
             True if successful
         """
         try:
-            serialized = json.dumps(value)
+            serialized = _dumps(value)
             
             if self.backend_type == 'redis':
                 if ttl:
@@ -187,27 +227,38 @@ class StateStore:
                 expiry = time.time() + ttl if ttl else None
                 self.backend[key] = {'value': serialized, 'expiry': expiry}
             
+            self._cache_set(key, serialized, ttl)
             return True
             
         except Exception as e:
             print(f'Error storing key {key}: {e}')
             return False
     
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: str, fresh: bool = False) -> Optional[Any]:
         """
         Retrieve a value by key.
         
         Args:
             key: Storage key
+            fresh: Skip the read cache and read the backend (use before a
+                state transition; other replicas may have changed the key)
             
         Returns:
             Deserialized value or None if not found/expired
         """
         try:
+            if fresh:
+                self._read_cache.pop(key, None)
+            else:
+                cached = self._cache_get(key)
+                if cached is not None:
+                    return _loads(cached)
+            
             if self.backend_type == 'redis':
                 serialized = self.backend.get(key)
                 if serialized:
-                    return json.loads(serialized)
+                    self._cache_set(key, serialized)
+                    return _loads(serialized)
                     
             elif self.backend_type == 'postgres':
                 cursor = self.backend.cursor()
@@ -222,7 +273,8 @@ class StateStore:
                     )
                     row = cursor.fetchone()
                     if row:
-                        return json.loads(row[0])
+                        self._cache_set(key, row[0])
+                        return _loads(row[0])
                 finally:
                     cursor.close()
                     
@@ -230,7 +282,7 @@ class StateStore:
                 record = self.backend.get(key)
                 if record:
                     if record['expiry'] is None or record['expiry'] > time.time():
-                        return json.loads(record['value'])
+                        return _loads(record['value'])
                     else:
                         # Clean up expired entry
                         del self.backend[key]
@@ -241,6 +293,178 @@ class StateStore:
             print(f'Error retrieving key {key}: {e}')
             return None
     
+    def put_if_absent(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """
+        Store a value only if the key does not already exist.
+        
+        Args:
+            key: Storage key
+            value: Value to store (will be JSON-serialized)
+            ttl: Time-to-live in seconds (optional)
+            
+        Returns:
+            True if the value was stored, False if the key already existed
+        """
+        try:
+            serialized = _dumps(value)
+            
+            if self.backend_type == 'redis':
+                stored = bool(self.backend.set(key, serialized, nx=True, ex=ttl))
+                
+            elif self.backend_type == 'postgres':
+                expires_at = None
+                if ttl:
+                    expires_at = datetime.now() + timedelta(seconds=ttl)
+                
+                cursor = self.backend.cursor()
+                try:
+                    # Expired rows may not have been cleaned up yet; take them over
+                    cursor.execute(
+                        """
+                        INSERT INTO orchestrator_state (key, value, expires_at)
+                        VALUES (%s, %s, %s)
+                        ON CONFLICT (key)
+                        DO UPDATE SET value = EXCLUDED.value, expires_at = EXCLUDED.expires_at,
+                                      updated_at = CURRENT_TIMESTAMP
+                        WHERE orchestrator_state.expires_at IS NOT NULL
+                        AND orchestrator_state.expires_at <= CURRENT_TIMESTAMP
+                        """,
+                        (key, serialized, expires_at)
+                    )
+                    stored = cursor.rowcount == 1
+                    self.backend.commit()
+                finally:
+                    cursor.close()
+                    
+            else:  # memory
+                record = self.backend.get(key)
+                stored = not record or (record['expiry'] is not None and record['expiry'] <= time.time())
+                if stored:
+                    expiry = time.time() + ttl if ttl else None
+                    self.backend[key] = {'value': serialized, 'expiry': expiry}
+            
+            if stored:
+                self._cache_set(key, serialized, ttl)
+            else:
+                # Another writer owns the key; don't serve our older copy
+                self._read_cache.pop(key, None)
+            return stored
+            
+        except Exception as e:
+            print(f'Error storing key {key}: {e}')
+            return False
+    
+    def update(self, key: str, fields: Dict[str, Any], ttl: Optional[int] = None,
+               expected: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Merge fields into an existing dict value without a separate read.
+        
+        Redis uses WATCH/MULTI and Postgres a single jsonb merge, so
+        concurrent updates to the same key do not overwrite each other.
+        
+        Args:
+            key: Storage key
+            fields: Fields to set on the stored dict
+            ttl: New time-to-live in seconds (optional, keeps current expiry if omitted)
+            expected: Only update if the stored dict has these field values
+                (atomic check-and-set, e.g. {'status': 'initiated'})
+            
+        Returns:
+            The updated value, or None if the key was not found/expired or
+            did not match expected
+            
+        Raises:
+            StateStoreError: On backend failure when expected is given, so a
+                failed check-and-set is not mistaken for a lost race
+        """
+        # Drop the cached copy up front so a missing/expired key isn't served
+        # from cache; a successful merge caches the backend's result below
+        self._read_cache.pop(key, None)
+        
+        try:
+            if self.backend_type == 'redis':
+                import redis
+                
+                with self.backend.pipeline() as pipe:
+                    while True:
+                        try:
+                            pipe.watch(key)
+                            serialized = pipe.get(key)
+                            if not serialized:
+                                pipe.unwatch()
+                                return None
+                            
+                            value = _loads(serialized)
+                            if not _matches(value, expected):
+                                pipe.unwatch()
+                                return None
+                            value.update(fields)
+                            serialized = _dumps(value)
+                            
+                            pipe.multi()
+                            if ttl:
+                                pipe.setex(key, ttl, serialized)
+                            else:
+                                pipe.set(key, serialized, keepttl=True)
+                            pipe.execute()
+                            break
+                        except redis.WatchError:
+                            continue
+                            
+            elif self.backend_type == 'postgres':
+                expires_at = None
+                if ttl:
+                    expires_at = datetime.now() + timedelta(seconds=ttl)
+                
+                cursor = self.backend.cursor()
+                try:
+                    cursor.execute(
+                        """
+                        UPDATE orchestrator_state
+                        SET value = (value::jsonb || %s::jsonb)::text,
+                            expires_at = COALESCE(%s, expires_at),
+                            updated_at = CURRENT_TIMESTAMP
+                        WHERE key = %s
+                        AND (expires_at IS NULL OR expires_at > CURRENT_TIMESTAMP)
+                        AND value::jsonb @> %s::jsonb
+                        RETURNING value
+                        """,
+                        (_dumps(fields), expires_at, key, _dumps(expected or {}))
+                    )
+                    row = cursor.fetchone()
+                    self.backend.commit()
+                finally:
+                    cursor.close()
+                
+                if not row:
+                    return None
+                serialized = row[0]
+                value = _loads(serialized)
+                
+            else:  # memory
+                record = self.backend.get(key)
+                if not record or (record['expiry'] is not None and record['expiry'] <= time.time()):
+                    self.backend.pop(key, None)
+                    return None
+                
+                value = _loads(record['value'])
+                if not _matches(value, expected):
+                    return None
+                value.update(fields)
+                serialized = _dumps(value)
+                record['value'] = serialized
+                if ttl:
+                    record['expiry'] = time.time() + ttl
+            
+            self._cache_set(key, serialized, ttl)
+            return value
+            
+        except Exception as e:
+            print(f'Error updating key {key}: {e}')
+            if expected:
+                raise StateStoreError(f'Error updating key {key}: {e}') from e
+            return None
+    
     def delete(self, key: str) -> bool:
         """
         Delete a key.
@@ -251,6 +475,8 @@ class StateStore:
         Returns:
             True if successful
         """
+        self._read_cache.pop(key, None)
+        
         try:
             if self.backend_type == 'redis':
                 self.backend.delete(key)
@@ -273,6 +499,32 @@ class StateStore:
             print(f'Error deleting key {key}: {e}')
             return False
     
+    def _cache_get(self, key: str) -> Optional[str]:
+        """Return the cached serialized value for key if still fresh."""
+        record = self._read_cache.get(key)
+        if record is None:
+            return None
+        
+        serialized, expiry = record
+        if expiry <= time.monotonic():
+            del self._read_cache[key]
+            return None
+        
+        self._read_cache.move_to_end(key)
+        return serialized
+    
+    def _cache_set(self, key: str, serialized: str, ttl: Optional[int] = None):
+        """Store a serialized value in the read cache (remote backends only)."""
+        if self.backend_type == 'memory' or self.read_cache_size <= 0:
+            return
+        
+        cache_ttl = min(self.read_cache_ttl, ttl) if ttl else self.read_cache_ttl
+        self._read_cache[key] = (serialized, time.monotonic() + cache_ttl)
+        self._read_cache.move_to_end(key)
+        
+        while len(self._read_cache) > self.read_cache_size:
+            self._read_cache.popitem(last=False)
+    
     def cleanup_expired(self) -> int:
         """
         Clean up expired entries (Postgres only, Redis auto-expires).
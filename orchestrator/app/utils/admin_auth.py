@@ -3,7 +3,17 @@ Admin authorization utility with feature flags and allowlists.
 Enforces strict access control for sensitive operations.
 """
 import os
+import time
 import hashlib
+import threading
+
+# Per-user token buckets for secret/variable writes, shared by every
+# AdminAuthenticator in the process: a burst of ADMIN_WRITE_BURST writes,
+# then one more every ADMIN_WRITE_REFILL_SECONDS
+ADMIN_WRITE_BURST = 5
+ADMIN_WRITE_REFILL_SECONDS = 10
+_write_buckets = {}
+_write_buckets_lock = threading.Lock()
 
 
 class AdminAuthenticator:
@@ -28,7 +38,7 @@ class AdminAuthenticator:
         
         Args:
             user_id: Discord user ID
-            role_ids: List of Discord role IDs for the user
+            role_ids: Discord role IDs for the user (any iterable of str)
             
         Returns:
             bool: True if user is admin, False otherwise
@@ -38,10 +48,8 @@ class AdminAuthenticator:
             return True
         
         # Check role IDs
-        if role_ids and self.admin_role_ids:
-            user_role_set = set(role_ids)
-            if self.admin_role_ids & user_role_set:
-                return True
+        if role_ids and not self.admin_role_ids.isdisjoint(role_ids):
+            return True
         
         return False
     
@@ -60,7 +68,7 @@ class AdminAuthenticator:
         
         Args:
             user_id: Discord user ID
-            role_ids: List of Discord role IDs for the user
+            role_ids: Discord role IDs for the user (any iterable of str)
             requires_secret_write: Whether this action requires secret write permission
             
         Returns:
@@ -85,6 +93,30 @@ class AdminAuthenticator:
             'message': 'Authorized'
         }
     
+    @staticmethod
+    def consume_write_token(user_id):
+        """
+        Take one token from the user's write bucket.
+        
+        Call right before the GitHub write so rejected requests (no confirm,
+        invalid input) don't use up the budget.
+        
+        Args:
+            user_id: Discord user ID
+            
+        Returns:
+            bool: True if the write may proceed, False if the user is rate limited
+        """
+        now = time.monotonic()
+        with _write_buckets_lock:
+            tokens, last = _write_buckets.get(user_id, (ADMIN_WRITE_BURST, now))
+            tokens = min(ADMIN_WRITE_BURST, tokens + (now - last) / ADMIN_WRITE_REFILL_SECONDS)
+            if tokens < 1:
+                _write_buckets[user_id] = (tokens, now)
+                return False
+            _write_buckets[user_id] = (tokens - 1, now)
+            return True
+    
     @staticmethod
     def get_value_fingerprint(value):
         """
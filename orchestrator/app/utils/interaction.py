@@ -0,0 +1,11 @@
+"""
+Helpers for reading Discord interaction payloads.
+"""
+
+
+def interaction_user(interaction, default_id=''):
+    """Return (user_id, display name, role ids) for the interaction's invoking user."""
+    member = interaction.get('member') or {}
+    user = member.get('user') or interaction.get('user') or {}
+    user_id = user.get('id') or default_id
+    return user_id, user.get('username') or user_id or 'unknown', member.get('roles') or []
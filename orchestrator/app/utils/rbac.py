@@ -22,7 +22,13 @@ class PermissionMatrix:
         
         # Load admin role IDs from environment
         admin_roles_str = os.getenv('ADMIN_ROLE_IDS', '')
-        self.admin_role_ids = [r.strip() for r in admin_roles_str.split(',') if r.strip()]
+        self.admin_role_ids = frozenset(r.strip() for r in admin_roles_str.split(',') if r.strip())
+        
+        # Role allowlists as sets, built once, so checks don't rescan lists per role
+        self._allowed_role_ids = {
+            cmd: frozenset(config.get('allowedRoleIds') or ())
+            for cmd, config in self.matrix.get('commands', {}).items()
+        }
     
     def _load_matrix(self) -> Dict[str, Any]:
         """Load permission matrix from JSON file"""
@@ -48,7 +54,7 @@ class PermissionMatrix:
         Args:
             command: Command name (e.g., '/deploy-client')
             user_id: Discord user ID
-            user_role_ids: List of Discord role IDs the user has
+            user_role_ids: Discord role IDs the user has (any iterable of str)
         
         Returns:
             Tuple of (is_allowed, error_message)
@@ -79,7 +85,7 @@ class PermissionMatrix:
         user_role_ids = user_role_ids or []
         
         # Check if user is admin (global override)
-        if any(role_id in self.admin_role_ids for role_id in user_role_ids):
+        if not self.admin_role_ids.isdisjoint(user_role_ids):
             return True, None
         
         # Check allowed user IDs
@@ -88,7 +94,7 @@ class PermissionMatrix:
             return True, None
         
         # Check allowed role IDs
-        allowed_role_ids = command_config.get('allowedRoleIds', [])
+        allowed_role_ids = self._allowed_role_ids[command]
         
         # If both allowedRoleIds and allowedUserIds are empty, deny access
         # (requiresAuth=true but no one is explicitly allowed)
@@ -98,7 +104,7 @@ class PermissionMatrix:
             return True, None
         
         # Check if user has any of the allowed roles
-        if allowed_role_ids and any(role_id in allowed_role_ids for role_id in user_role_ids):
+        if allowed_role_ids and not allowed_role_ids.isdisjoint(user_role_ids):
             return True, None
         
         # User is not authorized
@@ -6,7 +6,7 @@ import re
 import os
 from datetime import datetime
 from github import GithubException
-from config.verification_config import WORKFLOW_NAME, TARGET_BRANCH, STEP_PATTERNS
+from config.verification_config import CONFIG
 
 
 class GitHubActionsVerifier:
@@ -27,14 +27,14 @@ class GitHubActionsVerifier:
         Get the latest workflow run for the specified workflow.
 
         Args:
-            workflow_name: Workflow name (default: WORKFLOW_NAME from config)
-            branch: Branch name (default: TARGET_BRANCH from config)
+            workflow_name: Workflow name (default: CONFIG.workflow_name)
+            branch: Branch name (default: CONFIG.target_branch)
 
         Returns:
             Workflow run object or None if not found
         """
-        workflow_name = workflow_name or WORKFLOW_NAME
-        branch = branch or TARGET_BRANCH
+        workflow_name = workflow_name or CONFIG.workflow_name
+        branch = branch or CONFIG.target_branch
 
         try:
             repo = self.github_service.get_repository(self.repo_name)
@@ -159,8 +159,8 @@ class GitHubActionsVerifier:
                 step_name = step.name
 
                 # Match against patterns
-                for key, pattern in STEP_PATTERNS.items():
-                    if re.search(pattern, step_name):
+                for key, pattern in CONFIG.step_patterns:
+                    if pattern.search(step_name):
                         # Calculate duration
                         duration = self._calculate_duration(step)
                         if duration is not None:
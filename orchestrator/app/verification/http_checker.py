@@ -2,17 +2,9 @@
 HTTP health checker for frontend and API endpoints.
 Performs HTTP checks with timeouts and retries.
 """
-import re
 import time
 import requests
-from config.verification_config import (
-    HTTP_TIMEOUT_SECONDS,
-    HTTP_MAX_RETRIES,
-    HTTP_RETRY_DELAY_SECONDS,
-    FRONTEND_ENDPOINTS,
-    API_ENDPOINTS,
-    EXPECTED_CACHE_CONTROL_PATTERN
-)
+from config.verification_config import CONFIG
 
 
 class HTTPChecker:
@@ -26,8 +18,8 @@ class HTTPChecker:
             timeout: Request timeout in seconds (default: from config)
             max_retries: Maximum number of retries (default: from config)
         """
-        self.timeout = timeout or HTTP_TIMEOUT_SECONDS
-        self.max_retries = max_retries or HTTP_MAX_RETRIES
+        self.timeout = timeout or CONFIG.http_timeout
+        self.max_retries = max_retries or CONFIG.http_max_retries
 
     def check_endpoint(self, base_url, endpoint, method='GET'):
         """
@@ -61,6 +53,13 @@ class HTTPChecker:
                         timeout=self.timeout,
                         allow_redirects=True
                     )
+                    # Some servers don't implement HEAD; fall back to GET
+                    if response.status_code in (405, 501):
+                        response = requests.get(
+                            url,
+                            timeout=self.timeout,
+                            allow_redirects=True
+                        )
                 else:
                     response = requests.get(
                         url,
@@ -87,7 +86,7 @@ class HTTPChecker:
 
             # Retry with delay if not last attempt
             if attempt < self.max_retries:
-                time.sleep(HTTP_RETRY_DELAY_SECONDS)
+                time.sleep(CONFIG.http_retry_delay)
 
         return result
 
@@ -117,7 +116,7 @@ class HTTPChecker:
             'all_success': True
         }
 
-        for endpoint in FRONTEND_ENDPOINTS:
+        for endpoint in CONFIG.frontend_endpoints:
             check_result = self.check_endpoint(frontend_base_url, endpoint)
             results['endpoints'][endpoint] = check_result
 
@@ -152,7 +151,7 @@ class HTTPChecker:
             'all_success': True
         }
 
-        for endpoint in API_ENDPOINTS:
+        for endpoint in CONFIG.api_endpoints:
             check_result = self.check_endpoint(api_base_url, endpoint)
             results['endpoints'][endpoint] = check_result
 
@@ -176,7 +175,7 @@ class HTTPChecker:
         if not cache_control:
             return False, None
 
-        is_valid = bool(re.search(EXPECTED_CACHE_CONTROL_PATTERN, cache_control))
+        is_valid = bool(CONFIG.cache_control_pattern.search(cache_control))
         return is_valid, cache_control
 
     def format_status_code(self, status_code):
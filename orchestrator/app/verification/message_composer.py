@@ -2,7 +2,7 @@
 Message composer for Discord verification results.
 Creates formatted one-liner summaries and detailed checklists.
 """
-from config.verification_config import COLOR_SUCCESS, COLOR_FAILURE
+from config.verification_config import CONFIG
 
 
 class MessageComposer:
@@ -42,7 +42,7 @@ class MessageComposer:
         embed = {
             'title': '✅ Deploy Verification' if all_success else '❌ Deploy Verification',
             'description': '\n'.join(checklist_lines),
-            'color': COLOR_SUCCESS if all_success else COLOR_FAILURE,
+            'color': CONFIG.color_success if all_success else CONFIG.color_failure,
             'fields': [],
             'footer': {
                 'text': f"Run ID: {run_info.get('run_id', 'unknown')}"
@@ -3,7 +3,8 @@ Tests for admin authorization utility.
 """
 import unittest
 import os
-from app.utils.admin_auth import AdminAuthenticator
+from unittest.mock import patch
+from app.utils.admin_auth import AdminAuthenticator, ADMIN_WRITE_BURST, ADMIN_WRITE_REFILL_SECONDS
 
 
 class TestAdminAuthenticator(unittest.TestCase):
@@ -79,6 +80,21 @@ class TestAdminAuthenticator(unittest.TestCase):
         
         self.assertTrue(result['authorized'])
 
+    def test_consume_write_token_rate_limits_writes(self):
+        """Test write bursts past the bucket size are refused until it refills."""
+        with patch('app.utils.admin_auth.time.monotonic', return_value=1000.0):
+            results = [
+                AdminAuthenticator.consume_write_token('burst-user')
+                for _ in range(ADMIN_WRITE_BURST + 1)
+            ]
+            # Other users have their own bucket
+            self.assertTrue(AdminAuthenticator.consume_write_token('other-user'))
+        
+        self.assertEqual(results, [True] * ADMIN_WRITE_BURST + [False])
+        
+        with patch('app.utils.admin_auth.time.monotonic', return_value=1000.0 + ADMIN_WRITE_REFILL_SECONDS):
+            self.assertTrue(AdminAuthenticator.consume_write_token('burst-user'))
+
     def test_get_value_fingerprint(self):
         """Test value fingerprint generation."""
         fingerprint = AdminAuthenticator.get_value_fingerprint('test-value')
@@ -72,6 +72,25 @@ class TestAuditStore(unittest.TestCase):
         self.assertTrue(record['message_fingerprint'].startswith('…'))
         self.assertIsInstance(record['timestamp'], int)
 
+    def test_create_audit_record_with_precomputed_fingerprint(self):
+        """Test a caller-supplied fingerprint is stored without rehashing."""
+        self.mock_table.put_item.return_value = {}
+        
+        with patch.object(AuditStore, 'get_message_fingerprint') as mock_fingerprint:
+            self.store.create_audit_record(
+                trace_id='trace-123',
+                user_id='user-456',
+                command='relay-send',
+                target_channel='channel-789',
+                message='Test message',
+                result='posted',
+                fingerprint='…abcd'
+            )
+        
+        mock_fingerprint.assert_not_called()
+        record = self.mock_table.put_item.call_args[1]['Item']
+        self.assertEqual(record['message_fingerprint'], '…abcd')
+
     def test_create_audit_record_with_metadata(self):
         """Test creating an audit record with metadata."""
         self.mock_table.put_item.return_value = {}
@@ -231,6 +250,13 @@ class TestAuditStore(unittest.TestCase):
         
         self.assertEqual(fingerprint, '…(empty)')
 
+    def test_private_fingerprint_alias(self):
+        """Test the old private name still resolves to the public method."""
+        self.assertEqual(
+            AuditStore._get_message_fingerprint('test message'),
+            AuditStore.get_message_fingerprint('test message')
+        )
+
     def test_get_message_fingerprint_consistent(self):
         """Test fingerprint is consistent for same message."""
         fp1 = AuditStore._get_message_fingerprint('test message')
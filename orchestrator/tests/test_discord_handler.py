@@ -0,0 +1,677 @@
+"""
+Tests for Discord handler request plumbing (signature verification, responses).
+"""
+import base64
+import json
+import threading
+import time
+import unittest
+from datetime import timezone
+from unittest.mock import Mock, patch
+from nacl.signing import SigningKey
+from app.handlers.discord_handler import (
+    verify_discord_signature,
+    handle_deploy_client_command,
+    handle_status_command,
+    handle_diagnose_command,
+    handle_verify_run_command,
+    handle_set_frontend_command,
+    handle_set_api_base_command,
+    _deploy_client_worker,
+    _diagnose_dispatch_worker,
+    _run_with_deferred_slot,
+    _run_deferred_task,
+    _get_lambda_client,
+    _respond_within_ack_window,
+    handler,
+    _render_run_rows,
+    _post_followup_message,
+    _get_options,
+    create_response,
+    _loads,
+    MAX_SIGNED_BODY_BYTES,
+    MAX_SIGNATURE_AGE_SECONDS
+)
+
+
+class TestVerifyDiscordSignature(unittest.TestCase):
+    """Test Discord interaction signature verification."""
+
+    def setUp(self):
+        """Set up a signing key and a signed request."""
+        self.signing_key = SigningKey.generate()
+        self.public_key = self.signing_key.verify_key.encode().hex()
+        self.timestamp = str(int(time.time()))
+        self.body = '{"type": 1}'
+        self.signature = self.signing_key.sign(
+            (self.timestamp + self.body).encode()
+        ).signature.hex()
+
+    def test_valid_signature(self):
+        """Test a correctly signed request verifies."""
+        self.assertTrue(
+            verify_discord_signature(self.signature, self.timestamp, self.body, self.public_key)
+        )
+
+    def test_valid_signature_bytes_body(self):
+        """Test a raw bytes body verifies the same as str."""
+        self.assertTrue(
+            verify_discord_signature(self.signature, self.timestamp, self.body.encode(), self.public_key)
+        )
+
+    def test_tampered_body(self):
+        """Test a modified body is rejected."""
+        self.assertFalse(
+            verify_discord_signature(self.signature, self.timestamp, '{"type": 2}', self.public_key)
+        )
+
+    def test_malformed_signature(self):
+        """Test a non-hex signature is rejected."""
+        self.assertFalse(
+            verify_discord_signature('not-hex', self.timestamp, self.body, self.public_key)
+        )
+
+    def test_non_hex_signature_of_right_length(self):
+        """Test a 128-char non-hex signature is rejected."""
+        self.assertFalse(
+            verify_discord_signature('zz' * 64, self.timestamp, self.body, self.public_key)
+        )
+
+    @patch('app.handlers.discord_handler._get_verify_key')
+    def test_stale_or_malformed_timestamp_skips_crypto(self, mock_get_verify_key):
+        """Test replayed (old) and non-numeric timestamps are rejected before verification."""
+        stale = str(int(time.time()) - MAX_SIGNATURE_AGE_SECONDS - 60)
+        stale_signature = self.signing_key.sign((stale + self.body).encode()).signature.hex()
+
+        self.assertFalse(verify_discord_signature(stale_signature, stale, self.body, self.public_key))
+        self.assertFalse(verify_discord_signature(self.signature, 'yesterday', self.body, self.public_key))
+        mock_get_verify_key.assert_not_called()
+
+    @patch('app.handlers.discord_handler._get_verify_key')
+    def test_oversized_body_skips_crypto(self, mock_get_verify_key):
+        """Test oversized bodies are rejected before Ed25519 verification."""
+        body = b'x' * (MAX_SIGNED_BODY_BYTES + 1)
+
+        self.assertFalse(
+            verify_discord_signature(self.signature, self.timestamp, body, self.public_key)
+        )
+        mock_get_verify_key.assert_not_called()
+
+    def test_handler_accepts_base64_body(self):
+        """Test base64-encoded API Gateway bodies are verified as raw bytes."""
+        event = {
+            'headers': {'x-signature-ed25519': self.signature, 'x-signature-timestamp': self.timestamp},
+            'body': base64.b64encode(self.body.encode()).decode(),
+            'isBase64Encoded': True
+        }
+
+        with patch.dict('os.environ', {'DISCORD_PUBLIC_KEY': self.public_key}):
+            response = handler(event, None)
+
+        self.assertEqual(json.loads(response['body']), {'type': 1})
+
+    @patch('app.handlers.discord_handler.ORJSON_AVAILABLE', False)
+    def test_stdlib_json_fallback_keeps_emoji_unescaped(self):
+        """Test the fallback emits compact UTF-8 like orjson."""
+        response = create_response(4, {'content': '🟢 success'})
+
+        self.assertEqual(response['body'], '{"type":4,"data":{"content":"🟢 success"}}')
+
+    def test_handler_rejects_bad_or_missing_signatures(self):
+        """Test unsigned and mis-signed requests get 401 before parsing."""
+        unsigned = {'headers': {}, 'body': self.body}
+        mis_signed = {
+            'headers': {'x-signature-ed25519': '00' * 64, 'x-signature-timestamp': self.timestamp},
+            'body': self.body
+        }
+
+        with patch.dict('os.environ', {'DISCORD_PUBLIC_KEY': self.public_key}):
+            missing = handler(unsigned, None)
+            invalid = handler(mis_signed, None)
+
+        self.assertEqual(missing['statusCode'], 401)
+        self.assertEqual(json.loads(missing['body']), {'error': 'Missing signature headers'})
+        self.assertEqual(invalid['statusCode'], 401)
+        self.assertEqual(json.loads(invalid['body']), {'error': 'Invalid request signature'})
+
+    def _signed_event(self, payload):
+        """Build a signed API Gateway event for payload."""
+        body = json.dumps(payload)
+        signature = self.signing_key.sign((self.timestamp + body).encode()).signature.hex()
+        return {
+            'headers': {'x-signature-ed25519': signature, 'x-signature-timestamp': self.timestamp},
+            'body': body
+        }
+
+    @patch('app.handlers.discord_handler.get_permission_matrix')
+    def test_handler_routes_commands_through_table(self, mock_matrix):
+        """Test slash commands dispatch via COMMAND_HANDLERS."""
+        mock_matrix.return_value.check_permission.return_value = (True, None)
+        command = Mock(return_value={'statusCode': 200, 'body': 'ok'})
+        event = self._signed_event({'type': 2, 'data': {'name': 'plan'}})
+
+        with patch.dict('os.environ', {'DISCORD_PUBLIC_KEY': self.public_key}), \
+                patch.dict('app.handlers.discord_handler.COMMAND_HANDLERS', {'plan': command}):
+            response = handler(event, None)
+
+        self.assertEqual(response['body'], 'ok')
+        command.assert_called_once()
+
+    @patch('app.handlers.discord_handler.get_permission_matrix')
+    def test_handler_replays_duplicate_interaction(self, mock_matrix):
+        """Test a redelivered interaction id gets the first reply without re-running."""
+        mock_matrix.return_value.check_permission.return_value = (True, None)
+        command = Mock(return_value={'statusCode': 200, 'body': 'ok'})
+        event = self._signed_event({'id': 'dup-1', 'type': 2, 'data': {'name': 'plan'}})
+
+        with patch.dict('os.environ', {'DISCORD_PUBLIC_KEY': self.public_key}), \
+                patch.dict('app.handlers.discord_handler.COMMAND_HANDLERS', {'plan': command}), \
+                patch.dict('app.handlers.discord_handler._interaction_replies', clear=True):
+            first = handler(event, None)
+            second = handler(event, None)
+
+        self.assertEqual(first, second)
+        command.assert_called_once()
+
+    @patch('app.handlers.discord_handler.get_permission_matrix')
+    def test_handler_unknown_command(self, mock_matrix):
+        """Test unregistered commands get an ephemeral error."""
+        mock_matrix.return_value.check_permission.return_value = (True, None)
+        event = self._signed_event({'type': 2, 'data': {'name': 'nope'}})
+
+        with patch.dict('os.environ', {'DISCORD_PUBLIC_KEY': self.public_key}):
+            response = handler(event, None)
+
+        self.assertEqual(json.loads(response['body'])['data']['content'], 'Unknown command: nope')
+
+
+class TestCreateResponse(unittest.TestCase):
+    """Test interaction response envelopes."""
+
+    def test_body_round_trips(self):
+        """Test the body decodes back to the interaction response."""
+        response = create_response(4, {'content': '✅ done'})
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body']), {'type': 4, 'data': {'content': '✅ done'}})
+
+    @patch('app.handlers.discord_handler.ORJSON_AVAILABLE', False)
+    def test_stdlib_json_fallback(self):
+        """Test encoding without orjson installed."""
+        response = create_response(1)
+
+        self.assertEqual(json.loads(response['body']), {'type': 1})
+
+
+class TestLoads(unittest.TestCase):
+    """Test request body parsing."""
+
+    def test_parses_bytes(self):
+        """Test raw body bytes parse to the interaction dict."""
+        self.assertEqual(_loads(b'{"type": 1, "data": {"name": "status"}}'),
+                         {'type': 1, 'data': {'name': 'status'}})
+
+    @patch('app.handlers.discord_handler.ORJSON_AVAILABLE', False)
+    def test_stdlib_json_fallback(self):
+        """Test parsing without orjson installed."""
+        self.assertEqual(_loads('{"type": 1}'.encode()), {'type': 1})
+
+
+class TestGetOptions(unittest.TestCase):
+    """Test slash command option parsing."""
+
+    def test_maps_names_to_values(self):
+        """Test options are keyed by name."""
+        interaction = {'data': {'options': [
+            {'name': 'url', 'value': 'https://example.com'},
+            {'name': 'confirm', 'value': True}
+        ]}}
+
+        self.assertEqual(_get_options(interaction), {'url': 'https://example.com', 'confirm': True})
+
+    def test_missing_data_or_options(self):
+        """Test interactions without data/options give an empty mapping."""
+        self.assertEqual(_get_options({}), {})
+        self.assertEqual(_get_options({'data': None}), {})
+        self.assertEqual(_get_options({'data': {'options': None}}), {})
+
+
+class TestDeferredDeployClient(unittest.TestCase):
+    """Test /deploy-client wait=true ACKs before polling."""
+
+    @patch('app.handlers.discord_handler._run_deferred_task')
+    @patch('app.handlers.discord_handler.GitHubActionsDispatcher')
+    @patch('app.handlers.discord_handler.GitHubService')
+    def test_wait_returns_deferred_and_schedules_worker(self, mock_gh, mock_dispatcher_cls, mock_run_deferred):
+        """Test wait=true returns type 5 without polling inline."""
+        dispatcher = mock_dispatcher_cls.return_value
+        dispatcher.generate_correlation_id.return_value = 'abcdef12-3456'
+        dispatcher.trigger_client_deploy.return_value = {'success': True}
+        interaction = {
+            'token': 'tok',
+            'application_id': 'app',
+            'member': {'user': {'username': 'tester'}},
+            'data': {'options': [{'name': 'wait', 'value': True}]}
+        }
+
+        response = handle_deploy_client_command(interaction)
+
+        self.assertEqual(json.loads(response['body'])['type'], 5)
+        dispatcher.poll_run_conclusion.assert_not_called()
+        task_name, payload = mock_run_deferred.call_args[0]
+        self.assertEqual(task_name, 'deploy_client_wait')
+        self.assertEqual(payload['correlation_id'], 'abcdef12-3456')
+        self.assertEqual(payload['interaction'], {'token': 'tok', 'application_id': 'app'})
+
+    def test_handler_routes_deferred_task(self):
+        """Test the Lambda handler runs async deferred-task events."""
+        worker = Mock()
+        with patch.dict('app.handlers.discord_handler.DEFERRED_TASKS', {'deploy_client_wait': worker}):
+            result = handler({'deferred_task': 'deploy_client_wait', 'payload': {'correlation_id': 'x'}}, None)
+
+        self.assertEqual(result['statusCode'], 200)
+        worker.assert_called_once_with(context=None, correlation_id='x')
+
+    def test_slot_runner_runs_task_and_frees_slot(self):
+        """Test in-process deferred tasks run inside a worker slot."""
+        worker = Mock()
+        slots = threading.BoundedSemaphore(1)
+        with patch.dict('app.handlers.discord_handler.DEFERRED_TASKS', {'t': worker}), \
+                patch('app.handlers.discord_handler._deferred_slots', slots):
+            _run_with_deferred_slot('t', {'x': 1})
+
+        worker.assert_called_once_with(x=1)
+        self.assertTrue(slots.acquire(blocking=False))
+
+    @patch('app.handlers.discord_handler._LAMBDA_FUNCTION_NAME', 'valine-orchestrator-discord-dev')
+    @patch('boto3.client')
+    def test_self_invoke_reuses_lambda_client(self, mock_client):
+        """Test deferred self-invokes build the Lambda client only once."""
+        _get_lambda_client.cache_clear()
+        self.addCleanup(_get_lambda_client.cache_clear)
+
+        _run_deferred_task('followup', {'interaction': {}})
+        _run_deferred_task('followup', {'interaction': {}})
+
+        mock_client.assert_called_once_with('lambda')
+        self.assertEqual(mock_client.return_value.invoke.call_count, 2)
+        self.assertEqual(
+            mock_client.return_value.invoke.call_args[1]['InvocationType'], 'Event'
+        )
+
+    @patch('app.handlers.discord_handler._post_followup_message')
+    @patch('app.handlers.discord_handler.DEFERRED_SLOT_WAIT_SECONDS', 0.01)
+    def test_slot_runner_reports_busy(self, mock_post):
+        """Test a task that cannot get a slot tells the user instead of running."""
+        worker = Mock()
+        slots = threading.BoundedSemaphore(1)
+        slots.acquire()
+        with patch.dict('app.handlers.discord_handler.DEFERRED_TASKS', {'t': worker}), \
+                patch('app.handlers.discord_handler._deferred_slots', slots):
+            _run_with_deferred_slot('t', {'interaction': {'token': 'tok'}})
+
+        worker.assert_not_called()
+        mock_post.assert_called_once()
+        self.assertIn('try again shortly', mock_post.call_args[0][1])
+
+    @patch('app.handlers.discord_handler._post_followup_message')
+    @patch('app.handlers.discord_handler.time.sleep')
+    @patch('app.handlers.discord_handler._get_dispatcher')
+    def test_worker_stops_looking_once_run_appears(self, mock_get_dispatcher, mock_sleep, mock_post):
+        """Test the run lookup backs off and stops at the first match."""
+        dispatcher = mock_get_dispatcher.return_value
+        run = Mock(id=7, html_url='https://example.com/runs/7')
+        dispatcher.find_run_by_correlation.side_effect = [None, None, run]
+        dispatcher.poll_run_conclusion.return_value = {'completed': True, 'conclusion': 'success'}
+
+        _deploy_client_worker({'token': 'tok'}, 'abcdef12-3456', 'tester')
+
+        self.assertEqual([c[0][0] for c in mock_sleep.call_args_list], [0.3, 0.5, 0.8])
+        dispatcher.find_run_by_correlation.assert_called_with(
+            'abcdef12-3456', 'Client Deploy', fallback_to_recent=False
+        )
+        dispatcher.find_recent_run_for_workflow.assert_not_called()
+
+    @patch('app.handlers.discord_handler._post_followup_message')
+    @patch('app.handlers.discord_handler.time.sleep')
+    @patch('app.handlers.discord_handler._get_dispatcher')
+    def test_worker_falls_back_to_recent_run(self, mock_get_dispatcher, mock_sleep, mock_post):
+        """Test the most recent run is used when no run matches the correlation id."""
+        dispatcher = mock_get_dispatcher.return_value
+        dispatcher.find_run_by_correlation.return_value = None
+        dispatcher.find_recent_run_for_workflow.return_value = None
+
+        _deploy_client_worker({'token': 'tok'}, 'abcdef12-3456', 'tester')
+
+        self.assertEqual(dispatcher.find_run_by_correlation.call_count, 4)
+        dispatcher.find_recent_run_for_workflow.assert_called_once_with('Client Deploy', max_age_seconds=300)
+        self.assertIn('Looking for the workflow run', mock_post.call_args[0][1])
+
+    @patch('app.handlers.discord_handler._post_followup_message')
+    @patch('app.handlers.discord_handler.time.sleep')
+    @patch('app.handlers.discord_handler._get_dispatcher')
+    def test_worker_single_followup_when_run_finishes_fast(self, mock_get_dispatcher, mock_sleep, mock_post):
+        """Test a run that completes during the short poll gets one follow-up."""
+        dispatcher = mock_get_dispatcher.return_value
+        dispatcher.find_run_by_correlation.return_value = Mock(id=7, html_url='https://example.com/runs/7')
+        dispatcher.poll_run_conclusion.return_value = {'completed': True, 'conclusion': 'success'}
+
+        _deploy_client_worker({'token': 'tok'}, 'abcdef12-3456', 'tester')
+
+        dispatcher.poll_run_conclusion.assert_called_once_with(7, timeout_seconds=2, poll_interval=0.5)
+        mock_post.assert_called_once()
+        self.assertIn('Mission accomplished', mock_post.call_args[0][1])
+
+    @patch('app.handlers.discord_handler._post_followup_message')
+    @patch('app.handlers.discord_handler.time.sleep')
+    @patch('app.handlers.discord_handler._get_dispatcher')
+    def test_worker_started_then_outcome_when_run_is_slow(self, mock_get_dispatcher, mock_sleep, mock_post):
+        """Test a still-running deploy posts 'started' before the long poll."""
+        dispatcher = mock_get_dispatcher.return_value
+        dispatcher.find_run_by_correlation.return_value = Mock(id=7, html_url='https://example.com/runs/7')
+        dispatcher.poll_run_conclusion.side_effect = [
+            {'completed': False},
+            {'completed': True, 'conclusion': 'failure'}
+        ]
+
+        _deploy_client_worker({'token': 'tok'}, 'abcdef12-3456', 'tester')
+
+        self.assertEqual(dispatcher.poll_run_conclusion.call_count, 2)
+        messages = [c[0][1] for c in mock_post.call_args_list]
+        self.assertEqual(len(messages), 2)
+        self.assertIn('Deployment started!', messages[0])
+        self.assertIn('Deployment failed!', messages[1])
+        dispatcher.poll_run_conclusion.assert_called_with(7, timeout_seconds=180, poll_interval=15)
+
+    @patch('app.handlers.discord_handler._post_followup_message')
+    @patch('app.handlers.discord_handler.time.sleep')
+    @patch('app.handlers.discord_handler._get_dispatcher')
+    def test_worker_polls_within_remaining_lambda_time(self, mock_get_dispatcher, mock_sleep, mock_post):
+        """Test the long poll leaves room in the invocation for the final follow-up."""
+        dispatcher = mock_get_dispatcher.return_value
+        dispatcher.find_run_by_correlation.return_value = Mock(id=7, html_url='https://example.com/runs/7')
+        dispatcher.poll_run_conclusion.side_effect = [
+            {'completed': False},
+            {'completed': False}
+        ]
+        context = Mock()
+        context.get_remaining_time_in_millis.return_value = 290000
+
+        _deploy_client_worker({'token': 'tok'}, 'abcdef12-3456', 'tester', context=context)
+
+        dispatcher.poll_run_conclusion.assert_called_with(7, timeout_seconds=270, poll_interval=15)
+        self.assertIn('Still deploying', mock_post.call_args[0][1])
+
+
+class TestDeferredDiagnose(unittest.TestCase):
+    """Test /diagnose ACKs before dispatching the workflow."""
+
+    @patch('app.handlers.discord_handler._run_deferred_task')
+    @patch('app.handlers.discord_handler._get_dispatcher')
+    def test_returns_deferred_and_schedules_dispatch(self, mock_get_dispatcher, mock_run_deferred):
+        """Test /diagnose returns type 5 without calling GitHub inline."""
+        dispatcher = mock_get_dispatcher.return_value
+        dispatcher.generate_correlation_id.return_value = 'abcdef12-3456'
+        interaction = {
+            'token': 'tok',
+            'application_id': 'app',
+            'channel_id': 'chan',
+            'member': {'user': {'username': 'tester'}},
+            'data': {'options': [{'name': 'api_base', 'value': 'https://api.example.com'}]}
+        }
+
+        response = handle_diagnose_command(interaction)
+
+        self.assertEqual(json.loads(response['body'])['type'], 5)
+        dispatcher.trigger_diagnose_dispatch.assert_not_called()
+        task_name, payload = mock_run_deferred.call_args[0]
+        self.assertEqual(task_name, 'diagnose_dispatch')
+        self.assertEqual(payload['interaction'], {'token': 'tok', 'application_id': 'app'})
+        self.assertEqual(payload['requester'], 'tester')
+        self.assertEqual(payload['api_base'], 'https://api.example.com')
+
+    @patch('app.handlers.discord_handler._post_followup_message')
+    @patch('app.handlers.discord_handler._get_dispatcher')
+    def test_worker_posts_started_message(self, mock_get_dispatcher, mock_post):
+        """Test a successful dispatch posts the DiagnoseAgent follow-up."""
+        mock_get_dispatcher.return_value.trigger_diagnose_dispatch.return_value = {'success': True}
+
+        _diagnose_dispatch_worker({'token': 'tok'}, 'abcdef12-3456', 'tester', channel_id='chan')
+
+        mock_post.assert_called_once()
+        self.assertIn('Starting infrastructure diagnostics', mock_post.call_args[0][1])
+        self.assertIn('`abcdef12...`', mock_post.call_args[0][1])
+
+    @patch('app.handlers.discord_handler._post_followup_message')
+    @patch('app.handlers.discord_handler._get_dispatcher')
+    def test_worker_reports_dispatch_failure(self, mock_get_dispatcher, mock_post):
+        """Test a failed dispatch is reported via follow-up."""
+        mock_get_dispatcher.return_value.trigger_diagnose_dispatch.return_value = {
+            'success': False, 'message': 'bad token'
+        }
+
+        _diagnose_dispatch_worker({'token': 'tok'}, 'abcdef12-3456', 'tester')
+
+        mock_post.assert_called_once_with({'token': 'tok'}, '❌ Failed to trigger diagnose: bad token')
+
+
+class TestVerifyRunCommand(unittest.TestCase):
+    """Test /verify-run argument validation."""
+
+    def _interaction(self, run_id):
+        return {'data': {'options': [{'name': 'run_id', 'value': run_id}]}}
+
+    @patch('app.handlers.discord_handler._respond_within_ack_window')
+    def test_numeric_run_id(self, mock_respond):
+        """Test string and integer run ids are passed on as ints."""
+        handle_verify_run_command(self._interaction(' 12345 '))
+        handle_verify_run_command(self._interaction(678))
+
+        self.assertEqual(
+            [c[0][2] for c in mock_respond.call_args_list],
+            [{'run_id': 12345}, {'run_id': 678}]
+        )
+
+    @patch('app.handlers.discord_handler._respond_within_ack_window')
+    def test_non_numeric_run_id(self, mock_respond):
+        """Test non-numeric run ids are rejected without verifying."""
+        for bad in ('abc', '-5', '1.5', '²'):
+            response = handle_verify_run_command(self._interaction(bad))
+            self.assertIn('Invalid run_id', json.loads(response['body'])['data']['content'])
+
+        mock_respond.assert_not_called()
+
+
+class TestSetConfigCommands(unittest.TestCase):
+    """Test /set-frontend and /set-api-base only spend write tokens on real writes."""
+
+    def _interaction(self, url, confirm=True):
+        return {
+            'member': {'user': {'id': 'admin-1', 'username': 'admin'}, 'roles': []},
+            'data': {'options': [{'name': 'url', 'value': url}, {'name': 'confirm', 'value': confirm}]}
+        }
+
+    def setUp(self):
+        env = patch.dict('os.environ', {'ADMIN_USER_IDS': 'admin-1', 'ALLOW_SECRET_WRITES': 'true'})
+        env.start()
+        self.addCleanup(env.stop)
+
+    @patch('app.handlers.discord_handler._get_github_service')
+    @patch('app.handlers.discord_handler.AdminAuthenticator.consume_write_token')
+    def test_rejected_requests_keep_write_tokens(self, mock_consume, mock_github):
+        """Test missing confirm and invalid URLs are refused without taking a token."""
+        for command in (handle_set_frontend_command, handle_set_api_base_command):
+            unconfirmed = command(self._interaction('https://example.com', confirm=False))
+            invalid = command(self._interaction('not a url'))
+
+            self.assertIn('Confirmation required', json.loads(unconfirmed['body'])['data']['content'])
+            self.assertIn('Invalid URL', json.loads(invalid['body'])['data']['content'])
+
+        mock_consume.assert_not_called()
+        mock_github.assert_not_called()
+
+    @patch('app.handlers.discord_handler._get_github_service')
+    @patch('app.handlers.discord_handler.AdminAuthenticator.consume_write_token', return_value=False)
+    def test_rate_limited_write_is_skipped(self, mock_consume, mock_github):
+        """Test an exhausted write bucket stops the GitHub update."""
+        with patch('app.handlers.discord_handler._validate_url', return_value={'valid': True}):
+            response = handle_set_api_base_command(self._interaction('https://api.example.com'))
+
+        self.assertIn('Too many config updates', json.loads(response['body'])['data']['content'])
+        mock_consume.assert_called_once_with('admin-1')
+        mock_github.return_value.update_repo_secret.assert_not_called()
+
+
+class TestStatusCommand(unittest.TestCase):
+    """Test /status rendering."""
+
+    @patch('app.handlers.discord_handler.GitHubActionsDispatcher')
+    @patch('app.handlers.discord_handler.GitHubService')
+    def test_status_lists_both_workflows(self, mock_gh, mock_dispatcher_cls):
+        """Test both workflows are fetched and rendered."""
+        runs = {
+            'Client Deploy': [{
+                'conclusion': 'success', 'status': 'completed',
+                'created_at': None, 'duration_seconds': 65,
+                'html_url': 'https://example.com/runs/1'
+            }],
+            'Diagnose on Demand': []
+        }
+        dispatcher = mock_dispatcher_cls.return_value
+        dispatcher.list_workflow_runs.side_effect = lambda name, **kwargs: runs[name]
+
+        response = handle_status_command({'data': {'options': [{'name': 'count', 'value': 1}]}})
+        content = json.loads(response['body'])['data']['content']
+
+        self.assertEqual(dispatcher.list_workflow_runs.call_count, 2)
+        created_since = dispatcher.list_workflow_runs.call_args.kwargs['created_since']
+        self.assertEqual(created_since.tzinfo, timezone.utc)
+        self.assertIn('**Client Deploy:**\n🟢 success', content)
+        self.assertIn('[run](https://example.com/runs/1)', content)
+        self.assertIn('**Diagnose on Demand:**\n  No runs found', content)
+
+    @patch('app.handlers.discord_handler._run_deferred_task')
+    @patch('app.handlers.discord_handler.FAST_ACK_TIMEOUT_SECONDS', 0.05)
+    @patch('app.handlers.discord_handler._build_status_data')
+    def test_status_defers_when_slow(self, mock_build, mock_run_deferred):
+        """Test a slow /status ACKs with type 5 and finishes as a follow-up."""
+        release = threading.Event()
+        mock_build.side_effect = lambda count: release.wait(1) or {'content': 'late'}
+        interaction = {'token': 'tok', 'application_id': 'app', 'data': {'options': []}}
+
+        with patch.dict('app.handlers.discord_handler.RESPONSE_BUILDERS', {'status': mock_build}):
+            response = handle_status_command(interaction)
+        release.set()
+
+        self.assertEqual(json.loads(response['body'])['type'], 5)
+        task_name, payload = mock_run_deferred.call_args[0]
+        self.assertEqual(task_name, 'followup')
+        self.assertEqual(payload['builder_name'], 'status')
+        self.assertEqual(payload['kwargs'], {'count': 2})
+
+
+class TestRespondWithinAckWindow(unittest.TestCase):
+    """Test when responses are built inline versus deferred."""
+
+    interaction = {'token': 'tok', 'application_id': 'app'}
+
+    @patch('app.handlers.discord_handler._run_deferred_task')
+    def test_slow_builders_defer_without_inline_attempt(self, mock_run_deferred):
+        """Test verify builders go straight to a follow-up and run only once."""
+        builder = Mock()
+        with patch.dict('app.handlers.discord_handler.RESPONSE_BUILDERS', {'verify_run': builder}):
+            response = _respond_within_ack_window(self.interaction, 'verify_run', {'run_id': 1})
+
+        self.assertEqual(json.loads(response['body'])['type'], 5)
+        builder.assert_not_called()
+        self.assertEqual(mock_run_deferred.call_args[0][1]['builder_name'], 'verify_run')
+
+    @patch('app.handlers.discord_handler._run_deferred_task')
+    def test_busy_pool_defers_immediately(self, mock_run_deferred):
+        """Test abandoned builds holding every worker don't delay the next ACK."""
+        builder = Mock(return_value={'content': 'fast'})
+        with patch('app.handlers.discord_handler._ack_slots', threading.BoundedSemaphore(1)) as slots, \
+                patch.dict('app.handlers.discord_handler.RESPONSE_BUILDERS', {'status': builder}):
+            slots.acquire()
+            response = _respond_within_ack_window(self.interaction, 'status', {'count': 2})
+
+        self.assertEqual(json.loads(response['body'])['type'], 5)
+        builder.assert_not_called()
+
+    def test_fast_builder_answers_inline_and_frees_worker(self):
+        """Test a quick build is returned as a type 4 response."""
+        builder = Mock(return_value={'content': 'fast'})
+        slots = threading.BoundedSemaphore(1)
+        with patch('app.handlers.discord_handler._ack_slots', slots), \
+                patch.dict('app.handlers.discord_handler.RESPONSE_BUILDERS', {'status': builder}):
+            response = _respond_within_ack_window(self.interaction, 'status', {'count': 2})
+
+        self.assertEqual(json.loads(response['body'])['data'], {'content': 'fast'})
+        self.assertTrue(slots.acquire(timeout=1))
+
+
+class TestRenderRunRows(unittest.TestCase):
+    """Test the per-run rows rendered under each /status workflow."""
+
+    def test_icons(self):
+        """Test running and other completed conclusions get their icons."""
+        formatter = Mock()
+        formatter.format_relative_time.return_value = '5m ago'
+        formatter.format_duration_seconds.return_value = '1m'
+        runs = [
+            {'conclusion': None, 'status': 'in_progress', 'html_url': 'u1'},
+            {'conclusion': 'cancelled', 'status': 'completed', 'html_url': 'u2'}
+        ]
+
+        rows = _render_run_rows(runs, formatter)
+
+        self.assertEqual(
+            rows,
+            '🟡 running • 5m ago • 1m • [run](u1)\n'
+            '⚪ cancelled • 5m ago • 1m • [run](u2)\n'
+        )
+        self.assertEqual(_render_run_rows([], formatter), '')
+
+
+class TestFollowupMessage(unittest.TestCase):
+    """Test follow-up webhook posting."""
+
+    @patch('app.handlers.discord_handler._discord_session')
+    def test_posts_via_shared_session(self, mock_session):
+        """Test follow-ups go through the pooled session."""
+        mock_session.post.return_value = Mock(status_code=200)
+
+        _post_followup_message({'token': 'tok', 'application_id': 'app'}, 'hello')
+
+        mock_session.post.assert_called_once_with(
+            'https://discord.com/api/v10/webhooks/app/tok',
+            json={'content': 'hello'},
+            timeout=5
+        )
+
+    def test_session_retries_rate_limited_posts(self):
+        """Test the pooled session retries 429s but no 5xx responses."""
+        from app.handlers.discord_handler import _discord_session
+
+        retry = _discord_session.get_adapter('https://discord.com').max_retries
+        self.assertEqual(list(retry.status_forcelist), [429])
+        self.assertTrue(retry.respect_retry_after_header)
+
+    def test_session_does_not_retry_read_timeouts(self):
+        """Test follow-ups that may have reached Discord are not re-sent."""
+        from app.handlers.discord_handler import _discord_session
+
+        retry = _discord_session.get_adapter('https://discord.com').max_retries
+        self.assertEqual(retry.read, 0)
+        self.assertEqual(retry.connect, 2)
+
+    @patch('app.handlers.discord_handler._discord_session')
+    def test_skips_without_token(self, mock_session):
+        """Test nothing is posted without an interaction token."""
+        _post_followup_message({'application_id': 'app'}, 'hello')
+
+        mock_session.post.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,7 +5,9 @@ Tests dispatch triggering, polling, and result parsing.
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 import json
+import time
 from datetime import datetime, timedelta, timezone
+from github import GithubException
 from app.services.github_actions_dispatcher import GitHubActionsDispatcher
 
 
@@ -315,6 +317,54 @@ class TestGitHubActionsDispatcher(unittest.TestCase):
             self.assertEqual(run.id, 111)
             self.assertIn(correlation_id, run.name)
 
+    def test_find_run_by_correlation_stops_at_old_runs(self):
+        """Test the newest-first scan stops at the first run past the window."""
+        old_run = Mock()
+        old_run.name = 'Client Deploy — other-id by testuser'
+        old_run.created_at = datetime.now(timezone.utc) - timedelta(hours=1)
+        
+        def runs():
+            yield old_run
+            raise AssertionError('scanned past the age cutoff')
+        
+        mock_workflow = Mock()
+        mock_workflow.get_runs.side_effect = lambda: runs()
+        
+        with patch.object(self.dispatcher, 'get_workflow_by_name', return_value=mock_workflow):
+            self.assertIsNone(self.dispatcher.find_run_by_correlation('abc-123', 'Client Deploy'))
+
+    def test_find_run_by_correlation_without_fallback(self):
+        """Test no run is returned when nothing matches and the fallback is off."""
+        other_run = Mock()
+        other_run.name = 'Client Deploy — other-id by testuser'
+        other_run.created_at = datetime.now(timezone.utc)
+        
+        mock_workflow = Mock()
+        mock_workflow.get_runs.return_value = [other_run]
+        
+        with patch.object(self.dispatcher, 'get_workflow_by_name', return_value=mock_workflow), \
+                patch.object(self.dispatcher, 'find_recent_run_for_workflow') as mock_recent:
+            run = self.dispatcher.find_run_by_correlation('abc-123', 'Client Deploy', fallback_to_recent=False)
+        
+        self.assertIsNone(run)
+        mock_recent.assert_not_called()
+
+    def test_find_recent_run_for_workflow_checks_newest_only(self):
+        """Test only the newest run is considered for the recent-run lookup."""
+        new_run = Mock()
+        new_run.id = 321
+        new_run.created_at = datetime.now(timezone.utc)
+        
+        def runs():
+            yield new_run
+            raise AssertionError('scanned past the newest run')
+        
+        mock_workflow = Mock()
+        mock_workflow.get_runs.side_effect = lambda: runs()
+        
+        with patch.object(self.dispatcher, 'get_workflow_by_name', return_value=mock_workflow):
+            self.assertIs(self.dispatcher.find_recent_run_for_workflow('Client Deploy'), new_run)
+
     def test_find_run_by_correlation_fallback(self):
         """Test fallback to most recent run when correlation_id not found."""
         correlation_id = 'not-found-123'
@@ -399,6 +449,72 @@ class TestGitHubActionsDispatcher(unittest.TestCase):
         self.assertIsNone(result['conclusion'])
         self.assertTrue(result['timed_out'])
 
+    @patch('app.services.github_actions_dispatcher.time.sleep')
+    def test_poll_run_conclusion_uses_conditional_refresh(self, mock_sleep):
+        """Test polling fetches the run once and refreshes it with update()."""
+        run_id = 12345
+        
+        mock_run = Mock()
+        mock_run.id = run_id
+        mock_run.status = 'in_progress'
+        mock_run.conclusion = None
+        
+        # First refresh is a 304, second picks up the completed run
+        def refresh():
+            if mock_run.update.call_count < 2:
+                return False
+            mock_run.status = 'completed'
+            mock_run.conclusion = 'success'
+            return True
+        
+        mock_run.update.side_effect = refresh
+        
+        mock_repo = Mock()
+        mock_repo.get_workflow_run.return_value = mock_run
+        self.mock_github_service.get_repository.return_value = mock_repo
+        
+        result = self.dispatcher.poll_run_conclusion(run_id, timeout_seconds=10, poll_interval=1)
+        
+        self.assertTrue(result['completed'])
+        self.assertEqual(result['conclusion'], 'success')
+        mock_repo.get_workflow_run.assert_called_once_with(run_id)
+        self.assertEqual(mock_run.update.call_count, 2)
+
+    @patch('app.services.github_actions_dispatcher.time.sleep')
+    def test_poll_run_conclusion_waits_for_rate_limit_reset(self, mock_sleep):
+        """Test a rate-limited poll sleeps until GitHub's Retry-After."""
+        mock_run = Mock()
+        mock_run.id = 12345
+        mock_run.status = 'completed'
+        mock_run.conclusion = 'success'
+        
+        mock_repo = Mock()
+        mock_repo.get_workflow_run.side_effect = [
+            GithubException(403, headers={'Retry-After': '7'}),
+            mock_run
+        ]
+        self.mock_github_service.get_repository.return_value = mock_repo
+        
+        result = self.dispatcher.poll_run_conclusion(12345, timeout_seconds=60, poll_interval=1)
+        
+        self.assertTrue(result['completed'])
+        mock_sleep.assert_called_once_with(7.0)
+
+    @patch('app.services.github_actions_dispatcher.time.sleep')
+    def test_poll_run_conclusion_gives_up_when_reset_is_past_deadline(self, mock_sleep):
+        """Test polling stops instead of sleeping past its timeout for a rate limit."""
+        reset = str(int(time.time()) + 3600)
+        mock_repo = Mock()
+        mock_repo.get_workflow_run.side_effect = GithubException(
+            403, headers={'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': reset}
+        )
+        self.mock_github_service.get_repository.return_value = mock_repo
+        
+        result = self.dispatcher.poll_run_conclusion(12345, timeout_seconds=60, poll_interval=1)
+        
+        self.assertEqual(result['message'], 'Rate limit exceeded')
+        mock_sleep.assert_not_called()
+
     @patch('app.services.github_actions_dispatcher.requests.post')
     def test_trigger_phase5_triage_success(self, mock_post):
         """Test successful Phase 5 Triage trigger."""
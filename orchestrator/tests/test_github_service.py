@@ -0,0 +1,48 @@
+"""
+Tests for GitHub service repository config updates.
+"""
+import unittest
+from unittest.mock import Mock, patch
+from nacl import encoding, public
+from app.services.github import GitHubService
+
+
+class TestGitHubServiceConfig(unittest.TestCase):
+    """Test repository variable/secret updates."""
+
+    @patch('app.services.github.Github')
+    def setUp(self, mock_github):
+        """Set up a service with a mocked HTTP session."""
+        self.service = GitHubService(token='test-token')
+        self.session = Mock()
+        self.service._session = self.session
+
+        key = public.PrivateKey.generate().public_key
+        self.session.get.return_value = Mock(status_code=200, json=Mock(return_value={
+            'key': key.encode(encoding.Base64Encoder()).decode('utf-8'),
+            'key_id': 'key-1'
+        }))
+        self.session.put.return_value = Mock(status_code=204)
+        self.session.patch.return_value = Mock(status_code=204)
+
+    def test_secret_public_key_fetched_once(self):
+        """Test repeated secret updates reuse the cached public key."""
+        self.assertTrue(self.service.update_repo_secret('A', 'one')['success'])
+        self.assertTrue(self.service.update_repo_secret('B', 'two')['success'])
+
+        self.session.get.assert_called_once()
+        self.assertEqual(self.session.put.call_count, 2)
+
+    def test_failed_secret_update_drops_cached_key(self):
+        """Test a rejected secret write refetches the key next time."""
+        self.session.put.return_value = Mock(status_code=422, text='bad key')
+        self.assertFalse(self.service.update_repo_secret('A', 'one')['success'])
+
+        self.session.put.return_value = Mock(status_code=204)
+        self.assertTrue(self.service.update_repo_secret('A', 'one')['success'])
+
+        self.assertEqual(self.session.get.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
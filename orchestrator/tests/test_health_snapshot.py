@@ -2,6 +2,7 @@
 Tests for health_snapshot service.
 """
 import os
+import threading
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 from app.services.health_snapshot import HealthSnapshot
@@ -330,6 +331,27 @@ class TestHealthSnapshot(unittest.TestCase):
         
         arrow = health_service._get_trend_arrow(current, trend_data, 'frontend')
         self.assertEqual(arrow, '➡️')
+    
+    @patch('app.services.health_snapshot.HTTPChecker')
+    def test_gather_metrics_checks_run_concurrently(self, mock_http_checker):
+        """Test frontend and API checks overlap instead of running back to back."""
+        barrier = threading.Barrier(2, timeout=2)
+        
+        def check(base_url):
+            barrier.wait()  # Raises BrokenBarrierError if the checks are serialized
+            return {'endpoints': {'/': {'success': True, 'response_time_ms': 10}}}
+        
+        mock_checker_instance = Mock()
+        mock_http_checker.return_value = mock_checker_instance
+        mock_checker_instance.check_frontend.side_effect = check
+        mock_checker_instance.check_api.side_effect = check
+        
+        health_service = HealthSnapshot()
+        metrics = health_service.gather_metrics()
+        
+        self.assertEqual(metrics['frontend']['total_checks'], 1)
+        self.assertEqual(metrics['api']['base_url'], 'https://test-api.com')
+        self.assertEqual(metrics['summary']['overall_health'], 'healthy')
 
 
 if __name__ == '__main__':
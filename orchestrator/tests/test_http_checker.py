@@ -52,6 +52,40 @@ class TestHTTPChecker(unittest.TestCase):
             self.assertFalse(result['success'])
             self.assertEqual(result['status_code'], 404)
     
+    def test_check_endpoint_head(self):
+        """Test HEAD check does not issue a GET."""
+        with patch('app.verification.http_checker.requests.head') as mock_head, \
+                patch('app.verification.http_checker.requests.get') as mock_get:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.headers = {}
+            mock_head.return_value = mock_response
+            
+            result = self.checker.check_endpoint('https://example.com', '/', method='HEAD')
+            
+            self.assertTrue(result['success'])
+            mock_head.assert_called_once()
+            mock_get.assert_not_called()
+    
+    def test_check_endpoint_head_falls_back_to_get(self):
+        """Test HEAD check retries as GET when HEAD is not allowed."""
+        with patch('app.verification.http_checker.requests.head') as mock_head, \
+                patch('app.verification.http_checker.requests.get') as mock_get:
+            head_response = Mock()
+            head_response.status_code = 405
+            head_response.headers = {}
+            mock_head.return_value = head_response
+            get_response = Mock()
+            get_response.status_code = 200
+            get_response.headers = {}
+            mock_get.return_value = get_response
+            
+            result = self.checker.check_endpoint('https://example.com', '/health', method='HEAD')
+            
+            self.assertTrue(result['success'])
+            self.assertEqual(result['status_code'], 200)
+            mock_get.assert_called_once()
+    
     def test_check_frontend(self):
         """Test frontend check."""
         with patch('app.verification.http_checker.requests.get') as mock_get:
@@ -0,0 +1,25 @@
+"""
+Tests for Discord interaction payload helpers.
+"""
+import unittest
+from app.utils.interaction import interaction_user
+
+
+class TestInteractionUser(unittest.TestCase):
+    """Test invoking-user extraction."""
+
+    def test_guild_member(self):
+        """Test id, username and roles come from the guild member."""
+        interaction = {'member': {'user': {'id': '42', 'username': 'tester'}, 'roles': ['r1']}}
+
+        self.assertEqual(interaction_user(interaction), ('42', 'tester', ['r1']))
+
+    def test_dm_user_and_missing_fields(self):
+        """Test DM users and missing fields fall back sensibly."""
+        self.assertEqual(interaction_user({'user': {'id': '42'}}), ('42', '42', []))
+        self.assertEqual(interaction_user({}), ('', 'unknown', []))
+        self.assertEqual(interaction_user({}, default_id='unknown'), ('unknown', 'unknown', []))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -86,6 +86,95 @@ class TestQoLDispatchers(unittest.TestCase):
         self.assertEqual(result[1]['id'], 2)
         self.assertEqual(result[1]['conclusion'], 'failure')
 
+    def test_list_workflow_runs_passes_filters(self):
+        """Test date/event filters are forwarded to the GitHub query."""
+        mock_workflow = Mock()
+        mock_workflow.name = 'Client Deploy'
+        mock_workflow.get_runs.return_value = []
+        
+        mock_repo = Mock()
+        mock_repo.get_workflows.return_value = [mock_workflow]
+        self.mock_github_service.get_repository.return_value = mock_repo
+        
+        self.dispatcher.list_workflow_runs(
+            'Client Deploy', count=2, created='>=2025-01-01', event='workflow_dispatch'
+        )
+        
+        mock_workflow.get_runs.assert_called_once_with(
+            branch='main', created='>=2025-01-01', event='workflow_dispatch'
+        )
+
+    def test_list_workflow_runs_created_since(self):
+        """Test a datetime cutoff is sent to GitHub as a created filter."""
+        mock_workflow = Mock()
+        mock_workflow.name = 'Client Deploy'
+        mock_workflow.get_runs.return_value = []
+        
+        mock_repo = Mock()
+        mock_repo.get_workflows.return_value = [mock_workflow]
+        self.mock_github_service.get_repository.return_value = mock_repo
+        
+        self.dispatcher.list_workflow_runs(
+            'Client Deploy', count=2, created_since=datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        )
+        
+        mock_workflow.get_runs.assert_called_once_with(branch='main', created='>=2025-01-02T03:04:05Z')
+
+    def test_list_workflow_runs_normalizes_naive_timestamps(self):
+        """Test naive created_at/updated_at come back as UTC-aware datetimes."""
+        mock_run = Mock()
+        mock_run.status = 'completed'
+        mock_run.created_at = datetime(2025, 1, 1, 12, 0, 0)
+        mock_run.updated_at = datetime(2025, 1, 1, 12, 1, 0)
+        mock_run.head_sha = 'abc1234567890'
+        
+        mock_workflow = Mock()
+        mock_workflow.name = 'Client Deploy'
+        mock_workflow.get_runs.return_value = [mock_run]
+        
+        mock_repo = Mock()
+        mock_repo.get_workflows.return_value = [mock_workflow]
+        self.mock_github_service.get_repository.return_value = mock_repo
+        
+        result = self.dispatcher.list_workflow_runs('Client Deploy', count=1)
+        
+        self.assertEqual(result[0]['created_at'].tzinfo, timezone.utc)
+        self.assertEqual(result[0]['updated_at'].tzinfo, timezone.utc)
+        self.assertEqual(result[0]['duration_seconds'], 60)
+
+    def test_list_workflow_runs_cached_briefly(self):
+        """Test identical queries within the TTL reuse the first result."""
+        mock_workflow = Mock()
+        mock_workflow.name = 'Client Deploy'
+        mock_workflow.get_runs.return_value = []
+        
+        mock_repo = Mock()
+        mock_repo.get_workflows.return_value = [mock_workflow]
+        self.mock_github_service.get_repository.return_value = mock_repo
+        
+        first = self.dispatcher.list_workflow_runs('Client Deploy', count=2)
+        second = self.dispatcher.list_workflow_runs('Client Deploy', count=2)
+        self.dispatcher.list_workflow_runs('Client Deploy', count=3)
+        
+        self.assertIs(first, second)
+        self.assertEqual(mock_workflow.get_runs.call_count, 2)
+
+    def test_list_workflow_runs_cache_expires(self):
+        """Test cached results are refetched once the TTL passes."""
+        mock_workflow = Mock()
+        mock_workflow.name = 'Client Deploy'
+        mock_workflow.get_runs.return_value = []
+        
+        mock_repo = Mock()
+        mock_repo.get_workflows.return_value = [mock_workflow]
+        self.mock_github_service.get_repository.return_value = mock_repo
+        
+        with patch('app.services.github_actions_dispatcher.time.monotonic', side_effect=[100.0, 200.0, 200.0]):
+            self.dispatcher.list_workflow_runs('Client Deploy', count=2)
+            self.dispatcher.list_workflow_runs('Client Deploy', count=2)
+        
+        self.assertEqual(mock_workflow.get_runs.call_count, 2)
+
     def test_list_workflow_runs_empty(self):
         """Test listing workflow runs when none exist."""
         mock_workflow = Mock()
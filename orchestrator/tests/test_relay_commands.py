@@ -38,7 +38,7 @@ class TestRelayCommands(unittest.TestCase):
         
         mock_audit = MagicMock()
         mock_audit.create_audit_record.return_value = 'audit-456'
-        mock_audit._get_message_fingerprint.return_value = '…abcd'
+        mock_audit.get_message_fingerprint.return_value = '…abcd'
         mock_audit_store.return_value = mock_audit
         
         mock_trace = MagicMock()
@@ -237,7 +237,7 @@ class TestRelayCommands(unittest.TestCase):
         
         mock_audit = MagicMock()
         mock_audit.create_audit_record.return_value = 'audit-456'
-        mock_audit._get_message_fingerprint.return_value = '…abcd'
+        mock_audit.get_message_fingerprint.return_value = '…abcd'
         mock_audit_store.return_value = mock_audit
         
         mock_trace = MagicMock()
@@ -327,7 +327,7 @@ class TestRelayCommands(unittest.TestCase):
         
         mock_audit = MagicMock()
         mock_audit.create_audit_record.return_value = 'audit-456'
-        mock_audit._get_message_fingerprint.return_value = '…abcd'
+        mock_audit.get_message_fingerprint.return_value = '…abcd'
         mock_audit_store.return_value = mock_audit
         
         mock_trace = MagicMock()
@@ -0,0 +1,68 @@
+"""
+Tests for /ship promote/rollback buttons.
+"""
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+from commands.ship import ShipCommand, DEPLOY_STATE_TTL
+from services.state_store import StateStore, StateStoreError
+
+
+class TestShipTransitions(unittest.TestCase):
+    """Test promote/rollback only ever apply once per deploy."""
+
+    def setUp(self):
+        """Set up a memory store holding an initiated deploy."""
+        self.store = StateStore(backend='memory')
+        self.store.put('ship:d1', {'deploy_id': 'd1', 'env': 'staging', 'status': 'initiated'},
+                       ttl=DEPLOY_STATE_TTL)
+        patcher = patch('commands.ship.get_state_store', return_value=self.store)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.command = ShipCommand()
+        self.interaction = {'member': {'user': {'id': '42'}}}
+
+    def test_promote_updates_status(self):
+        """Test a promote moves the deploy to promoted."""
+        response = self.command.handle_component(self.interaction, 'ship_promote_d1')
+
+        self.assertEqual(response['type'], 7)
+        stored = self.store.get('ship:d1')
+        self.assertEqual(stored['status'], 'promoted')
+        self.assertEqual(stored['promoted_by'], '42')
+
+    def test_repeat_and_opposite_actions_are_rejected(self):
+        """Test a second promote and a later rollback do not run."""
+        self.command.handle_component(self.interaction, 'ship_promote_d1')
+
+        again = self.command.handle_component(self.interaction, 'ship_promote_d1')
+        rollback = self.command.handle_component(self.interaction, 'ship_rollback_d1')
+
+        self.assertIn('already promoted', again['data']['content'])
+        self.assertIn('already promoted', rollback['data']['content'])
+        self.assertEqual(self.store.get('ship:d1')['status'], 'promoted')
+
+    def test_missing_deploy(self):
+        """Test actions on an unknown deploy report it as not found."""
+        response = self.command.handle_component(self.interaction, 'ship_rollback_gone')
+
+        self.assertIn('not found or expired', response['data']['content'])
+
+    def test_backend_error_is_reported_and_retryable(self):
+        """Test a failed check-and-set is reported as an error, not a duplicate."""
+        with patch.object(self.store, 'update', Mock(side_effect=StateStoreError('down'))):
+            response = self.command.handle_component(self.interaction, 'ship_rollback_d1')
+
+        self.assertIn('Could not rollback deployment', response['data']['content'])
+        retry = self.command.handle_component(self.interaction, 'ship_rollback_d1')
+        self.assertEqual(retry['type'], 7)
+        self.assertEqual(self.store.get('ship:d1')['status'], 'rolled_back')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,10 +2,11 @@
 Tests for StateStore service.
 """
 import os
+import json
 import unittest
 import time
 from unittest.mock import Mock, patch, MagicMock
-from app.services.state_store import StateStore, get_state_store
+from app.services.state_store import StateStore, StateStoreError, get_state_store
 
 
 class TestStateStore(unittest.TestCase):
@@ -97,6 +98,13 @@ class TestStateStore(unittest.TestCase):
         self.assertIsNotNone(store.get('key2'))
         self.assertIsNotNone(store.get('key3'))
     
+    @patch('app.services.state_store.ORJSON_AVAILABLE', False)
+    def test_stdlib_json_fallback(self):
+        """Test round-trip when orjson is not installed."""
+        store = StateStore(backend='memory')
+        store.put('fallback-key', {'data': [1, 2, 3]})
+        self.assertEqual(store.get('fallback-key'), {'data': [1, 2, 3]})
+    
     def test_complex_values(self):
         """Test storing complex nested values."""
         store = StateStore(backend='memory')
@@ -138,6 +146,141 @@ class TestStateStore(unittest.TestCase):
         value = store2.get('singleton-test')
         self.assertEqual(value, {'data': 'value'})
     
+    def test_update_merges_fields(self):
+        """Test update only changes the given fields."""
+        store = StateStore(backend='memory')
+        store.put('ship:abc', {'deploy_id': 'abc', 'status': 'initiated'}, ttl=60)
+        
+        updated = store.update('ship:abc', {'status': 'promoted', 'promoted_by': '42'})
+        
+        expected = {'deploy_id': 'abc', 'status': 'promoted', 'promoted_by': '42'}
+        self.assertEqual(updated, expected)
+        self.assertEqual(store.get('ship:abc'), expected)
+    
+    def test_update_missing_key(self):
+        """Test update does not create missing keys."""
+        store = StateStore(backend='memory')
+        
+        self.assertIsNone(store.update('ship:missing', {'status': 'promoted'}))
+        self.assertIsNone(store.get('ship:missing'))
+    
+    def test_update_with_expected_is_check_and_set(self):
+        """Test update only applies when the stored fields still match."""
+        store = StateStore(backend='memory')
+        store.put('ship:abc', {'status': 'initiated'}, ttl=60)
+        
+        first = store.update('ship:abc', {'status': 'promoted'}, expected={'status': 'initiated'})
+        second = store.update('ship:abc', {'status': 'rolled_back'}, expected={'status': 'initiated'})
+        
+        self.assertEqual(first, {'status': 'promoted'})
+        self.assertIsNone(second)
+        self.assertEqual(store.get('ship:abc'), {'status': 'promoted'})
+    
+    def test_update_with_expected_raises_on_backend_error(self):
+        """Test check-and-set surfaces backend failures instead of returning None."""
+        store = self._make_redis_store()
+        store.backend.pipeline.side_effect = ConnectionError('redis down')
+        
+        with self.assertRaises(StateStoreError):
+            store.update('ship:abc', {'status': 'promoted'}, expected={'status': 'initiated'})
+        self.assertIsNone(store.update('ship:abc', {'status': 'promoted'}))
+    
+    def test_put_if_absent(self):
+        """Test put_if_absent only stores the first value."""
+        store = StateStore(backend='memory')
+        
+        self.assertTrue(store.put_if_absent('ship:abc:promote', 'interaction-1', ttl=60))
+        self.assertFalse(store.put_if_absent('ship:abc:promote', 'interaction-2', ttl=60))
+        self.assertEqual(store.get('ship:abc:promote'), 'interaction-1')
+    
+    def test_redis_put_if_absent_uses_set_nx(self):
+        """Test Redis put_if_absent is a single SET NX EX."""
+        store = self._make_redis_store()
+        store.backend.set.return_value = None
+        
+        self.assertFalse(store.put_if_absent('ship:abc:promote', 'interaction-1', ttl=60))
+        store.backend.set.assert_called_once_with('ship:abc:promote', '"interaction-1"', nx=True, ex=60)
+    
+    def _make_redis_store(self, **kwargs):
+        """Build a store wired to a mocked Redis client."""
+        store = StateStore(backend='memory', **kwargs)
+        store.backend = MagicMock()
+        store.backend_type = 'redis'
+        return store
+    
+    def test_redis_put_uses_setex(self):
+        """Test Redis puts rely on native TTL."""
+        store = self._make_redis_store()
+        
+        store.put('ship:abc', {'status': 'initiated'}, ttl=3600)
+        
+        store.backend.setex.assert_called_once()
+        key, ttl, serialized = store.backend.setex.call_args[0]
+        self.assertEqual((key, ttl), ('ship:abc', 3600))
+        self.assertEqual(json.loads(serialized), {'status': 'initiated'})
+    
+    def test_read_cache_absorbs_burst_reads(self):
+        """Test repeated reads of the same key hit Redis once."""
+        store = self._make_redis_store()
+        store.backend.get.return_value = '{"status": "initiated"}'
+        
+        for _ in range(3):
+            self.assertEqual(store.get('ship:abc'), {'status': 'initiated'})
+        
+        store.backend.get.assert_called_once_with('ship:abc')
+    
+    def test_read_cache_expires(self):
+        """Test cached reads fall through to Redis after the cache TTL."""
+        store = self._make_redis_store(read_cache_ttl=0.05)
+        store.backend.get.return_value = '{"status": "initiated"}'
+        
+        store.get('ship:abc')
+        time.sleep(0.1)
+        store.get('ship:abc')
+        
+        self.assertEqual(store.backend.get.call_count, 2)
+    
+    def test_read_cache_evicts_least_recently_used(self):
+        """Test read cache is bounded."""
+        store = self._make_redis_store(read_cache_size=2)
+        
+        store.put('a', 1)
+        store.put('b', 2)
+        store.put('c', 3)
+        
+        self.assertEqual(list(store._read_cache), ['b', 'c'])
+    
+    def test_delete_invalidates_read_cache(self):
+        """Test delete drops the cached value."""
+        store = self._make_redis_store()
+        store.put('ship:abc', {'status': 'initiated'})
+        store.backend.get.return_value = None
+        
+        store.delete('ship:abc')
+        
+        self.assertIsNone(store.get('ship:abc'))
+    
+    def test_fresh_read_bypasses_read_cache(self):
+        """Test fresh reads see writes made by other replicas."""
+        store = self._make_redis_store()
+        store.put('ship:abc', {'status': 'initiated'})
+        store.backend.get.return_value = '{"status": "promoted"}'
+        
+        self.assertEqual(store.get('ship:abc'), {'status': 'initiated'})
+        self.assertEqual(store.get('ship:abc', fresh=True), {'status': 'promoted'})
+        self.assertEqual(store.get('ship:abc'), {'status': 'promoted'})
+        store.backend.get.assert_called_once_with('ship:abc')
+    
+    def test_failed_compare_and_set_invalidates_read_cache(self):
+        """Test a lost put_if_absent race drops the locally cached value."""
+        store = self._make_redis_store()
+        store.put('ship:abc:promote', 'interaction-1')
+        store.backend.set.return_value = None
+        store.backend.get.return_value = '"interaction-2"'
+        
+        self.assertFalse(store.put_if_absent('ship:abc:promote', 'interaction-3', ttl=60))
+        self.assertEqual(store.get('ship:abc:promote'), 'interaction-2')
+    
     def test_auto_detect_backend_memory_fallback(self):
         """Test auto-detect falls back to memory."""
         store = StateStore(backend='auto')
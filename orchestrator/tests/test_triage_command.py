@@ -4,7 +4,7 @@ Tests for /triage Discord command handler.
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 import json
-from app.handlers.discord_handler import handle_triage_command, create_response
+from app.handlers.discord_handler import handle_triage_command, _triage_dispatch_worker, create_response
 
 
 class TestTriageCommand(unittest.TestCase):
@@ -51,21 +51,10 @@ class TestTriageCommand(unittest.TestCase):
         body = json.loads(response['body'])
         self.assertIn('Invalid PR number', body['data']['content'])
 
-    @patch('app.handlers.discord_handler.GitHubService')
-    @patch('app.handlers.discord_handler.GitHubActionsDispatcher')
+    @patch('app.handlers.discord_handler._run_deferred_task')
     @patch('app.handlers.discord_handler.StructuredLogger')
-    def test_triage_command_valid_pr(self, mock_logger_class, mock_dispatcher_class, mock_github_service_class):
+    def test_triage_command_valid_pr(self, mock_logger_class, mock_run_deferred):
         """Test triage command with valid PR number."""
-        # Setup mocks
-        mock_github_service = Mock()
-        mock_github_service_class.return_value = mock_github_service
-        
-        mock_dispatcher = Mock()
-        mock_dispatcher_class.return_value = mock_dispatcher
-        mock_dispatcher.trigger_workflow_dispatch.return_value = {
-            'success': True
-        }
-        
         mock_logger_instance = Mock()
         mock_logger_class.return_value = mock_logger_instance
         
@@ -84,62 +73,51 @@ class TestTriageCommand(unittest.TestCase):
         self.assertIn('Analyzing failure', body['data']['content'])
         self.assertIn('#58', body['data']['content'])
         self.assertIn('testuser', body['data']['content'])
+        self.assertIn('Triage workflow queued', body['data']['content'])
+        
+        # Verify workflow dispatch was handed off instead of run inline
+        task_name, payload = mock_run_deferred.call_args[0]
+        self.assertEqual(task_name, 'triage_dispatch')
+        self.assertEqual(payload['pr_number'], 58)
+
+    @patch('app.handlers.discord_handler._post_followup_message')
+    @patch('app.handlers.discord_handler._get_dispatcher')
+    @patch('app.handlers.discord_handler.StructuredLogger')
+    def test_triage_dispatch_worker_triggers_workflow(self, mock_logger_class, mock_get_dispatcher, mock_post):
+        """Test the deferred worker triggers the triage workflow with safe defaults."""
+        mock_dispatcher = mock_get_dispatcher.return_value
+        mock_dispatcher.trigger_phase5_triage.return_value = {
+            'success': True
+        }
+        
+        _triage_dispatch_worker({'token': 'tok'}, 58, 'trace-id')
         
-        # Verify workflow was triggered
-        mock_dispatcher.trigger_phase5_triage.assert_called_once()
         call_args = mock_dispatcher.trigger_phase5_triage.call_args
         self.assertEqual(call_args[1]['failure_ref'], '58')
         self.assertEqual(call_args[1]['allow_auto_fix'], 'false')
+        mock_post.assert_not_called()
 
-    @patch('app.handlers.discord_handler.GitHubService')
-    @patch('app.handlers.discord_handler.GitHubActionsDispatcher')
+    @patch('app.handlers.discord_handler._post_followup_message')
+    @patch('app.handlers.discord_handler._get_dispatcher')
     @patch('app.handlers.discord_handler.StructuredLogger')
-    def test_triage_command_workflow_trigger_failure(self, mock_logger_class, mock_dispatcher_class, mock_github_service_class):
-        """Test triage command when workflow trigger fails."""
-        # Setup mocks
-        mock_github_service = Mock()
-        mock_github_service_class.return_value = mock_github_service
-        
-        mock_dispatcher = Mock()
-        mock_dispatcher_class.return_value = mock_dispatcher
+    def test_triage_command_workflow_trigger_failure(self, mock_logger_class, mock_get_dispatcher, mock_post):
+        """Test a failed workflow trigger is reported as a follow-up."""
+        mock_dispatcher = mock_get_dispatcher.return_value
         mock_dispatcher.trigger_phase5_triage.return_value = {
             'success': False,
             'message': 'Workflow not found'
         }
         
-        mock_logger_instance = Mock()
-        mock_logger_class.return_value = mock_logger_instance
+        _triage_dispatch_worker({'token': 'tok'}, 58, 'trace-id')
         
-        # Create interaction with valid PR
-        interaction = self.base_interaction.copy()
-        interaction['data']['options'] = [
-            {'name': 'pr', 'value': 58}
-        ]
-        
-        response = handle_triage_command(interaction)
-        
-        # Verify response still successful but with warning
-        self.assertEqual(response['statusCode'], 200)
-        body = json.loads(response['body'])
-        self.assertIn('TriageAgent', body['data']['content'])
-        self.assertIn('Analyzing failure', body['data']['content'])
-        self.assertIn('Note: Workflow trigger encountered an issue', body['data']['content'])
+        content = mock_post.call_args[0][1]
+        self.assertIn('Note: Workflow trigger encountered an issue', content)
+        self.assertIn('Workflow not found', content)
 
-    @patch('app.handlers.discord_handler.GitHubService')
-    @patch('app.handlers.discord_handler.GitHubActionsDispatcher')
+    @patch('app.handlers.discord_handler._run_deferred_task')
     @patch('app.handlers.discord_handler.StructuredLogger')
-    def test_triage_command_with_workflow_run_id(self, mock_logger_class, mock_dispatcher_class, mock_github_service_class):
+    def test_triage_command_with_workflow_run_id(self, mock_logger_class, mock_run_deferred):
         """Test triage command with workflow run ID (large number)."""
-        # Setup mocks
-        mock_github_service = Mock()
-        mock_github_service_class.return_value = mock_github_service
-        
-        mock_dispatcher = Mock()
-        mock_dispatcher_class.return_value = mock_dispatcher
-        mock_dispatcher.trigger_phase5_triage.return_value = {
-            'success': True
-        }
-        
         mock_logger_instance = Mock()
         mock_logger_class.return_value = mock_logger_instance
         
@@ -22,7 +22,7 @@ class TestUXButtonInteractions(unittest.TestCase):
         self.env_patcher.stop()
 
     @patch('agents.ux_agent.UXAgent')
-    @patch('services.github.GitHubService')
+    @patch('app.handlers.discord_handler._get_github_service')
     def test_handle_ux_update_command_adds_buttons_to_confirmation(self, mock_github_service, mock_ux_agent_class):
         """Test that confirmation preview includes Discord buttons."""
         from app.handlers.discord_handler import handle_ux_update_command
@@ -84,7 +84,7 @@ class TestUXButtonInteractions(unittest.TestCase):
         self.assertTrue(cancel_button['custom_id'].startswith('ux_cancel_'))
 
     @patch('agents.ux_agent.UXAgent')
-    @patch('services.github.GitHubService')
+    @patch('app.handlers.discord_handler._get_github_service')
     def test_handle_ux_button_interaction_confirm(self, mock_github_service, mock_ux_agent_class):
         """Test handling confirm button click."""
         from app.handlers.discord_handler import handle_ux_button_interaction
@@ -129,7 +129,7 @@ class TestUXButtonInteractions(unittest.TestCase):
         )
 
     @patch('agents.ux_agent.UXAgent')
-    @patch('services.github.GitHubService')
+    @patch('app.handlers.discord_handler._get_github_service')
     def test_handle_ux_button_interaction_cancel(self, mock_github_service, mock_ux_agent_class):
         """Test handling cancel button click."""
         from app.handlers.discord_handler import handle_ux_button_interaction
@@ -175,7 +175,7 @@ class TestUXButtonInteractions(unittest.TestCase):
         )
 
     @patch('agents.ux_agent.UXAgent')
-    @patch('services.github.GitHubService')
+    @patch('app.handlers.discord_handler._get_github_service')
     def test_handle_ux_button_interaction_invalid_custom_id(self, mock_github_service, mock_ux_agent_class):
         """Test handling invalid custom_id format."""
         from app.handlers.discord_handler import handle_ux_button_interaction
@@ -198,7 +198,7 @@ class TestUXButtonInteractions(unittest.TestCase):
         self.assertEqual(body['data']['flags'], 64)  # Ephemeral
 
     @patch('agents.ux_agent.UXAgent')
-    @patch('services.github.GitHubService')
+    @patch('app.handlers.discord_handler._get_github_service')
     def test_handle_ux_button_interaction_conversation_not_found(self, mock_github_service, mock_ux_agent_class):
         """Test handling button click for expired/missing conversation."""
         from app.handlers.discord_handler import handle_ux_button_interaction
@@ -269,7 +269,7 @@ class TestUXButtonInteractions(unittest.TestCase):
         from app.handlers.discord_handler import handle_ux_update_command
         
         with patch('agents.ux_agent.UXAgent') as mock_ux_agent_class:
-            with patch('services.github.GitHubService'):
+            with patch('app.handlers.discord_handler._get_github_service'):
                 mock_agent = Mock()
                 mock_ux_agent_class.return_value = mock_agent
                 